@@ -4,7 +4,7 @@ from django.db import models
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 from achievement.models.base import AchievementType, BadgeRarity, badge_image_upload_path
 from module.models import Module
 
@@ -1,7 +1,7 @@
 # achievement/models.py
 from django.db import models
 from django.conf import settings
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 from django.utils.text import slugify
 from django.utils import timezone
 from django.contrib.contenttypes.fields import GenericForeignKey
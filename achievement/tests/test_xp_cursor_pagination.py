@@ -0,0 +1,91 @@
+# achievement/tests/test_xp_cursor_pagination.py
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from achievement.models import XPEvent
+
+User = get_user_model()
+
+
+@pytest.fixture
+def staff_user(db):
+    return User.objects.create_user(
+        email="staff@example.com", password="pass1234",
+        first_name="Staff", last_name="User", role="LECTURER", is_staff=True,
+    )
+
+
+@pytest.fixture
+def xp_events(staff_user):
+    # Several rows share a timestamp so the pk tie-breaker is exercised.
+    base = timezone.now()
+    return [
+        XPEvent.objects.create(
+            user=staff_user, action=f"Action {i}", xp=i,
+            timestamp=base - timedelta(minutes=i // 3),
+        )
+        for i in range(12)
+    ]
+
+
+def _url(user):
+    return f"/api/achievement/users/{user.pk}/xp-events/"
+
+
+@pytest.mark.django_db
+def test_xp_events_use_cursor_pages_without_count(staff_user, xp_events):
+    client = APIClient()
+    client.force_authenticate(user=staff_user)
+
+    response = client.get(_url(staff_user), {"page_size": 5})
+
+    assert response.status_code == 200
+    assert "count" not in response.data
+    assert response.data["previous"] is None
+    assert "cursor=" in response.data["next"]
+    assert len(response.data["results"]) == 5
+
+
+@pytest.mark.django_db
+def test_cursor_walk_is_stable_and_complete(staff_user, xp_events):
+    client = APIClient()
+    client.force_authenticate(user=staff_user)
+
+    seen = []
+    url, params = _url(staff_user), {"page_size": 5}
+    while url:
+        response = client.get(url, params)
+        assert response.status_code == 200
+        seen.extend(row["id"] for row in response.data["results"])
+        url, params = response.data["next"], None
+
+    expected = [
+        e.pk for e in sorted(xp_events, key=lambda e: (e.timestamp, e.pk), reverse=True)
+    ]
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_nullable_ordering_param_falls_back_to_default_key(staff_user, xp_events):
+    from types import SimpleNamespace
+    from rest_framework import filters
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+    from common.pagination import TimestampCursorPagination
+
+    view = SimpleNamespace(
+        filter_backends=[filters.OrderingFilter],
+        ordering_fields=["badge", "xp"],
+        ordering=["-timestamp"],
+    )
+    paginator = TimestampCursorPagination()
+
+    nullable = Request(APIRequestFactory().get("/", {"ordering": "badge"}))
+    assert paginator.get_ordering(nullable, XPEvent.objects.all(), view) == ("-timestamp", "-id")
+
+    keyable = Request(APIRequestFactory().get("/", {"ordering": "xp"}))
+    assert paginator.get_ordering(keyable, XPEvent.objects.all(), view) == ("xp", "pk")
@@ -2,6 +2,7 @@
 
 from rest_framework import viewsets, permissions, filters
 from rest_framework.exceptions import PermissionDenied
+from common.pagination import TimestampCursorPagination
 from achievement.models import XPEvent
 from achievement.serializers.xp import XPEventSerializer, XPEventCreateSerializer
 from achievement.views.base import DynamicSerializerMixin, OwnedByUserQuerySetMixin, UserScopedQuerySetMixin
@@ -27,6 +28,7 @@ class XPEventViewSet(
     ordering_fields = ['timestamp', 'xp']
     search_fields = ['action', 'user__email', 'badge__name']
     ordering = ['-timestamp']
+    pagination_class = TimestampCursorPagination
 
     def perform_create(self, serializer):
         if not self.request.user.is_staff:
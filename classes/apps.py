@@ -1,7 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ClassesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'classes'
     verbose_name = 'Lessons and Classes'
+
+    def ready(self):
+        # Import signals to ensure they are registered
+        import classes.signals
+        # Re-create SQLite full-text triggers dropped by table rebuilds
+        from common.search_index import ensure_search_indexes
+        post_migrate.connect(ensure_search_indexes, sender=self)
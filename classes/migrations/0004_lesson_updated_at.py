@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 02:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classes', '0003_lesson_video_provider_lesson_video_provider_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lesson',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
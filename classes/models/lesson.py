@@ -1,7 +1,7 @@
 # classes/models/lesson.py
 from django.db import models
 from django.conf import settings
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 from .base import SoftDeleteModelMixin
 from .enums import LessonAudience, MaterialAudience
 from module.models import Module
@@ -22,6 +22,9 @@ class Lesson(SlugModelMixin, SoftDeleteModelMixin, models.Model):
         ("CLOUDFLARE", "Cloudflare Stream"),
     )
 
+    # Weighted full-text document (common.search_index; built by migration 0005)
+    search_vector_fields = (('title', 'A'), ('description', 'C'))
+
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -60,6 +63,7 @@ class Lesson(SlugModelMixin, SoftDeleteModelMixin, models.Model):
     allow_ratings = models.BooleanField(default=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def is_video_ready(self) -> bool:
         return self.video_provider == "CLOUDFLARE" and self.video_status == "READY"
@@ -3,7 +3,7 @@ from django.db import models
 from django.conf import settings
 from module.models import Module
 from program.models import ProgramLevel, Session
-from common.mixins import SlugModelMixin, SoftDeleteModelMixin
+from common.models import SlugModelMixin, SoftDeleteModelMixin
 
 
 class LessonAudience(models.TextChoices):
@@ -1,7 +1,7 @@
 # classes/serializers/lesson.py
 
 from rest_framework import serializers
-from django.db.models import Avg
+from django.db.models import Avg, FloatField
 from classes.models import Lesson, LessonMaterial
 from classes.models.enums import LessonAudience, MaterialAudience
 from core.serializers import UserSerializer  # Adjust if you're using a different user display
@@ -9,6 +9,8 @@ from program.models import ProgramLevel, Session
 from module.models import Module
 from classes.serializers.fields import DisplayChoiceField, UserSafeField, TimeSinceField
 from achievement.serializers.base import ChoiceDisplayField
+from common.search import SearchHitFieldsMixin
+from common.serializers import SparseFieldsetsMixin, related_aggregate
 
 # --- LessonMaterial Serializer ---
 class LessonMaterialSerializer(serializers.ModelSerializer):
@@ -29,9 +31,13 @@ class LessonMaterialSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'lesson', 'title', 'material_type', 'material_type_display',
             'file', 'url','version', 'audience', 'audience_display',
-            'is_active', 'uploaded_by', 'uploaded_by_id', 'created_at'
+            'is_active', 'uploaded_by', 'uploaded_by_id', 'created_at',
+            'download_url', 'time_since',
         ]
         read_only_fields = ['id', 'created_at', 'download_url', 'uploaded_by']
+
+    # Inputs for the .values() list path (common.serializers.values)
+    values_fields = {'download_url': ('file', 'url')}
     
     def validate(self, attrs):
         file = attrs.get('file') or getattr(self.instance, 'file', None)
@@ -45,7 +51,7 @@ class LessonMaterialSerializer(serializers.ModelSerializer):
 
 
 # --- Lesson Display Serializer (for detail/list views) ---
-class LessonSerializer(serializers.ModelSerializer):
+class LessonSerializer(SparseFieldsetsMixin, SearchHitFieldsMixin, serializers.ModelSerializer):
     # Foreign key titles for frontend
     program_level_title = serializers.CharField(source='program_level.title', read_only=True)
     module_title = serializers.CharField(source='module.title', read_only=True)
@@ -77,7 +83,29 @@ class LessonSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['slug', 'created_at', 'comments_count', 'average_rating']
 
+    # ?fields= / ?expand= support (see common.serializers.SparseFieldsetsMixin)
+    expandable_fields = ('materials',)
+    field_select_related = {
+        'program_level_title': ('program_level',),
+        'module_title': ('module',),
+        'session_title': ('session',),
+    }
+    field_prefetch_related = {
+        'materials': ('materials__uploaded_by',),
+        'comments_count': ('comments',),
+        'average_rating': ('ratings',),
+    }
+    # Inputs for the .values() list path (common.serializers.values)
+    values_fields = {
+        'average_rating': {'annotated_average_rating': related_aggregate(Lesson, 'ratings', Avg('score'), FloatField())},
+    }
+
     def get_average_rating(self, obj):
+        if hasattr(obj, 'annotated_average_rating'):
+            return obj.annotated_average_rating or 0
+        if 'ratings' in getattr(obj, '_prefetched_objects_cache', {}):
+            scores = [rating.score for rating in obj.ratings.all()]
+            return sum(scores) / len(scores) if scores else 0
         return obj.ratings.aggregate(avg=Avg('score'))['avg'] or 0
 
 
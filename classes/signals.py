@@ -0,0 +1,15 @@
+# classes/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from common.catalog import invalidate_catalog
+from .models import Lesson, LessonComment, LessonMaterial, LessonRating
+
+
+# LessonMaterial is rendered inside LessonSerializer, which also reports
+# comments_count and average_rating.
+@receiver([post_save, post_delete], sender=Lesson)
+@receiver([post_save, post_delete], sender=LessonMaterial)
+@receiver([post_save, post_delete], sender=LessonComment)
+@receiver([post_save, post_delete], sender=LessonRating)
+def bump_catalog_on_lesson_change(sender, **kwargs):
+    invalidate_catalog()
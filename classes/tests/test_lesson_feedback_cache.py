@@ -0,0 +1,31 @@
+# classes/tests/test_lesson_feedback_cache.py
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from classes.models import Lesson, LessonComment, LessonRating
+from core.models import User
+
+LESSONS = "/api/classes/lessons/"
+
+
+@pytest.mark.django_db
+def test_new_comments_and_ratings_invalidate_cached_lessons(django_capture_on_commit_callbacks):
+    lesson = baker.make(Lesson, title="Loops")
+    client = APIClient()
+    client.force_authenticate(baker.make(User, is_staff=True, is_active=True, role=User.Roles.ADMIN))
+
+    first = client.get(LESSONS)
+    assert first.json()["results"][0]["comments_count"] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        baker.make(LessonComment, lesson=lesson)
+        baker.make(LessonRating, lesson=lesson, score=4)
+
+    assert client.get(LESSONS, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
+    row = client.get(LESSONS).json()["results"][0]
+    assert (row["comments_count"], row["average_rating"]) == (1, 4)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        LessonRating.objects.get().delete()
+    assert client.get(LESSONS).json()["results"][0]["average_rating"] == 0
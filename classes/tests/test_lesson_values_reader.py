@@ -0,0 +1,113 @@
+# classes/tests/test_lesson_values_reader.py
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import serializers
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from classes.models import Lesson, LessonComment, LessonMaterial, LessonRating
+from classes.serializers.lesson import LessonSerializer
+from classes.views.lesson import LessonViewSet
+from common.serializers import NotCompilable, compile_values_reader
+from core.models import User
+from module.models import Module
+
+LESSONS = "/api/classes/lessons/"
+
+
+@pytest.fixture
+def staff():
+    return baker.make(User, is_staff=True, is_superuser=True, is_active=True, role=User.Roles.ADMIN)
+
+
+@pytest.fixture
+def lessons(staff, tmp_path):
+    module = baker.make(Module, title="Python Basics")
+    with_module = baker.make(Lesson, title="Loops", module=module, _fill_optional=["duration_minutes"])
+    bare = baker.make(Lesson, title="Intro", module=None, program_level=None, session=None)
+    for score in (3, 4, 4):
+        baker.make(LessonRating, lesson=with_module, score=score)
+    baker.make(LessonComment, lesson=with_module, _quantity=2)
+    with override_settings(MEDIA_ROOT=str(tmp_path)):
+        baker.make(LessonMaterial, lesson=with_module, uploaded_by=staff, url="",
+                   file=SimpleUploadedFile("notes.pdf", b"%PDF"))
+    baker.make(LessonMaterial, lesson=with_module, uploaded_by=None, url="https://example.com/slides")
+    return [with_module, bare]
+
+
+def _regular_list(client, url, monkeypatch):
+    monkeypatch.setattr(LessonViewSet, "values_list_enabled", False)
+    cache.clear()
+    response = client.get(url)
+    monkeypatch.setattr(LessonViewSet, "values_list_enabled", True)
+    cache.clear()
+    return response
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query, count", [
+    ("", 2), ("?fields=id,title,module_title,average_rating", 2), ("?expand=materials", 2), ("?search=loops", 1),
+])
+def test_values_list_matches_serializer_output(staff, lessons, monkeypatch, query, count):
+    client = APIClient()
+    client.force_authenticate(staff)
+
+    regular = _regular_list(client, LESSONS + query, monkeypatch)
+    fast = client.get(LESSONS + query)
+
+    assert regular.status_code == fast.status_code == 200
+    assert fast.json() == regular.json()
+    assert fast.json()["count"] == count
+    if "search" in query:
+        assert fast.json()["results"][0]["search_rank"] > 0
+
+
+@pytest.mark.django_db
+def test_values_list_query_count_is_flat(staff, lessons):
+    client = APIClient()
+    client.force_authenticate(staff)
+    counts = []
+    for _ in range(2):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            assert client.get(LESSONS).status_code == 200
+        counts.append(len(ctx))
+        lesson = baker.make(Lesson, module=baker.make(Module))
+        baker.make(LessonMaterial, lesson=lesson, url="https://example.com", _quantity=3)
+
+    assert counts[0] == counts[1]
+
+
+def test_unsupported_fields_are_not_compiled():
+    class StrSerializer(serializers.ModelSerializer):
+        module = serializers.StringRelatedField()
+
+        class Meta:
+            model = Lesson
+            fields = ["id", "module"]
+
+    request = Request(APIRequestFactory().get("/"))
+    with pytest.raises(NotCompilable):
+        compile_values_reader(StrSerializer(context={"request": request}))
+    assert compile_values_reader(LessonSerializer(context={"request": request}))
+
+
+@pytest.mark.django_db
+def test_values_list_aggregates_do_not_join_related_rows(staff, lessons):
+    client = APIClient()
+    client.force_authenticate(staff)
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(LESSONS)
+
+    assert response.status_code == 200
+    page = next(q["sql"] for q in ctx.captured_queries if "annotated_average_rating" in q["sql"])
+    assert 'JOIN "classes_lessoncomment"' not in page
+    assert 'JOIN "classes_lessonrating"' not in page
+    loops = next(r for r in response.json()["results"] if r["title"] == "Loops")
+    assert loops["comments_count"] == 2
+    assert loops["average_rating"] == pytest.approx(11 / 3, abs=0.01)
@@ -6,6 +6,7 @@ from django.utils.timezone import now
 from rest_framework.response import Response
 from rest_framework import status
 
+from common.pagination import TimestampCursorPagination
 from classes.models import LessonAttendance
 from classes.serializers.attendance import LessonAttendanceSerializer
 from .base import (
@@ -35,6 +36,7 @@ class LessonAttendanceViewSet(
     search_fields = ['lesson__title', 'user__email']
     ordering_fields = ['timestamp']
     ordering = ['-timestamp']
+    pagination_class = TimestampCursorPagination
 
     @action(detail=True, methods=["patch"], url_path="track-progress")
     def track_progress(self, request, pk=None):
@@ -1,4 +1,5 @@
 # classes/views/feedback.py
+from django.db.models import Prefetch
 from rest_framework import viewsets, permissions, filters
 from rest_framework.exceptions import PermissionDenied
 
@@ -14,6 +15,18 @@ from .base import (
     FilteredLessonQuerysetMixin
 )
 
+# Reply levels preloaded for LessonCommentSerializer's recursive `replies`;
+# threads deeper than this fall back to one query per extra level.
+REPLY_PREFETCH_DEPTH = 3
+
+
+def _reply_prefetches(depth=REPLY_PREFETCH_DEPTH):
+    lookups, path = [], 'replies'
+    for _ in range(depth):
+        lookups.append(Prefetch(path, queryset=LessonComment.objects.select_related('user')))
+        path += '__replies'
+    return lookups
+
 
 class LessonCommentViewSet(SoftDeleteMixin, viewsets.ModelViewSet):
     """
@@ -22,7 +35,7 @@ class LessonCommentViewSet(SoftDeleteMixin, viewsets.ModelViewSet):
     - POST with {lesson, parent, content} to reply to any comment.
     - GET lists comments; use ?lesson=<id|slug> to filter.
     """
-    queryset = LessonComment.objects.select_related('user', 'lesson').prefetch_related('replies')
+    queryset = LessonComment.objects.select_related('user', 'lesson').prefetch_related(*_reply_prefetches())
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter]
     ordering = ['created_at']
@@ -1,6 +1,5 @@
 # classes/views/lesson.py
 
-import boto3
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseRedirect
 from rest_framework.decorators import action
@@ -20,30 +19,37 @@ from .base import (
     DynamicSerializerMixin,
     FilteredLessonQuerysetMixin
 )
+from common.catalog import CatalogCacheMixin
+from common.mixins import SparseFieldsetsQuerysetMixin, ConditionalGetMixin, ValuesListMixin
+from common.search import FullTextSearchFilter, SearchRankOrderingFilter
 from common.permissions import IsAdminOnlyOrReadOnly, IsAdminOrLecturerOrReadOnly, IsLecturerOrVolunteerOrReadOnly  # assumes custom perms
 
 
 class LessonViewSet(
+    ConditionalGetMixin,
+    CatalogCacheMixin,
+    SparseFieldsetsQuerysetMixin,
     SoftDeleteMixin,
     DynamicSerializerMixin,
     FilteredLessonQuerysetMixin,
+    ValuesListMixin,
     viewsets.ModelViewSet
 ):
     """
     Lesson CRUD – staff can create/edit, students can view.
     """
-    queryset = Lesson.objects.filter(is_active=True).select_related(
-        'program_level', 'module', 'session'
-    ).prefetch_related('materials', 'comments', 'ratings')
+    # Related lookups come from LessonSerializer.field_select_related / field_prefetch_related
+    queryset = Lesson.objects.filter(is_active=True)
     permission_classes = [IsAdminOrLecturerOrReadOnly, IsLecturerOrVolunteerOrReadOnly]
     parser_classes = [MultiPartParser, FormParser, JSONParser]  # <-- allow file + JSON
     serializer_class = LessonSerializer
     write_serializer_class = LessonCreateUpdateSerializer
     lookup_field = 'slug'
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [FullTextSearchFilter, SearchRankOrderingFilter]
     search_fields = ['title', 'description']
     ordering_fields = ['date', 'created_at', 'title']
     ordering = ['-date']
+    etag_uses_catalog_version = True
 
 
 class LessonMaterialViewSet(
@@ -105,6 +111,8 @@ class LessonMaterialViewSet(
 
         # S3 backend
         if settings.STORAGE_BACKEND == "s3":
+            import boto3  # heavy (~150ms); only needed on the S3 download path
+
             s3_client = boto3.client(
                 's3',
                 region_name=getattr(settings, "AWS_S3_REGION_NAME", None),
@@ -150,7 +158,7 @@ class LessonMaterialViewSet(
             if lesson.session and hasattr(lesson.session, 'director'):
                 if user == lesson.session.director:
                     pass
-                elif lesson.module.modulelecturer_set.filter(lecturer=user).exists():
+                elif lesson.module.lecturers.filter(lecturer=user).exists():
                     pass
                 else:
                     raise PermissionDenied("You do not have permission to upload materials for this lesson.")
@@ -29,7 +29,7 @@ class LessonQuizViewSet(DynamicSerializerMixin, viewsets.ModelViewSet):
     - Students: list available quizzes (GET)
     - Admins/Lecturers: can create/edit (POST/PUT/DELETE)
     """
-    queryset = LessonQuiz.objects.select_related('lesson')
+    queryset = LessonQuiz.objects.select_related('lesson').prefetch_related('questions')
     serializer_class = LessonQuizSerializer
     write_serializer_class = LessonQuizCreateUpdateSerializer
     permission_classes = [IsAdminOrLecturerOrReadOnly, IsLecturerOrVolunteerOrReadOnly]
@@ -66,8 +66,8 @@ class LessonQuizResultViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         user = self.request.user
         if user.is_staff:
-            return LessonQuizResult.objects.all().select_related('quiz', 'user').prefetch_related('answers')
-        return LessonQuizResult.objects.filter(user=user).select_related('quiz').prefetch_related('answers')
+            return LessonQuizResult.objects.all().select_related('quiz', 'user').prefetch_related('answers__question', 'quiz__questions')
+        return LessonQuizResult.objects.filter(user=user).select_related('quiz').prefetch_related('answers__question', 'quiz__questions')
 
 
     @action(detail=True, methods=['post'], url_path='submit', url_name='submit')
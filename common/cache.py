@@ -0,0 +1,179 @@
+# common/cache.py
+"""
+Shared cache layer on top of Django's cache framework (Redis when REDIS_URL
+is set, see CACHES in settings).
+
+Each feature gets a `CacheNamespace`. Keys embed a namespace version (and,
+optionally, a per-scope version such as a user id); bumping the version
+invalidates everything under it at once, and old entries simply expire.
+
+    catalog = CacheNamespace('catalog', timeout=900)
+    data = catalog.get_or_set(('programs', url), build_payload)
+    catalog.invalidate()            # after a write, on commit
+
+`get_or_set` adds jittered TTLs (so entries written together don't expire
+together), single-flight recompute (one worker fills a missing key while the
+others wait for it) and Prometheus metrics per namespace. Cache backend
+errors are counted and fall through to computing the value, so an
+unreachable Redis degrades to uncached reads rather than 500s; a failed
+version bump is logged and never fails the write that triggered it.
+
+Values that get stored are computed on the primary database
+(common.db_router.use_primary): a lagging replica would otherwise cache
+pre-write data under the version the write just bumped.
+"""
+import hashlib
+import logging
+import random
+import time
+
+from django.core.cache import caches
+from django.db import transaction
+
+from common.db_router import use_primary
+from common.metrics import cache_compute_seconds, cache_lookup_seconds, cache_requests
+
+logger = logging.getLogger(__name__)
+
+LOCK_TIMEOUT = 10      # seconds one worker may hold a recompute lock
+WAIT_INTERVAL = 0.05   # polling step while another worker recomputes
+
+_MISSING = object()
+
+
+def _seed_version():
+    # Seed from the clock so an evicted counter never restarts at a version
+    # that still has live entries.
+    return int(time.time())
+
+
+class CacheNamespace:
+    def __init__(self, name, timeout=300, jitter=0.1, alias='default'):
+        self.name = name
+        self.timeout = timeout
+        self.jitter = jitter
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    # ----- versions -----
+    def _version_key(self, scope=None):
+        return f'{self.name}:{scope}:version' if scope is not None else f'{self.name}:version'
+
+    def version(self, scope=None):
+        key = self._version_key(scope)
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, _seed_version(), timeout=None)
+            version = self.cache.get(key) or _seed_version()
+        return version
+
+    def bump(self, scope=None):
+        """
+        Move to a new version; returns it, or None if the cache is unreachable
+        (writes must not fail on the cache; entries then age out via their TTL).
+        """
+        key = self._version_key(scope)
+        try:
+            try:
+                return self.cache.incr(key)
+            except ValueError:
+                # Counter was evicted; start again from a fresh, larger seed.
+                version = _seed_version() + 1
+                self.cache.set(key, version, timeout=None)
+                return version
+        except Exception:
+            logger.warning(f"Could not bump cache version for namespace '{self.name}'", exc_info=True)
+            return None
+
+    def invalidate(self, scope=None):
+        """
+        Bump the version once the current transaction commits, so no reader
+        can re-cache pre-commit data under the new version.
+        """
+        transaction.on_commit(lambda: self.bump(scope))
+
+    # ----- keys and values -----
+    def make_key(self, *parts, scope=None):
+        digest = hashlib.md5('|'.join(str(p) for p in parts).encode()).hexdigest()
+        prefix = f'{self.name}:{scope}' if scope is not None else self.name
+        return f'{prefix}:v{self.version(scope)}:{digest}'
+
+    def ttl(self, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        if not timeout or not self.jitter:
+            return timeout
+        return max(1, int(timeout * random.uniform(1 - self.jitter, 1 + self.jitter)))
+
+    def _get(self, key):
+        started = time.perf_counter()
+        try:
+            return self.cache.get(key, _MISSING)
+        finally:
+            cache_lookup_seconds.labels(namespace=self.name).observe(time.perf_counter() - started)
+
+    def _compute(self, compute):
+        started = time.perf_counter()
+        try:
+            return compute()
+        finally:
+            cache_compute_seconds.labels(namespace=self.name).observe(time.perf_counter() - started)
+
+    def _count(self, label, result):
+        cache_requests.labels(namespace=self.name, key=label or self.name, result=result).inc()
+
+    def _uncached(self, label, compute):
+        logger.warning(f"Cache unavailable for namespace '{self.name}'", exc_info=True)
+        self._count(label, 'error')
+        return compute()
+
+    def _quietly(self, operation, *args, **kwargs):
+        # Storing / unlocking is best effort: the value is already computed.
+        try:
+            operation(*args, **kwargs)
+        except Exception:
+            logger.warning(f"Cache write failed for namespace '{self.name}'", exc_info=True)
+
+    def get_or_set(self, parts, compute, timeout=None, scope=None, label=None):
+        """
+        Return the cached value for `parts`, computing and storing it on a miss.
+        `label` names the logical key in metrics (defaults to the namespace).
+        """
+        try:
+            key = self.make_key(*parts, scope=scope)
+            value = self._get(key)
+            lock_key = f'{key}:lock'
+            locked = value is _MISSING and self.cache.add(lock_key, 1, timeout=LOCK_TIMEOUT)
+        except Exception:
+            return self._uncached(label, compute)
+
+        if value is not _MISSING:
+            self._count(label, 'hit')
+            return value
+
+        if locked:
+            try:
+                with use_primary():
+                    value = self._compute(compute)
+                self._quietly(self.cache.set, key, value, timeout=self.ttl(timeout))
+            finally:
+                self._quietly(self.cache.delete, lock_key)
+            self._count(label, 'miss')
+            return value
+
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(WAIT_INTERVAL)
+            try:
+                value = self.cache.get(key, _MISSING)
+            except Exception:
+                return self._uncached(label, compute)
+            if value is not _MISSING:
+                self._count(label, 'coalesced')
+                return value
+
+        # The lock holder died or is very slow; serve fresh data uncached.
+        self._count(label, 'miss')
+        return self._compute(compute)
@@ -0,0 +1,90 @@
+# common/catalog.py
+"""
+Versioned read cache for the public catalog (programs, modules, lessons).
+
+Every cache key embeds the current catalog version. Saving or deleting any
+catalog model bumps that version (see the post_save/post_delete receivers in
+program/module/classes signals), so stale entries are never read again and
+simply age out via their TTL - no key scanning or pattern deletes needed.
+"""
+from django.conf import settings
+
+from common.cache import CacheNamespace
+
+catalog_cache = CacheNamespace('catalog', timeout=settings.CATALOG_CACHE_TIMEOUT)
+
+
+def get_catalog_version():
+    return catalog_cache.version()
+
+
+def bump_catalog_version():
+    return catalog_cache.bump()
+
+
+def invalidate_catalog():
+    """
+    Bump the catalog version once the current transaction commits, so no
+    reader can re-cache pre-commit data under the new version.
+    """
+    catalog_cache.invalidate()
+
+
+def catalog_key(name, *parts):
+    return catalog_cache.make_key(name, *parts)
+
+
+def get_or_compute(name, parts, compute, timeout=None):
+    """
+    Return the cached value for (name, parts) under the current catalog
+    version, computing it with `compute()` on a miss (single-flight, see
+    common.cache.CacheNamespace.get_or_set). `name` is the metrics label.
+    """
+    return catalog_cache.get_or_set((name, *parts), compute, timeout=timeout, label=name)
+
+
+def audience_bucket(user):
+    """
+    Coarse visibility class used to partition cached catalog responses
+    (mirrors common.mixins.filter_lessons_by_audience).
+    """
+    if user is None or not user.is_authenticated:
+        return 'public'
+    if user.is_staff:
+        return 'staff'
+    if getattr(user, 'is_enrolled', False):
+        return 'enrolled'
+    return 'public'
+
+
+class CatalogCacheMixin:
+    """
+    Serve `list` / `retrieve` from the versioned catalog cache.
+
+    The key covers the viewset, action, full URL (filters, ordering, paging,
+    ?fields=) and the caller's audience bucket. Permission checks still run
+    in `initial()` before these methods, so caching never bypasses auth.
+    """
+    catalog_cache_name = None
+
+    def get_catalog_cache_name(self):
+        return self.catalog_cache_name or type(self).__name__
+
+    def _catalog_cached(self, action, handler, request, *args, **kwargs):
+        # Not at module level: app signal modules import this file during
+        # django.setup(), and DRF's import chain would load with them
+        from rest_framework.response import Response
+
+        name = self.get_catalog_cache_name()
+        parts = (action, request.build_absolute_uri(), audience_bucket(request.user))
+        data = get_or_compute(
+            f'{name}.{action}', parts,
+            lambda: handler(request, *args, **kwargs).data,
+        )
+        return Response(data)
+
+    def list(self, request, *args, **kwargs):
+        return self._catalog_cached('list', super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._catalog_cached('retrieve', super().retrieve, request, *args, **kwargs)
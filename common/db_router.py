@@ -0,0 +1,135 @@
+# common/db_router.py
+"""
+Read-replica routing with read-your-writes stickiness.
+
+When DATABASES has a REPLICA_DATABASE_ALIAS entry, reads made inside
+`use_replica()` go to it; everything else (and every write) goes to the
+primary. ReplicaRoutingMiddleware enters `use_replica()` for safe-method
+requests, and the Celery signal handlers in config/celery.py do the same for
+the tasks listed in DATABASE_REPLICA_TASKS.
+
+Replicas lag, so a client that just wrote is pinned to the primary for
+REPLICA_STICKY_SECONDS: the middleware sets a cookie for browsers and a cache
+marker keyed by user id for JWT clients. Any write routed while on the
+replica also switches the rest of that request or task back to the primary.
+Values stored by common.cache are always computed on the primary.
+"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from common.metrics import db_routing_decisions
+
+logger = logging.getLogger(__name__)
+
+PIN_COOKIE = 'nebula_primary_pin'
+PIN_CACHE_PREFIX = 'db-pin'
+
+# Per-request / per-task routing state: {'replica': bool, 'wrote': bool}
+_state = ContextVar('nebula_db_routing', default=None)
+
+
+def replica_alias():
+    """The configured replica alias, or None when there is no replica."""
+    alias = getattr(settings, 'REPLICA_DATABASE_ALIAS', 'replica')
+    return alias if alias in settings.DATABASES else None
+
+
+@contextmanager
+def use_replica(enabled=True):
+    """Route reads in this block to the replica (if one is configured)."""
+    token = _state.set({'replica': bool(enabled and replica_alias()), 'wrote': False})
+    try:
+        yield _state.get()
+    finally:
+        _state.reset(token)
+
+
+def use_primary():
+    return use_replica(enabled=False)
+
+
+def record_decision(target, reason):
+    db_routing_decisions.labels(target, reason).inc()
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state and state['replica']:
+            return replica_alias() or DEFAULT_DB_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state['wrote'] = True
+            if state['replica']:
+                # Read our own write for the rest of this request / task
+                state['replica'] = False
+                record_decision('primary', 'write')
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Primary and replica hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+# ========== Stickiness ==========
+def _pin_key(user_id):
+    return f'{PIN_CACHE_PREFIX}:{user_id}'
+
+
+def token_user_id(request):
+    """User id from a valid bearer JWT, without touching the database."""
+    from rest_framework_simplejwt.exceptions import TokenError
+    from rest_framework_simplejwt.settings import api_settings
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    scheme, _, raw = request.headers.get('Authorization', '').partition(' ')
+    if scheme not in api_settings.AUTH_HEADER_TYPES or not raw:
+        return None
+    try:
+        return AccessToken(raw).get(api_settings.USER_ID_CLAIM)
+    except TokenError:
+        return None
+
+
+def is_pinned(request):
+    try:
+        if float(request.COOKIES.get(PIN_COOKIE, 0)) > time.time():
+            return True
+    except ValueError:
+        pass
+    user_id = token_user_id(request)
+    if user_id is None:
+        return False
+    try:
+        return bool(cache.get(_pin_key(user_id)))
+    except Exception:
+        # No marker available: treat as pinned rather than risk stale reads
+        logger.warning('Replica pin lookup failed', exc_info=True)
+        return True
+
+
+def pin_to_primary(request, response):
+    seconds = settings.REPLICA_STICKY_SECONDS
+    response.set_cookie(
+        PIN_COOKIE, str(time.time() + seconds), max_age=seconds,
+        httponly=True, samesite='Lax', secure=request.is_secure(),
+    )
+    user = getattr(request, 'user', None)  # set by DRF once the view authenticated
+    user_id = user.pk if user is not None and user.is_authenticated else token_user_id(request)
+    if user_id is not None:
+        try:
+            cache.set(_pin_key(user_id), 1, timeout=seconds)
+        except Exception:
+            logger.warning('Could not store replica pin for user %s', user_id, exc_info=True)
@@ -0,0 +1,96 @@
+# common/importtime.py
+"""
+Import-time measurement for process startup (`python -X importtime`).
+
+Each target is a snippet run in a fresh interpreter, so the numbers cover a
+cold start of that kind of process: `setup` is what every process pays
+(django.setup(): settings, models, app signal modules), `web` adds the URLconf
+a gunicorn worker loads, `celery` adds the task modules a worker imports.
+
+Used by `manage.py importtime` and the startup budget test
+(core/tests/test_import_budget.py).
+"""
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.conf import settings
+
+TARGETS = {
+    'setup': 'import django; django.setup()',
+    'web': 'import django; django.setup(); import config.wsgi, config.urls',
+    'celery': (
+        'import django; django.setup(); '
+        'from config.celery import app; app.loader.import_default_modules()'
+    ),
+}
+
+_PREFIX = 'import time:'
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 0 = imported directly by the target snippet
+
+    @property
+    def package(self):
+        return self.module.split('.')[0]
+
+
+def parse_importtime(output):
+    """ImportRecords from `-X importtime` stderr, in the order Python printed them."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        self_us, cumulative_us, name = line[len(_PREFIX):].split('|', 2)
+        if not self_us.strip().isdigit():  # the header line
+            continue
+        # One leading space, then two per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append(ImportRecord(name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def measure(target, repeat=1):
+    """
+    Records for one fresh-interpreter run of `target` (a TARGETS key or code).
+    With repeat > 1 the fastest run is kept, which filters out scheduler noise.
+    """
+    code = TARGETS.get(target, target)
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings')}
+    best = None
+    for _ in range(max(1, repeat)):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, timeout=300,
+        )
+        if proc.returncode:
+            raise RuntimeError(f'Import target {target!r} failed:\n{proc.stderr[-2000:]}')
+        records = parse_importtime(proc.stderr)
+        if best is None or total_us(records) < total_us(best):
+            best = records
+    return best
+
+
+def total_us(records):
+    return sum(r.cumulative_us for r in records if r.depth == 0)
+
+
+def by_package(records):
+    """{top-level package: self time in µs}, largest first."""
+    totals = defaultdict(int)
+    for record in records:
+        totals[record.package] += record.self_us
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def loaded_deferred(target, records):
+    """Modules listed in STARTUP_DEFERRED_IMPORTS[target] that the run imported anyway."""
+    loaded = {r.module for r in records}
+    return [name for name in settings.STARTUP_DEFERRED_IMPORTS.get(target, ()) if name in loaded]
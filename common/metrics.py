@@ -0,0 +1,91 @@
+# common/metrics.py
+"""
+Prometheus metric definitions shared across apps.
+
+Metrics are declared once here (prometheus_client refuses duplicate
+registrations) and imported where they are recorded.
+"""
+from prometheus_client import Counter, Histogram
+
+# ========== Cache (common.cache) ==========
+cache_requests = Counter(
+    'nebula_cache_requests_total',
+    'Cache lookups by namespace, logical key and result (hit / miss / coalesced / error).',
+    ['namespace', 'key', 'result'],
+)
+
+cache_lookup_seconds = Histogram(
+    'nebula_cache_lookup_seconds',
+    'Latency of cache reads per namespace.',
+    ['namespace'],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+cache_compute_seconds = Histogram(
+    'nebula_cache_compute_seconds',
+    'Time spent recomputing values on a cache miss, per namespace.',
+    ['namespace'],
+)
+
+
+# ========== HTTP (common.middleware.PrometheusMiddleware) ==========
+# `app` is the Django app owning the view (dashboard, classes, news, ...);
+# `route` is the URL pattern, never the raw path, to keep cardinality bounded.
+http_request_seconds = Histogram(
+    'nebula_http_request_duration_seconds',
+    'Request latency by app, route, method and status.',
+    ['app', 'route', 'method', 'status'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+http_response_bytes = Histogram(
+    'nebula_http_response_size_bytes',
+    'Response body size by app and route.',
+    ['app', 'route', 'method'],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+
+http_db_queries = Histogram(
+    'nebula_http_db_queries',
+    'Number of SQL queries executed per request.',
+    ['app', 'route', 'method'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+)
+
+http_db_seconds = Histogram(
+    'nebula_http_db_query_duration_seconds',
+    'Total SQL time spent per request.',
+    ['app', 'route', 'method'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+# ========== Database routing (common.db_router) ==========
+db_routing_decisions = Counter(
+    'nebula_db_routing_decisions_total',
+    'Requests and tasks routed to the primary or the read replica, by reason '
+    '(safe_method / unsafe_method / sticky / task / write).',
+    ['target', 'reason'],
+)
+
+
+# ========== Celery (config.celery signal handlers) ==========
+celery_task_seconds = Histogram(
+    'nebula_celery_task_duration_seconds',
+    'Task run time by task name and final state.',
+    ['task', 'state'],
+    buckets=(0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
+
+celery_task_failures = Counter(
+    'nebula_celery_task_failures_total',
+    'Tasks that raised, by task name.',
+    ['task'],
+)
+
+celery_queue_lag_seconds = Histogram(
+    'nebula_celery_queue_lag_seconds',
+    'Time between publishing a task and a worker starting it.',
+    ['task'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 15, 60, 300, 900),
+)
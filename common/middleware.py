@@ -0,0 +1,299 @@
+# common/middleware.py
+import cProfile
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from common.metrics import (
+    http_db_queries,
+    http_db_seconds,
+    http_request_seconds,
+    http_response_bytes,
+)
+from common.db_router import is_pinned, pin_to_primary, record_decision, replica_alias, use_replica
+from common.profiling import ProfileStore, SQLTimeline, read_token, top_functions
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = '<unmatched>'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class _QueryStats:
+    """execute_wrapper callback that counts and times every SQL statement."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+def _wrap_connections(stack, wrapper):
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(wrapper))
+
+
+async def _await_wrapped(stack, wrapper, get_response, request):
+    """
+    Async counterpart of wrapping every connection around get_response.
+    Under ASGI the ORM runs in the request's thread-sensitive executor
+    thread, and connections are per thread, so the wrappers are installed
+    and removed there rather than on the event loop.
+    """
+    await sync_to_async(_wrap_connections)(stack, wrapper)
+    try:
+        return await get_response(request)
+    finally:
+        await sync_to_async(stack.close)()
+
+
+class AsyncCapableMiddleware:
+    """
+    Base for middleware that runs natively in both handler modes, so an
+    ASGI deployment does not pay a thread hop per middleware: `__call__`
+    serves WSGI stacks and delegates to the `__acall__` coroutine when the
+    rest of the stack is async.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.call(request)
+
+    def call(self, request):
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        raise NotImplementedError
+
+
+def resolve_labels(request):
+    """
+    (app, route) for the matched view: app is the top-level package of the
+    view class/function, route is the URL pattern - never the raw path.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unknown', UNMATCHED_ROUTE
+    func = match.func
+    target = getattr(func, 'cls', None) or getattr(func, 'view_class', None) or func
+    app = (getattr(target, '__module__', '') or 'unknown').split('.')[0]
+    return app, match.route or match.view_name or UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware(AsyncCapableMiddleware):
+    """
+    Records per-route latency, response size and SQL query count/time.
+    Keep it first in MIDDLEWARE so the timings cover the whole stack.
+    """
+
+    def call(self, request):
+        stats = _QueryStats()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            _wrap_connections(stack, stats)
+            response = self.get_response(request)
+        self._observe(request, response, stats, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        stats = _QueryStats()
+        started = time.perf_counter()
+        response = await _await_wrapped(ExitStack(), stats, self.get_response, request)
+        self._observe(request, response, stats, time.perf_counter() - started)
+        return response
+
+    def _observe(self, request, response, stats, elapsed):
+        app, route = resolve_labels(request)
+        method = request.method
+        http_request_seconds.labels(app, route, method, str(response.status_code)).observe(elapsed)
+        if not response.streaming:
+            http_response_bytes.labels(app, route, method).observe(len(response.content))
+        http_db_queries.labels(app, route, method).observe(stats.count)
+        http_db_seconds.labels(app, route, method).observe(stats.seconds)
+
+
+class ProfilingMiddleware(AsyncCapableMiddleware):
+    """
+    Profiles a request with cProfile and records its SQL timeline when it
+    carries a staff profiling token (`X-Profile-Token` header or `_profile`
+    query parameter) or is picked by PROFILING_SAMPLE_RATE. Results go to
+    common.profiling.ProfileStore; the id is returned in `X-Profile-Id`.
+
+    Under ASGI cProfile only sees the event-loop thread (ORM work done in
+    the executor thread still shows up in the SQL timeline), and one
+    request is profiled at a time per worker.
+    """
+
+    header = 'X-Profile-Token'
+    query_param = '_profile'
+    _async_busy = False
+
+    def _trigger(self, request):
+        """('token', user id) / ('sampled', None) / None when not profiling."""
+        token = request.headers.get(self.header) or request.GET.get(self.query_param)
+        if token:
+            user_id = read_token(token)
+            if user_id is not None:
+                return 'token', user_id
+        rate = settings.PROFILING_SAMPLE_RATE
+        if rate and random.random() < rate:
+            return 'sampled', None
+        return None
+
+    def call(self, request):
+        trigger = self._trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        timeline = SQLTimeline(started, settings.PROFILING_MAX_QUERIES)
+        profiler = cProfile.Profile()
+        with ExitStack() as stack:
+            _wrap_connections(stack, timeline)
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        self._save(request, response, trigger, timeline, profiler, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        maybe = request.headers.get(self.header) or request.GET.get(self.query_param) or settings.PROFILING_SAMPLE_RATE
+        # read_token() looks the user up, so only leave the loop when a token was sent
+        trigger = await sync_to_async(self._trigger)(request) if maybe else None
+        if trigger is None or ProfilingMiddleware._async_busy:
+            return await self.get_response(request)
+
+        ProfilingMiddleware._async_busy = True
+        started = time.perf_counter()
+        timeline = SQLTimeline(started, settings.PROFILING_MAX_QUERIES)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            response = await _await_wrapped(ExitStack(), timeline, self.get_response, request)
+        finally:
+            profiler.disable()
+            ProfilingMiddleware._async_busy = False
+        elapsed = time.perf_counter() - started
+        await sync_to_async(self._save)(request, response, trigger, timeline, profiler, elapsed)
+        return response
+
+    def _save(self, request, response, trigger, timeline, profiler, elapsed):
+        reason, user_id = trigger
+        app, route = resolve_labels(request)
+        meta = {
+            'created_at': time.time(),
+            'trigger': reason,
+            'requested_by': user_id,
+            'method': request.method,
+            'path': request.path,
+            'app': app,
+            'route': route,
+            'status': response.status_code,
+            'duration_ms': round(elapsed * 1000, 3),
+            'query_count': len(timeline.queries) + timeline.dropped,
+            'queries_dropped': timeline.dropped,
+            'sql_ms': round(sum(q['duration_ms'] for q in timeline.queries), 3),
+            'queries': timeline.queries,
+            'top_functions': top_functions(profiler),
+        }
+        try:
+            response['X-Profile-Id'] = ProfileStore().save(profiler, meta)
+        except OSError:
+            # A full or read-only disk must not fail the request being profiled
+            logger.exception('Could not store profile for %s %s', request.method, request.path)
+
+
+class ReplicaRoutingMiddleware(AsyncCapableMiddleware):
+    """
+    Sends the reads of safe-method requests to the read replica (see
+    common/db_router.py) unless the client is pinned to the primary after a
+    recent write, and pins clients whose request wrote.
+    """
+
+    def _target(self, request):
+        if request.method not in SAFE_METHODS:
+            target, reason = 'primary', 'unsafe_method'
+        elif is_pinned(request):
+            target, reason = 'primary', 'sticky'
+        else:
+            target, reason = 'replica', 'safe_method'
+        record_decision(target, reason)
+        return target
+
+    def call(self, request):
+        if replica_alias() is None:
+            return self.get_response(request)
+
+        with use_replica(self._target(request) == 'replica') as state:
+            response = self.get_response(request)
+        if request.method not in SAFE_METHODS or state['wrote']:
+            pin_to_primary(request, response)
+        return response
+
+    async def __acall__(self, request):
+        if replica_alias() is None:
+            return await self.get_response(request)
+
+        # The pin lookup and marker go through the (sync) cache
+        target = await sync_to_async(self._target)(request)
+        with use_replica(target == 'replica') as state:
+            response = await self.get_response(request)
+        if request.method not in SAFE_METHODS or state['wrote']:
+            await sync_to_async(pin_to_primary)(request, response)
+        return response
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise 6.9 is sync-only, which under ASGI would push every request
+    through a thread. This serves static files off the loop (file I/O in an
+    executor) and otherwise awaits the rest of the stack directly.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
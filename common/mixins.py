@@ -1,35 +1,18 @@
 # common/mixins.py
-from django.db import models
-from common.utils import generate_unique_slug
+import hashlib
 
+from django.db.models import Count, F, Max, Sum
+from django.utils.http import http_date, parse_http_date_safe, parse_etags
+from rest_framework import status
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from common.catalog import audience_bucket, get_catalog_version
+from common.serializers.values import NotCompilable, compile_values_reader
 
-# ========== Slug Mixin ==========
-class SlugModelMixin(models.Model):
-    """
-    Abstract model to automatically generate a unique slug
-    based on a specified source field.
-    """
-    slug_field_name = 'slug'
-    slug_source_field = 'title'
-    slug_max_length = 150
-
-    class Meta:
-        abstract = True
-
-    def generate_slug(self):
-        base_value = getattr(self, self.slug_source_field)
-        slug = generate_unique_slug(
-            self,
-            base_value,
-            slug_field_name=self.slug_field_name,
-            max_length=self.slug_max_length
-        )
-        setattr(self, self.slug_field_name, slug)
-
-    def save(self, *args, **kwargs):
-        if not getattr(self, self.slug_field_name):
-            self.generate_slug()
-        super().save(*args, **kwargs)
+# Model mixins live in common.models so that importing a models module does not
+# pull in DRF; re-exported here for existing imports.
+from common.models import SlugModelMixin, SoftDeleteModelMixin  # noqa: F401
 
 
 # ========== Scoped Query Mixin ==========
@@ -63,16 +46,146 @@ def filter_lessons_by_audience(qs, user):
 
     return qs.filter(audience__in=['FREE', 'BOTH'])
 
-# ========== Soft Delete Mixin ==========
-class SoftDeleteModelMixin(models.Model):
+# ========== Sparse Fieldsets Queryset Mixin ==========
+class SparseFieldsetsQuerysetMixin:
+    """
+    Viewset side of `common.serializers.SparseFieldsetsMixin`: on reads, only
+    the select_related/prefetch_related lookups for fields the client asked
+    for (via ?fields= / ?expand=) are applied. Keep it first in the bases so
+    it wraps the final queryset.
+    """
+    def get_queryset(self):
+        qs = super().get_queryset()
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in SAFE_METHODS:
+            return qs
+        optimize = getattr(self.get_serializer_class(), 'optimize_queryset', None)
+        if optimize is None:
+            return qs
+        return optimize(qs, request.query_params)
+
+
+# ========== Conditional GET Mixin ==========
+class ConditionalGetMixin:
+    """
+    Weak ETag / Last-Modified validators for `list` and `retrieve`.
+
+    The fingerprint is one aggregate query (Max(updated_at) + Count) over the
+    filtered queryset, salted with the full URL and the caller's audience
+    bucket (and the catalog version when `etag_uses_catalog_version` is set,
+    so edits to nested children also change the tag). A matching
+    If-None-Match / If-Modified-Since gets a 304 before any serialization.
+
+    Rendered columns moved by `F()` / `update()` without touching updated_at
+    (denormalized counters) go in `etag_sum_fields`; Sum(pk * column) joins
+    the fingerprint, weighted by pk so that changes on different rows (one
+    post unliked, another liked) do not cancel out.
+
+    Last-Modified is only sent on `retrieve`: a list can lose rows without
+    its max timestamp moving, so lists rely on the ETag (which counts rows).
     """
-    Reusable mixin for soft deletion support.
+    last_modified_field = 'updated_at'
+    conditional_get_actions = ('list', 'retrieve')
+    etag_uses_catalog_version = False
+    etag_sum_fields = ()
+
+    def _conditional_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset
+
+    def get_conditional_validators(self):
+        sums = {f'sum_{field}': Sum(F('pk') * F(field)) for field in self.etag_sum_fields}
+        stats = self._conditional_queryset().order_by().aggregate(
+            last_modified=Max(self.last_modified_field), count=Count('pk'), **sums,
+        )
+        last_modified = stats['last_modified']
+        parts = [
+            last_modified.isoformat() if last_modified else '',
+            stats['count'],
+            *(stats[key] for key in sums),
+            self.request.get_full_path(),
+            audience_bucket(self.request.user),
+        ]
+        if self.etag_uses_catalog_version:
+            parts.append(get_catalog_version())
+        digest = hashlib.md5('|'.join(str(p) for p in parts).encode()).hexdigest()
+        return f'W/"{digest}"', last_modified, stats['count']
+
+    def _is_not_modified(self, request, etag, last_modified):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            # Weak comparison (RFC 9110 13.1.2): ignore the W/ prefix.
+            wanted = etag.removeprefix('W/')
+            return any(
+                tag == '*' or tag.removeprefix('W/') == wanted
+                for tag in parse_etags(if_none_match)
+            )
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        if if_modified_since and last_modified and self.action == 'retrieve':
+            return int(last_modified.timestamp()) <= if_modified_since
+        return False
+
+    def _set_validators(self, response, etag, last_modified):
+        response['ETag'] = etag
+        if last_modified and self.action == 'retrieve':
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+
+    def _conditional(self, handler, request, *args, **kwargs):
+        if self.action not in self.conditional_get_actions:
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified, count = self.get_conditional_validators()
+        # A missing object falls through so the normal 404 is raised.
+        if (count or self.action == 'list') and self._is_not_modified(request, etag, last_modified):
+            return self._set_validators(
+                Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified
+            )
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            self._set_validators(response, etag, last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(super().retrieve, request, *args, **kwargs)
+
+
+# ========== Values List Mixin ==========
+class ValuesListMixin:
+    """
+    Serves `list` through common.serializers.values: the list serializer is
+    compiled into a `.values()` query plus a row -> dict function, so rows
+    are never turned into model instances. The payload is the serializer's
+    own. Serializers with fields the compiler cannot reproduce fall back to
+    the regular list transparently; set `values_list_enabled = False` to
+    opt a viewset out.
     """
-    is_active = models.BooleanField(default=True)
+    values_list_enabled = True
+
+    def list(self, request, *args, **kwargs):
+        if not self.values_list_enabled:
+            return super().list(request, *args, **kwargs)
+        try:
+            reader = compile_values_reader(self.get_serializer(many=True))
+        except NotCompilable:
+            return super().list(request, *args, **kwargs)
 
-    class Meta:
-        abstract = True
+        queryset = self.filter_queryset(self.get_queryset())
+        paginator = self.paginator
+        extra = ()
+        if isinstance(paginator, CursorPagination):
+            # The cursor is built from the ordering keys of each row
+            extra = [key.lstrip('-') for key in paginator.get_ordering(request, queryset, self)]
+        rows = reader.queryset(queryset, extra=extra)
 
-    def delete(self, using=None, keep_parents=False):
-        self.is_active = False
-        self.save()
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(reader.render(page))
+        return Response(reader.render(rows))
@@ -1,3 +1,66 @@
+# common/models.py
+"""
+Abstract model mixins. Kept free of DRF / view imports: every app's models
+module imports these during django.setup(), so anything imported here is
+paid by every process (web workers, Celery, management commands).
+"""
 from django.db import models
 
-# Create your models here.
+from common.utils import generate_unique_slug, assign_unique_slugs
+
+
+# ========== Slug Mixin ==========
+class SlugModelMixin(models.Model):
+    """
+    Abstract model to automatically generate a unique slug
+    based on a specified source field.
+    """
+    slug_field_name = 'slug'
+    slug_source_field = 'title'
+    slug_max_length = 150
+
+    class Meta:
+        abstract = True
+
+    def generate_slug(self):
+        base_value = getattr(self, self.slug_source_field)
+        slug = generate_unique_slug(
+            self,
+            base_value,
+            slug_field_name=self.slug_field_name,
+            max_length=self.slug_max_length
+        )
+        setattr(self, self.slug_field_name, slug)
+
+    @classmethod
+    def assign_slugs(cls, instances):
+        """
+        Pre-assign unique slugs to unsaved instances (one query), e.g. before
+        bulk_create(), which skips save().
+        """
+        return assign_unique_slugs(
+            instances,
+            cls.slug_source_field,
+            slug_field_name=cls.slug_field_name,
+            max_length=cls.slug_max_length,
+        )
+
+    def save(self, *args, **kwargs):
+        if not getattr(self, self.slug_field_name):
+            self.generate_slug()
+        super().save(*args, **kwargs)
+
+
+# ========== Soft Delete Mixin ==========
+class SoftDeleteModelMixin(models.Model):
+    """
+    Reusable mixin for soft deletion support.
+    """
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        abstract = True
+
+    def delete(self, using=None, keep_parents=False):
+        self.is_active = False
+        self.save()
@@ -1,5 +1,5 @@
 # common/pagination.py
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
 
 class SmallSetPagination(PageNumberPagination):
     page_size = 10  # default items per page
@@ -10,3 +10,65 @@ class LargeSetPagination(PageNumberPagination):
     page_size = 50
     page_size_query_param = 'page_size'
     max_page_size = 200
+
+
+# ========== Keyset (cursor) pagination ==========
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination for large, append-mostly tables.
+
+    Pages are addressed by an opaque ?cursor= token instead of ?page=N, so
+    there is no COUNT(*) and no growing OFFSET; the response only carries
+    `next` / `previous` links. A primary-key tie-breaker is always appended
+    to the ordering so rows sharing a timestamp never repeat or go missing
+    between pages.
+
+    Opt in per viewset with `pagination_class = <subclass>`.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-pk',)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = list(super().get_ordering(request, queryset, view))
+
+        # ?ordering= from OrderingFilter is honoured only when the leading
+        # field can key a cursor (a NULL position cannot be compared).
+        if not self._is_keyable(queryset.model, ordering[0]):
+            ordering = list(self.ordering)
+
+        if ordering[-1].lstrip('-') not in ('pk', 'id'):
+            ordering.append('-pk' if ordering[0].startswith('-') else 'pk')
+        return tuple(ordering)
+
+    @staticmethod
+    def _is_keyable(model, field_ordering):
+        name = field_ordering.lstrip('-')
+        if name == 'pk':
+            return True
+        try:
+            field = model._meta.get_field(name)
+        except Exception:
+            return False
+        return getattr(field, 'concrete', False) and not field.null
+
+
+class TimestampCursorPagination(KeysetPagination):
+    """Attendance / XP logs keyed on `timestamp`."""
+    ordering = ('-timestamp', '-id')
+
+
+class SubmittedAtCursorPagination(KeysetPagination):
+    """Worksheet submissions keyed on `submitted_at`."""
+    ordering = ('-submitted_at', '-id')
+
+
+class RegisteredAtCursorPagination(KeysetPagination):
+    """Event registrations keyed on `registered_at`."""
+    ordering = ('-registered_at', '-id')
+
+
+class CreatedAtCursorPagination(KeysetPagination):
+    """Comment threads, oldest first (mirrors NewsComment.Meta.ordering)."""
+    ordering = ('created_at', 'id')
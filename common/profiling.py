@@ -0,0 +1,135 @@
+# common/profiling.py
+"""
+Per-request profiles for offline analysis (see common.middleware.ProfilingMiddleware).
+
+A profiled request writes two files to PROFILING_DIR:
+  - <id>.prof: cProfile stats, open with `python -m pstats` or snakeviz;
+  - <id>.json: request metadata plus the SQL timeline (statement, alias,
+    offset from the start of the request and duration, in ms).
+
+The store keeps the newest PROFILING_MAX_PROFILES profiles and deletes the
+rest. Profiling is requested with a signed token issued to staff by
+core.views_profiling; the middleware runs before DRF authentication, so the
+token itself carries the staff user's id.
+"""
+import io
+import json
+import pstats
+import re
+import secrets
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+
+TOKEN_SALT = 'nebula.profiling'
+PROFILE_ID_RE = re.compile(r'^\d{13}-[0-9a-f]{8}$')
+
+
+# ========== Tokens ==========
+def issue_token(user):
+    return signing.dumps({'uid': user.pk}, salt=TOKEN_SALT)
+
+
+def read_token(token):
+    """
+    User id carried by a valid, unexpired token whose user is still active
+    staff, else None.
+    """
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except signing.BadSignature:  # includes SignatureExpired
+        return None
+    uid = payload.get('uid')
+    User = get_user_model()
+    if not User.objects.filter(pk=uid, is_staff=True, is_active=True).exists():
+        return None
+    return uid
+
+
+# ========== SQL capture ==========
+class SQLTimeline:
+    """execute_wrapper callback recording each statement with its timing."""
+
+    def __init__(self, started, limit):
+        self.started = started
+        self.limit = limit
+        self.queries = []
+        self.dropped = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        begin = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            end = time.perf_counter()
+            if len(self.queries) < self.limit:
+                self.queries.append({
+                    'alias': context['connection'].alias,
+                    'sql': sql,
+                    'many': many,
+                    'start_ms': round((begin - self.started) * 1000, 3),
+                    'duration_ms': round((end - begin) * 1000, 3),
+                })
+            else:
+                self.dropped += 1
+
+
+def top_functions(profiler, limit=25):
+    """The `limit` most expensive calls by cumulative time, as pstats text."""
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(limit)
+    return out.getvalue()
+
+
+# ========== Store ==========
+class ProfileStore:
+    """Bounded on-disk store of request profiles."""
+
+    def __init__(self, directory=None, max_profiles=None):
+        self.directory = Path(directory or settings.PROFILING_DIR)
+        self.max_profiles = max_profiles or settings.PROFILING_MAX_PROFILES
+
+    def _path(self, profile_id, suffix):
+        if not PROFILE_ID_RE.match(profile_id or ''):
+            raise KeyError(profile_id)
+        return self.directory / f'{profile_id}{suffix}'
+
+    def save(self, profiler, meta):
+        """Write stats + metadata, prune old profiles and return the new id."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile_id = f'{int(time.time() * 1000):013d}-{secrets.token_hex(4)}'
+        profiler.dump_stats(self._path(profile_id, '.prof'))
+        meta = {'id': profile_id, **meta}
+        self._path(profile_id, '.json').write_text(json.dumps(meta, default=str))
+        self.prune()
+        return profile_id
+
+    def ids(self):
+        """Stored profile ids, newest first."""
+        if not self.directory.is_dir():
+            return []
+        found = (p.stem for p in self.directory.glob('*.json'))
+        return sorted((i for i in found if PROFILE_ID_RE.match(i)), reverse=True)
+
+    def prune(self):
+        for profile_id in self.ids()[self.max_profiles:]:
+            self.delete(profile_id)
+
+    def delete(self, profile_id):
+        for suffix in ('.json', '.prof'):
+            self._path(profile_id, suffix).unlink(missing_ok=True)
+
+    def meta(self, profile_id):
+        path = self._path(profile_id, '.json')
+        if not path.exists():
+            raise KeyError(profile_id)
+        return json.loads(path.read_text())
+
+    def stats_path(self, profile_id):
+        path = self._path(profile_id, '.prof')
+        if not path.exists():
+            raise KeyError(profile_id)
+        return path
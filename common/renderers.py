@@ -0,0 +1,58 @@
+# common/renderers.py
+"""
+JSON rendering and parsing with orjson.
+
+Drop-in replacements for DRF's JSONRenderer / JSONParser, enabled with
+API_JSON_BACKEND=orjson (see REST_FRAMEWORK in settings). Output matches the
+stdlib renderer: values orjson does not handle natively (Decimal, lazy
+translation strings, querysets...) and datetimes go through DRF's
+JSONEncoder.default, so `score` stays a number and timestamps keep DRF's
+millisecond / "Z" format. Pretty-printed requests (`; indent=4`, the
+browsable API) and anything orjson rejects (e.g. integers over 64 bits)
+fall back to the stdlib implementation.
+
+orjson is optional: without it both classes behave exactly like DRF's.
+"""
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+_encode_default = JSONEncoder().default
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_encode_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same JavaScript-safety escaping as DRF's renderer
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,139 @@
+# common/search.py
+"""
+Full-text search for list endpoints, replacing SearchFilter's icontains scan.
+
+Viewsets swap `filters.SearchFilter` / `filters.OrderingFilter` for
+`FullTextSearchFilter` / `SearchRankOrderingFilter`; the model needs a
+full-text index (common.search_index). Matching rows are annotated with
+`search_rank` (higher is better; results are ranked unless `?ordering=` is
+given) and `search_snippet` (an excerpt of the body text with matched terms
+in <mark>, see `snippet_field`), which read serializers expose through
+`SearchHitFieldsMixin`.
+"""
+import html
+
+from django.db import connections
+from django.db.models import F, FloatField, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+from rest_framework import filters, serializers
+
+from common.search_index import SEARCH_COLUMN, SEARCH_CONFIG, fts_table, has_search_index, snippet_field
+
+# Relative weight of each class, as Postgres' ts_rank defaults ({0.1, 0.2, 0.4, 1.0})
+WEIGHTS = {'A': 1.0, 'B': 0.4, 'C': 0.2, 'D': 0.1}
+
+SNIPPET_START, SNIPPET_STOP = '<mark>', '</mark>'
+SNIPPET_TOKENS = 24
+
+
+def _sqlite_match(terms):
+    """Each term as an FTS5 string (all must match), so user input is never query syntax."""
+    return ' '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    `?search=` through the model's full-text index, ranked with snippets.
+    Models without an index on the current database use SearchFilter's
+    icontains lookups over `search_fields` (with null rank / snippet).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        model = queryset.model
+        if not has_search_index(model, queryset.db):
+            queryset = super().filter_queryset(request, queryset, view)
+            return queryset.annotate(
+                search_rank=Value(None, output_field=FloatField()),
+                search_snippet=Value(None, output_field=TextField()),
+            )
+        if connections[queryset.db].vendor == 'postgresql':
+            return self._postgres(queryset, model, terms)
+        return self._sqlite(queryset, model, terms)
+
+    def _postgres(self, queryset, model, terms):
+        from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVectorField
+
+        connection = connections[queryset.db]
+        column = f'{connection.ops.quote_name(model._meta.db_table)}.{connection.ops.quote_name(SEARCH_COLUMN)}'
+        vector = RawSQL(column, [], output_field=SearchVectorField())
+        query = SearchQuery(' '.join(terms), config=SEARCH_CONFIG, search_type='websearch')
+        return queryset.alias(_search_vector=vector).filter(_search_vector=query).annotate(
+            search_rank=SearchRank(vector, query),
+            search_snippet=SearchHeadline(
+                Coalesce(F(snippet_field(model)), Value('')), query, config=SEARCH_CONFIG,
+                start_sel=SNIPPET_START, stop_sel=SNIPPET_STOP, max_words=SNIPPET_TOKENS, min_words=8,
+            ),
+        )
+
+    def _sqlite(self, queryset, model, terms):
+        connection = connections[queryset.db]
+        qn = connection.ops.quote_name
+        fts = qn(fts_table(model))
+        row = f'{qn(model._meta.db_table)}.{qn(model._meta.pk.column)}'
+        match = _sqlite_match(terms)
+        weights = ', '.join(str(WEIGHTS[weight]) for _, weight in model.search_vector_fields)
+        column = [name for name, _ in model.search_vector_fields].index(snippet_field(model))
+        hit = f'FROM {fts} WHERE {fts} MATCH %s AND {fts}.rowid = {row}'
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [match]),
+        ).annotate(
+            # bm25() is lower-is-better; flip it so both backends rank descending
+            search_rank=RawSQL(f'(SELECT -bm25({fts}, {weights}) {hit})', [match], output_field=FloatField()),
+            search_snippet=RawSQL(
+                f"(SELECT snippet({fts}, {column}, %s, %s, '…', {SNIPPET_TOKENS}) {hit})",
+                [SNIPPET_START, SNIPPET_STOP, match], output_field=TextField(),
+            ),
+        )
+
+
+class SearchRankOrderingFilter(filters.OrderingFilter):
+    """OrderingFilter that puts the best matches first while searching, unless `?ordering=` is given."""
+
+    def get_ordering(self, request, queryset, view):
+        params = request.query_params.get(self.ordering_param)
+        if not params and 'search_rank' in queryset.query.annotations:
+            return ['-search_rank', *(self.get_default_ordering(view) or ())]
+        return super().get_ordering(request, queryset, view)
+
+
+def is_search_request(view, request):
+    if request is None or view is None:
+        return False
+    return any(
+        issubclass(backend, FullTextSearchFilter) and backend().get_search_terms(request)
+        for backend in getattr(view, 'filter_backends', ())
+    )
+
+
+class SearchSnippetField(serializers.CharField):
+    """Snippet text HTML-escaped, keeping only the <mark> highlights as markup."""
+
+    def to_representation(self, value):
+        escaped = html.escape(str(value), quote=False)
+        return escaped.replace(html.escape(SNIPPET_START), SNIPPET_START).replace(
+            html.escape(SNIPPET_STOP), SNIPPET_STOP
+        )
+
+
+class SearchHitFieldsMixin:
+    """
+    Adds `search_rank` and `search_snippet` to the top-level read serializer
+    while the view is answering a full-text `?search=` (FullTextSearchFilter).
+    Works on the `.values()` list path too (common.serializers.values).
+    """
+    search_values_fields = {'search_rank': ('search_rank',), 'search_snippet': ('search_snippet',)}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is None and is_search_request(self.context.get('view'), self.context.get('request')):
+            fields['search_rank'] = serializers.FloatField(read_only=True)
+            fields['search_snippet'] = SearchSnippetField(read_only=True)
+            self.values_fields = {**getattr(self, 'values_fields', {}), **self.search_values_fields}
+        return fields
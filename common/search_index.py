@@ -0,0 +1,196 @@
+# common/search_index.py
+"""
+Full-text indexes behind common.search.
+
+A model opts in with `search_vector_fields`, its weighted search document
+in the Postgres weight classes ('A' highest .. 'D'):
+
+    search_vector_fields = (('title', 'A'), ('summary', 'B'), ('content', 'C'), ('tags', 'D'))
+
+and a migration running `CreateSearchIndex` with the same fields, which builds
+the index for the database in use:
+
+- PostgreSQL: a stored generated `search_vector` tsvector column (JSON tag
+  lists via jsonb_to_tsvector) with a GIN index; the database keeps it
+  current on every write.
+- SQLite (development): an external-content FTS5 shadow table
+  `<table>_fts` kept in sync by triggers. Django rebuilds a SQLite table
+  (dropping its triggers) for many schema changes, so each app re-creates
+  missing triggers after migrate via `ensure_search_indexes`.
+- anything else: nothing; searches fall back to icontains.
+
+No DRF here: apps connect `ensure_search_indexes` in ready().
+"""
+from django.db import connections, migrations
+
+SEARCH_CONFIG = 'english'
+SEARCH_COLUMN = 'search_vector'
+
+_index_cache = {}
+
+
+def is_json(model, name):
+    return model._meta.get_field(name).get_internal_type() == 'JSONField'
+
+
+def snippet_field(model):
+    """The body text snippets are cut from: the first 'C' field, else the first text field."""
+    fields = [(name, weight) for name, weight in model.search_vector_fields if not is_json(model, name)]
+    return next((name for name, weight in fields if weight == 'C'), fields[0][0])
+
+
+def fts_table(model):
+    return f'{model._meta.db_table}_fts'
+
+
+# ----- index DDL -----
+
+def _postgres_vector_sql(schema_editor, model, fields):
+    qn = schema_editor.quote_name
+    parts = []
+    for name, weight in fields:
+        column = qn(model._meta.get_field(name).column)
+        if is_json(model, name):
+            document = (
+                f"jsonb_to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce({column}, '[]'::jsonb), '[\"string\"]')"
+            )
+        else:
+            document = f"to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce({column}, ''))"
+        parts.append(f"setweight({document}, '{weight}')")
+    return ' || '.join(parts)
+
+
+def _sqlite_trigger_sql(qn, model, fields):
+    table, fts = model._meta.db_table, fts_table(model)
+    pk = model._meta.pk.column
+    columns = [model._meta.get_field(name).column for name, _ in fields]
+    names = ', '.join(qn(c) for c in columns)
+    new = ', '.join(f'new.{qn(c)}' for c in columns)
+    old = ', '.join(f'old.{qn(c)}' for c in columns)
+    delete = f"INSERT INTO {qn(fts)}({qn(fts)}, rowid, {names}) VALUES ('delete', old.{qn(pk)}, {old});"
+    insert = f"INSERT INTO {qn(fts)}(rowid, {names}) VALUES (new.{qn(pk)}, {new});"
+    return {
+        f'{fts}_ai': f'AFTER INSERT ON {qn(table)} BEGIN {insert} END',
+        f'{fts}_ad': f'AFTER DELETE ON {qn(table)} BEGIN {delete} END',
+        f'{fts}_au': f'AFTER UPDATE OF {names} ON {qn(table)} BEGIN {delete} {insert} END',
+    }
+
+
+def create_search_index(schema_editor, model, fields):
+    qn = schema_editor.quote_name
+    table = model._meta.db_table
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            f'ALTER TABLE {qn(table)} ADD COLUMN {qn(SEARCH_COLUMN)} tsvector '
+            f'GENERATED ALWAYS AS ({_postgres_vector_sql(schema_editor, model, fields)}) STORED'
+        )
+        schema_editor.execute(
+            f'CREATE INDEX {qn(f"{table}_search_gin"[:63])} ON {qn(table)} USING gin ({qn(SEARCH_COLUMN)})'
+        )
+    elif vendor == 'sqlite':
+        fts = fts_table(model)
+        columns = ', '.join(qn(model._meta.get_field(name).column) for name, _ in fields)
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {qn(fts)} USING fts5({columns}, content={qn(table)}, "
+            f"content_rowid={qn(model._meta.pk.column)}, tokenize='porter unicode61')"
+        )
+        for trigger, body in _sqlite_trigger_sql(qn, model, fields).items():
+            schema_editor.execute(f'CREATE TRIGGER {qn(trigger)} {body}')
+        schema_editor.execute(f"INSERT INTO {qn(fts)}({qn(fts)}) VALUES ('rebuild')")
+    _index_cache.clear()
+
+
+def drop_search_index(schema_editor, model):
+    qn = schema_editor.quote_name
+    table = model._meta.db_table
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {qn(f"{table}_search_gin"[:63])}')
+        schema_editor.execute(f'ALTER TABLE {qn(table)} DROP COLUMN IF EXISTS {qn(SEARCH_COLUMN)}')
+    elif vendor == 'sqlite':
+        fts = fts_table(model)
+        for trigger in ('ai', 'ad', 'au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {qn(f"{fts}_{trigger}")}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {qn(fts)}')
+    _index_cache.clear()
+
+
+class CreateSearchIndex(migrations.operations.base.Operation):
+    """Migration operation building the full-text index for `model_name` (see module docstring)."""
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, model_name, fields):
+        self.model_name = model_name
+        self.fields = [tuple(field) for field in fields]
+
+    def deconstruct(self):
+        return self.__class__.__name__, [], {'model_name': self.model_name, 'fields': self.fields}
+
+    def state_forwards(self, app_label, state):
+        pass  # the column / shadow table is invisible to the ORM
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            create_search_index(schema_editor, model, self.fields)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            drop_search_index(schema_editor, model)
+
+    def describe(self):
+        return f'Create full-text search index on {self.model_name}'
+
+    @property
+    def migration_name_fragment(self):
+        return f'{self.model_name.lower()}_search_index'
+
+
+def ensure_search_indexes(sender, app_config=None, using='default', **kwargs):
+    """
+    post_migrate: re-create SQLite sync triggers that a table rebuild dropped,
+    then rebuild the shadow table from the content table.
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    app_config = app_config or sender
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        existing = {row[0] for row in cursor.fetchall()}
+    qn = connection.ops.quote_name
+    for model in app_config.get_models():
+        fields = getattr(model, 'search_vector_fields', None)
+        if not fields or fts_table(model) not in existing:
+            continue
+        triggers = _sqlite_trigger_sql(qn, model, fields)
+        if existing.issuperset(triggers):
+            continue
+        with connection.cursor() as cursor:
+            for trigger, body in triggers.items():
+                cursor.execute(f'DROP TRIGGER IF EXISTS {qn(trigger)}')
+                cursor.execute(f'CREATE TRIGGER {qn(trigger)} {body}')
+            fts = qn(fts_table(model))
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def has_search_index(model, using='default'):
+    connection = connections[using]
+    key = (using, connection.settings_dict['NAME'], model._meta.db_table)
+    if key not in _index_cache:
+        found = False
+        if getattr(model, 'search_vector_fields', None):
+            with connection.cursor() as cursor:
+                if connection.vendor == 'postgresql':
+                    columns = connection.introspection.get_table_description(cursor, model._meta.db_table)
+                    found = any(column.name == SEARCH_COLUMN for column in columns)
+                elif connection.vendor == 'sqlite':
+                    cursor.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [fts_table(model)]
+                    )
+                    found = cursor.fetchone() is not None
+        _index_cache[key] = found
+    return _index_cache[key]
@@ -1,3 +1,9 @@
 # common/serializers/__init__.py
+from .choices import ChoiceDisplayField, ChoiceDisplaySerializerMixin
 from .fields import ContentTypeField
-__all__ = ['ContentTypeField']
+from .sparse import SparseFieldsetsMixin
+from .values import NotCompilable, compile_values_reader, related_aggregate
+__all__ = [
+    'ChoiceDisplayField', 'ChoiceDisplaySerializerMixin', 'ContentTypeField',
+    'SparseFieldsetsMixin', 'NotCompilable', 'compile_values_reader', 'related_aggregate',
+]
@@ -0,0 +1,24 @@
+# common/serializers/choices.py
+from rest_framework import serializers
+
+
+class ChoiceDisplayField(serializers.ChoiceField):
+    """
+    A model choice field with a read-only <field>_display companion exposing
+    `get_<field>_display()`. The companion is declared when the serializer
+    class is created (ChoiceDisplaySerializerMixin), so it can be listed in
+    Meta.fields like any other field.
+    """
+
+
+class ChoiceDisplaySerializerMixin:
+    """Declares `<field>_display` for every ChoiceDisplayField on the serializer."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        declared = cls._declared_fields
+        for name, field in list(declared.items()):
+            if isinstance(field, ChoiceDisplayField):
+                declared.setdefault(
+                    f'{name}_display', serializers.CharField(source=f'get_{name}_display', read_only=True)
+                )
@@ -0,0 +1,81 @@
+# common/serializers/sparse.py
+
+from rest_framework import serializers
+
+
+def _split_param(value):
+    """'a, b,,c' -> {'a', 'b', 'c'}; missing param -> None."""
+    if value is None:
+        return None
+    return {part.strip() for part in value.split(',') if part.strip()}
+
+
+class SparseFieldsetsMixin:
+    """
+    Lets clients shape read payloads with query params:
+
+    - `?fields=id,title`      render only the listed fields
+    - `?expand=materials`     opt in to heavy relations in `expandable_fields`
+
+    With neither param every field is rendered, so existing clients are
+    unaffected. Once either param is sent, relations named in
+    `expandable_fields` are dropped unless asked for.
+
+    `field_select_related` / `field_prefetch_related` map a field name to the
+    lookups it needs; `SparseFieldsetsQuerysetMixin` (common.mixins) applies
+    only the ones for fields that will actually be rendered.
+
+    Only the top-level serializer is shaped; nested serializers render in full.
+    """
+    expandable_fields = ()
+    field_select_related = {}
+    field_prefetch_related = {}
+
+    @classmethod
+    def parse_fieldsets(cls, query_params):
+        return _split_param(query_params.get('fields')), _split_param(query_params.get('expand'))
+
+    @classmethod
+    def is_field_rendered(cls, name, fields, expand):
+        expand = expand or set()
+        if fields is None and not expand:
+            return True
+        if name in cls.expandable_fields:
+            return name in expand or (fields is not None and name in fields)
+        return fields is None or name in fields
+
+    @classmethod
+    def optimize_queryset(cls, queryset, query_params):
+        fields, expand = cls.parse_fieldsets(query_params)
+        select, prefetch = [], []
+        for name, lookups in cls.field_select_related.items():
+            if cls.is_field_rendered(name, fields, expand):
+                select.extend(lookups)
+        for name, lookups in cls.field_prefetch_related.items():
+            if cls.is_field_rendered(name, fields, expand):
+                prefetch.extend(lookups)
+        if select:
+            queryset = queryset.select_related(*dict.fromkeys(select))
+        if prefetch:
+            queryset = queryset.prefetch_related(*dict.fromkeys(prefetch))
+        return queryset
+
+    def _is_root_serializer(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        if request is None or not self._is_root_serializer():
+            return fields
+
+        requested, expand = self.parse_fieldsets(request.query_params)
+        if requested is None and not expand:
+            return fields
+        return {
+            name: field for name, field in fields.items()
+            if self.is_field_rendered(name, requested, expand)
+        }
@@ -0,0 +1,394 @@
+# common/serializers/values.py
+"""
+Fast read path for list endpoints: compile a serializer into a `.values()`
+query plus a row -> dict function, skipping model instantiation and DRF's
+per-row attribute resolution. The output is the serializer's own: every
+value still goes through the bound field's `to_representation`, keys keep
+the serializer's field order, and `?fields=` / `?expand=` (SparseFieldsetsMixin)
+are honoured because the compiled fields are the ones the serializer renders.
+
+Supported fields:
+  - model fields, also through forward foreign keys (`source='module.title'`);
+    a null foreign key on the way behaves like DRF (key skipped, or None /
+    default when the field allows it);
+  - `get_<field>_display` sources;
+  - primary-key related fields;
+  - nested serializers over forward foreign keys (compiled recursively);
+  - nested `many=True` serializers over reverse foreign keys (one extra
+    `.values()` query per page, like prefetch_related);
+  - `<relation>.count` sources (a correlated COUNT subquery);
+  - SerializerMethodFields and model-property sources whose inputs are
+    declared on the serializer in `values_fields`, e.g.
+    `{'full_name': ('first_name', 'last_name')}` or
+    `{'average_rating': {'annotated_average_rating': related_aggregate(...)}}`.
+    The method / property then sees a RowProxy (attribute access over the
+    row, model properties and forward relations included) instead of a
+    model instance.
+
+Anything else raises NotCompilable and the caller falls back to the regular
+serializer (see common.mixins.ValuesListMixin).
+
+Aggregates over to-many relations are correlated subqueries
+(`related_aggregate`), never Count/Avg over joins: two of those in one query
+multiply each other's rows and GROUP BY every selected column.
+"""
+from collections import defaultdict
+
+from django.db import models
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.encoding import force_str
+from rest_framework import serializers
+from rest_framework.fields import Field, SkipField, empty
+from rest_framework.relations import PKOnlyObject, PrimaryKeyRelatedField, RelatedField
+
+
+class NotCompilable(Exception):
+    """The serializer uses something the values reader cannot reproduce."""
+
+
+class RowProxy:
+    """
+    Read-only attribute view over a values() row for SerializerMethodField
+    methods. Model properties are evaluated against the proxy itself, forward
+    relations return a proxy for the related row (None when the key is null)
+    and file fields come back as FieldFile, as on a model instance.
+    """
+    __slots__ = ('_row', '_model', '_prefix')
+
+    def __init__(self, row, model, prefix=''):
+        self._row = row
+        self._model = model
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        key = self._prefix + name
+        try:
+            field = self._model._meta.get_field(name)
+        except Exception:
+            field = None
+        if key in self._row:
+            value = self._row[key]
+            if isinstance(field, models.FileField):
+                return field.attr_class(None, field, value)
+            return value
+        if field is not None and field.is_relation and (field.many_to_one or field.one_to_one) and field.concrete:
+            if self._row.get(self._prefix + field.attname, 0) is None:
+                return None
+            return RowProxy(self._row, field.related_model, f'{key}__')
+        attr = getattr(self._model, name, None)
+        if isinstance(attr, property):
+            return attr.fget(self)
+        raise AttributeError(f'{name} was not fetched for the values reader')
+
+
+def related_aggregate(model, relation, aggregate, output_field):
+    """
+    `aggregate` (e.g. Avg('score')) over the rows behind `model`'s to-many
+    `relation`, as a subquery correlated on the outer row's pk; NULL when
+    there are none.
+    """
+    field = model._meta.get_field(relation)
+    # The lookup from the related model back to `model`
+    back = field.related_query_name() if field.concrete else field.field.name
+    rows = (
+        field.related_model._base_manager.filter(**{back: OuterRef('pk')})
+        .order_by().values(back).annotate(result=aggregate).values('result')
+    )
+    return Subquery(rows, output_field=output_field)
+
+
+def _relation_hops(model, parts):
+    """
+    Walk dotted source parts through forward FK / one-to-one fields.
+    Returns (model at the end, [FK fields walked]) for all but the last part.
+    """
+    hops = []
+    for part in parts:
+        try:
+            field = model._meta.get_field(part)
+        except Exception:
+            raise NotCompilable(f'{model.__name__}.{part} is not a model field')
+        if not (field.is_relation and field.concrete and (field.many_to_one or field.one_to_one)):
+            raise NotCompilable(f'{model.__name__}.{part} is not a forward foreign key')
+        hops.append(field)
+        model = field.related_model
+    return model, hops
+
+
+def _missing(field):
+    """What DRF renders when an intermediate relation is None."""
+    if field.default is not empty:
+        return field.get_default()
+    if field.allow_null:
+        return None
+    raise SkipField()
+
+
+class _Plan:
+    """Compiled form of one serializer at a given values() path prefix."""
+
+    def __init__(self, serializer, model, prefix='', root=True):
+        self.serializer = serializer
+        self.model = model
+        self.prefix = prefix
+        self.root = root
+        self.paths = []
+        self.annotations = {}
+        self.children = []      # (field name, _ManyPlan)
+        self.steps = []         # (field name, fn(row) -> value, raises SkipField to omit)
+        self.pk_path = self._path(model._meta.pk.attname)
+        self.paths.append(self.pk_path)
+
+        if type(serializer).to_representation is not serializers.Serializer.to_representation:
+            raise NotCompilable(f'{type(serializer).__name__} overrides to_representation')
+        try:
+            fields = serializer.fields
+        except Exception as exc:  # misconfigured serializers fail here; let the regular path report it
+            raise NotCompilable(f'{type(serializer).__name__}.fields failed: {exc!r}')
+        declared = getattr(serializer, 'values_fields', {})
+        for name, field in fields.items():
+            if field.write_only:
+                continue
+            self.steps.append((name, self._compile(name, field, declared)))
+
+    def _path(self, path):
+        return f'{self.prefix}{path}'
+
+    def _need(self, path):
+        if path not in self.paths:
+            self.paths.append(path)
+        return path
+
+    def _annotate(self, alias, expression):
+        if not self.root:
+            raise NotCompilable('annotations are only supported on the top-level serializer')
+        self.annotations[alias] = expression
+        return alias
+
+    # ----- field kinds -----
+    def _compile(self, name, field, declared):
+        if isinstance(field, serializers.SerializerMethodField):
+            return self._method(name, field, declared)
+        if name in declared:
+            return self._declared(name, field, declared)
+        if isinstance(field, serializers.ListSerializer):
+            return self._many(name, field)
+        if isinstance(field, serializers.BaseSerializer):
+            return self._nested(field)
+        if isinstance(field, PrimaryKeyRelatedField):
+            return self._pk_related(field)
+        if isinstance(field, (RelatedField, serializers.ManyRelatedField)):
+            raise NotCompilable(f'{name}: {type(field).__name__} is not supported')
+        if type(field).get_attribute is not Field.get_attribute:
+            raise NotCompilable(f'{name}: custom get_attribute')
+        return self._attribute(name, field)
+
+    def _inputs(self, name, declared):
+        inputs = declared[name]
+        if isinstance(inputs, dict):
+            for alias, expression in inputs.items():
+                self._annotate(alias, expression)
+        else:
+            for path in inputs:
+                self._need(self._path(path))
+
+    def _method(self, name, field, declared):
+        if name not in declared:
+            raise NotCompilable(f'{name}: method field without values_fields inputs')
+        self._inputs(name, declared)
+        method = getattr(self.serializer, field.method_name)
+        model, prefix = self.model, self.prefix
+        return lambda row: method(RowProxy(row, model, prefix))
+
+    def _declared(self, name, field, declared):
+        """A field whose source (e.g. a model property) is read off a RowProxy."""
+        self._inputs(name, declared)
+        model, prefix = self.model, self.prefix
+
+        def render(row):
+            value = RowProxy(row, model, prefix)
+            *relations, last = field.source_attrs
+            for attr in relations:
+                value = getattr(value, attr)
+                if value is None:
+                    return _missing(field)
+            value = getattr(value, last)
+            return None if value is None else field.to_representation(value)
+        return render
+
+    def _many(self, name, field):
+        if not self.root:
+            raise NotCompilable(f'{name}: nested many=True below the top level')
+        try:
+            relation = self.model._meta.get_field(field.source)
+        except Exception:
+            raise NotCompilable(f'{name}: {field.source} is not a relation')
+        if not (relation.one_to_many and relation.auto_created):
+            raise NotCompilable(f'{name}: only reverse foreign keys are supported')
+        child = _ManyPlan(field.child, relation)
+        self.children.append((name, child))
+        return lambda row: [child.plan.render(r) for r in child.rows.get(row[self.pk_path], ())]
+
+    def _nested(self, field):
+        if field.source == '*':
+            raise NotCompilable('nested serializer with source="*"')
+        parts = field.source_attrs
+        model, hops = _relation_hops(self.model, parts)
+        plan = _Plan(field, model, self._path('__'.join(parts) + '__'), root=False)
+        for path in plan.paths:
+            self._need(path)
+        null_paths = [self._need(self._path('__'.join(parts[:i] + [hop.attname]))) for i, hop in enumerate(hops)]
+
+        def render(row):
+            if any(row[path] is None for path in null_paths):
+                return None
+            return plan.render(row)
+        return render
+
+    def _pk_related(self, field):
+        parts = field.source_attrs
+        _, hops = _relation_hops(self.model, parts)
+        path = self._need(self._path('__'.join(parts[:-1] + [hops[-1].attname])))
+        null_paths = [
+            self._need(self._path('__'.join(parts[:i] + [hop.attname]))) for i, hop in enumerate(hops[:-1])
+        ]
+
+        def render(row):
+            if any(row[p] is None for p in null_paths):
+                return _missing(field)
+            value = row[path]
+            return None if value is None else field.to_representation(PKOnlyObject(pk=value))
+        return render
+
+    def _attribute(self, name, field):
+        parts = field.source_attrs
+        if not parts:
+            raise NotCompilable(f'{name}: source="*"')
+        *relations, last = parts
+
+        # "<reverse relation>.count"
+        if last == 'count' and len(relations) == 1:
+            try:
+                relation = self.model._meta.get_field(relations[0])
+            except Exception:
+                raise NotCompilable(f'{name}: {relations[0]} is not a relation')
+            if relation.is_relation and (relation.one_to_many or relation.many_to_many):
+                count = related_aggregate(self.model, relations[0], Count('pk'), IntegerField())
+                alias = self._annotate(f'_count_{name}', Coalesce(count, Value(0)))
+                return lambda row: field.to_representation(row[alias])
+
+        model, hops = _relation_hops(self.model, relations)
+        null_paths = [
+            self._need(self._path('__'.join(relations[:i] + [hop.attname]))) for i, hop in enumerate(hops)
+        ]
+        base = '__'.join(relations + [''])
+        convert = None
+        try:
+            model_field = model._meta.get_field(last)
+        except Exception:
+            model_field = None
+
+        if model_field is None and last.startswith('get_') and last.endswith('_display'):
+            try:
+                choice_field = model._meta.get_field(last[4:-8])
+            except Exception:
+                raise NotCompilable(f'{name}: {last} is not a choices display')
+            if not choice_field.choices:
+                raise NotCompilable(f'{name}: {last} is not a choices display')
+            labels = dict(choice_field.flatchoices)
+            path = self._need(self._path(base + choice_field.attname))
+
+            def convert(value):
+                return force_str(labels.get(value, value), strings_only=True)
+        elif model_field is None or model_field.is_relation or not model_field.concrete:
+            raise NotCompilable(f'{name}: {".".join(parts)} is not a concrete model field')
+        else:
+            path = self._need(self._path(base + model_field.attname))
+            if isinstance(model_field, models.FileField):
+                def convert(value):
+                    return model_field.attr_class(None, model_field, value)
+
+        def render(row):
+            if any(row[p] is None for p in null_paths):
+                value = _missing(field)
+            else:
+                value = row[path]
+                if convert is not None:
+                    value = convert(value)
+            return None if value is None else field.to_representation(value)
+        return render
+
+    # ----- rendering -----
+    def render(self, row):
+        out = {}
+        for name, step in self.steps:
+            try:
+                out[name] = step(row)
+            except SkipField:
+                pass
+        return out
+
+
+class _ManyPlan:
+    """A nested many=True serializer over a reverse FK, fetched per page."""
+
+    def __init__(self, child_serializer, relation):
+        self.fk = relation.field
+        self.model = relation.related_model
+        self.plan = _Plan(child_serializer, self.model)
+        self.rows = {}
+
+    def fetch(self, parent_pks):
+        queryset = (
+            self.model._default_manager
+            .filter(**{f'{self.fk.name}__in': parent_pks})
+            .values(self.fk.attname, *self.plan.paths)
+        )
+        if self.plan.annotations:
+            queryset = queryset.annotate(**self.plan.annotations)
+        self.rows = defaultdict(list)
+        for row in queryset:
+            self.rows[row[self.fk.attname]].append(row)
+
+
+class ValuesReader:
+    """
+    reader = compile_values_reader(serializer)
+    rows = reader.queryset(queryset)     # paginate this
+    data = reader.render(page_of_rows)   # list of dicts, serializer output
+    """
+
+    def __init__(self, serializer):
+        model = serializer.Meta.model if hasattr(serializer, 'Meta') else None
+        if model is None:
+            raise NotCompilable(f'{type(serializer).__name__} is not a ModelSerializer')
+        self.plan = _Plan(serializer, model)
+
+    def queryset(self, queryset, extra=()):
+        """
+        `queryset` as values() rows with the compiled paths; `extra` adds
+        keys a cursor paginator reads from each row (e.g. 'pk', 'created_at').
+        """
+        expressions = dict(self.plan.annotations)
+        paths = list(self.plan.paths)
+        for key in extra:
+            if key == 'pk':
+                expressions.setdefault('pk', F('pk'))
+            elif key not in paths:
+                paths.append(key)
+        return queryset.prefetch_related(None).values(*paths, **expressions)
+
+    def render(self, rows):
+        rows = list(rows)
+        pks = [row[self.plan.pk_path] for row in rows]
+        for _, child in self.plan.children:
+            child.fetch(pks)
+        return [self.plan.render(row) for row in rows]
+
+
+def compile_values_reader(serializer):
+    """ValuesReader for a (bound, context-carrying) serializer instance."""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    return ValuesReader(serializer)
@@ -1,28 +1,105 @@
 # common/utils.py
+import re
 import string
 import random
+from django.db.models import Q
 from django.utils.text import slugify
 
+# Longest suffix the candidate query covers ("-" + 10 digits).
+_MAX_SUFFIX_LEN = 11
+
+
+def _slug_candidates(original_slug, slug_field_name, max_length):
+    """
+    Matches the original slug and exactly the "-N" variants _next_free_slug
+    can build from it, so unrelated slugs sharing a prefix are never loaded.
+    """
+    # Longer suffixes trim more of the original; group digit counts by body
+    widths = {}
+    for digits in range(1, _MAX_SUFFIX_LEN):
+        widths.setdefault(original_slug[:max_length - digits - 1], []).append(digits)
+    variants = "|".join(
+        f"{re.escape(body)}-[0-9]{{{min(ds)},{max(ds)}}}" for body, ds in widths.items()
+    )
+    return (
+        Q(**{slug_field_name: original_slug})
+        | Q(**{f"{slug_field_name}__regex": rf"^({variants})$"})
+    )
+
+
+def _next_free_slug(original_slug, taken, max_length):
+    if original_slug not in taken:
+        return original_slug
+    counter = 2
+    while True:
+        suffix = f"-{counter}"
+        # Trim slug to ensure it doesn't exceed max_length
+        slug = f"{original_slug[:max_length - len(suffix)]}{suffix}"
+        if slug not in taken:
+            return slug
+        counter += 1
+
+
 def generate_unique_slug(instance, value, slug_field_name='slug', max_length=100):
     """
     Generates a unique slug for a model instance.
-    
+
     Parameters:
     - instance: the model instance being saved
     - value: the base string to slugify (e.g., name or title)
     - slug_field_name: the name of the slug field (default is 'slug')
     - max_length: max allowed length for the slug field
+
+    The original slug and its "-N" variants are fetched with one query and
+    the first free suffix (from 2) is picked in memory.
     """
-    slug = original_slug = slugify(value)[:max_length]
+    original_slug = slugify(value)[:max_length]
     ModelClass = instance.__class__
-    slug_field = slug_field_name
 
-    counter = 2
-    while ModelClass.objects.filter(**{slug_field: slug}).exclude(pk=instance.pk).exists():
-        suffix = f"-{counter}"
-        # Trim slug to ensure it doesn't exceed max_length
-        slug = f"{original_slug[:max_length - len(suffix)]}{suffix}"
-        counter += 1
+    taken = set(
+        ModelClass._default_manager
+        .filter(_slug_candidates(original_slug, slug_field_name, max_length))
+        .exclude(pk=instance.pk)
+        .values_list(slug_field_name, flat=True)
+    )
+    return _next_free_slug(original_slug, taken, max_length)
+
+
+def assign_unique_slugs(instances, value, slug_field_name='slug', max_length=100):
+    """
+    Bulk variant of generate_unique_slug for seeders and imports: sets a
+    unique slug on every instance that has none, using a single query per
+    model, so the instances can go straight into bulk_create().
+
+    - value: attribute name or callable(instance) giving the text to slugify
+    Instances that already carry a slug keep it and reserve it for the batch.
+    """
+    get_value = value if callable(value) else (lambda obj: getattr(obj, value))
+
+    by_model = {}
+    for obj in instances:
+        by_model.setdefault(obj.__class__, []).append(obj)
+
+    for ModelClass, objs in by_model.items():
+        pending = [
+            (obj, slugify(get_value(obj))[:max_length])
+            for obj in objs if not getattr(obj, slug_field_name)
+        ]
+        if not pending:
+            continue
+
+        candidates = Q()
+        for original in {original for _, original in pending}:
+            candidates |= _slug_candidates(original, slug_field_name, max_length)
+        taken = set(
+            ModelClass._default_manager.filter(candidates)
+            .values_list(slug_field_name, flat=True)
+        )
+        taken.update(getattr(obj, slug_field_name) for obj in objs if getattr(obj, slug_field_name))
 
-    return slug
+        for obj, original_slug in pending:
+            slug = _next_free_slug(original_slug, taken, max_length)
+            taken.add(slug)
+            setattr(obj, slug_field_name, slug)
 
+    return instances
@@ -1,3 +1,97 @@
-from django.shortcuts import render
+# common/views.py
+import io
+import os
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+from rest_framework import exceptions
+from rest_framework.settings import api_settings
+
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint.
+
+    Under gunicorn each worker writes to PROMETHEUS_MULTIPROC_DIR and this
+    view aggregates all of them; otherwise the in-process registry is served.
+    If METRICS_TOKEN is set, scrapers must send `Authorization: Bearer <token>`.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token and not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponseForbidden()
+
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+
+class AsyncAPIView(View):
+    """
+    Native async JSON endpoint for the highest-frequency API calls, so an
+    ASGI worker (see config/gunicorn.conf.py) can keep many of them in
+    flight. Handlers are `async def get/post(...)` using the async ORM and
+    returning `self.respond(data)`.
+
+    Deliberately small next to DRF's APIView: the user is authenticated
+    with DEFAULT_AUTHENTICATION_CLASSES and must be authenticated, bodies
+    are parsed with the default JSON parser and responses rendered with
+    the default JSON renderer. Endpoints needing permissions, throttling
+    or content negotiation stay on APIView.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Token-authenticated like APIView, so no CSRF
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        method = request.method.lower()
+        if method == 'options' or method not in self.http_method_names or not hasattr(self, method):
+            return await super().dispatch(request, *args, **kwargs)
+        try:
+            request.user = await self.authenticate(request)
+            return await getattr(self, method)(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            return self.handle_exception(request, exc)
+
+    def get_authenticators(self):
+        return [auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+
+    async def authenticate(self, request):
+        # simplejwt reads the cache / database synchronously
+        for authenticator in self.get_authenticators():
+            user_auth = await sync_to_async(authenticator.authenticate)(request)
+            if user_auth is not None:
+                return user_auth[0]
+        raise exceptions.NotAuthenticated()
+
+    def handle_exception(self, request, exc):
+        headers = {}
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            authenticators = self.get_authenticators()
+            if authenticators:
+                headers['WWW-Authenticate'] = authenticators[0].authenticate_header(request)
+        detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        return self.respond(detail, status=exc.status_code, headers=headers)
+
+    def get_data(self, request):
+        """The JSON request body as a dict ({} when empty)."""
+        if not request.body:
+            return {}
+        parser = next(p for p in api_settings.DEFAULT_PARSER_CLASSES if p.media_type == 'application/json')
+        data = parser().parse(io.BytesIO(request.body))
+        if not isinstance(data, dict):
+            raise exceptions.ParseError('Expected a JSON object.')
+        return data
+
+    def respond(self, data, status=200, headers=None):
+        renderer = next(r for r in api_settings.DEFAULT_RENDERER_CLASSES if r.format == 'json')()
+        return HttpResponse(renderer.render(data), status=status, headers=headers, content_type=renderer.media_type)
@@ -2,6 +2,8 @@
 ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Served by gunicorn with uvicorn workers when WEB_SERVER_MODE=asgi (see
+config/gunicorn.conf.py).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -1,8 +1,104 @@
 import os
+import shutil
+import time
+
 from celery import Celery
+from celery.signals import (
+    before_task_publish, task_failure, task_postrun, task_prerun, worker_init, worker_process_shutdown,
+)
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")  # adjust
 
+# Task metrics are recorded in the worker's pool processes, which the web
+# service's /metrics never sees. Set CELERY_METRICS_PORT on the worker only:
+# pool processes then write to a shared PROMETHEUS_MULTIPROC_DIR and the main
+# worker process serves their aggregate at http://<worker>:<port>/metrics,
+# a second scrape target next to the web one.
+CELERY_METRICS_PORT = os.getenv("CELERY_METRICS_PORT", "")
+if CELERY_METRICS_PORT:
+    # Must be set before any pool process imports prometheus_client.
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/nebula-celery-prometheus")
+
 app = Celery("nebula")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+
+# ───────────────────────────────── Prometheus instrumentation
+# Publish time travels in a message header so workers can report queue lag;
+# run time is tracked per task id between prerun and postrun.
+SENT_AT_HEADER = "nebula_sent_at"
+_started = {}
+_routing = {}
+
+
+@before_task_publish.connect
+def _stamp_sent_at(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault(SENT_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def _task_started(task_id=None, task=None, **kwargs):
+    from common.metrics import celery_queue_lag_seconds
+
+    _started[task_id] = time.perf_counter()
+    sent_at = getattr(task.request, SENT_AT_HEADER, None) or (task.request.headers or {}).get(SENT_AT_HEADER)
+    if sent_at:
+        celery_queue_lag_seconds.labels(task.name).observe(max(0.0, time.time() - float(sent_at)))
+
+
+@task_prerun.connect
+def _route_task_reads(task_id=None, task=None, **kwargs):
+    # Reporting tasks listed in DATABASE_REPLICA_TASKS read from the replica
+    from django.conf import settings
+    from common.db_router import record_decision, replica_alias, use_replica
+
+    if task.name in settings.DATABASE_REPLICA_TASKS and replica_alias():
+        routing = use_replica()
+        routing.__enter__()
+        _routing[task_id] = routing
+        record_decision("replica", "task")
+
+
+@task_postrun.connect
+def _task_finished(task_id=None, task=None, state=None, **kwargs):
+    from common.metrics import celery_task_seconds
+
+    routing = _routing.pop(task_id, None)
+    if routing is not None:
+        routing.__exit__(None, None, None)
+
+    started = _started.pop(task_id, None)
+    if started is not None:
+        celery_task_seconds.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started)
+
+
+@task_failure.connect
+def _task_failed(sender=None, **kwargs):
+    from common.metrics import celery_task_failures
+
+    celery_task_failures.labels(getattr(sender, "name", "unknown")).inc()
+
+
+@worker_init.connect
+def _start_metrics_server(**kwargs):
+    if not CELERY_METRICS_PORT:
+        return None
+    from prometheus_client import CollectorRegistry, multiprocess, start_http_server
+
+    # Stale files from a previous worker would otherwise be summed in.
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return start_http_server(int(CELERY_METRICS_PORT), registry=registry)
+
+
+@worker_process_shutdown.connect
+def _pool_process_exited(pid=None, **kwargs):
+    if CELERY_METRICS_PORT:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid or os.getpid())
@@ -0,0 +1,47 @@
+# config/gunicorn.conf.py
+"""
+Gunicorn settings. Run with: gunicorn -c config/gunicorn.conf.py
+
+WEB_SERVER_MODE=wsgi (default) runs config.wsgi with sync workers: one
+request per worker at a time. WEB_SERVER_MODE=asgi runs config.asgi with
+uvicorn workers, where the async views (engagement ping, dashboard
+overview, notification unread count) share each worker's event loop and
+sync views run in its thread pool. Compare the two at the same
+WEB_CONCURRENCY with `manage.py loadtest`.
+
+Enables prometheus_client multiprocess mode so /metrics aggregates every
+worker instead of whichever one answered the scrape.
+"""
+import os
+import shutil
+
+SERVER_MODE = os.getenv("WEB_SERVER_MODE", "wsgi").lower()
+if SERVER_MODE not in ("wsgi", "asgi"):
+    raise RuntimeError(f"WEB_SERVER_MODE must be 'wsgi' or 'asgi', not {SERVER_MODE!r}")
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "3"))
+if SERVER_MODE == "asgi":
+    wsgi_app = "config.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "config.wsgi:application"
+timeout = 120
+accesslog = "-"
+errorlog = "-"
+
+# Must be set before any worker imports prometheus_client.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/nebula-prometheus")
+
+
+def on_starting(server):
+    # Stale files from a previous master would otherwise be summed in.
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -38,6 +38,18 @@ CELERY_BEAT_SCHEDULE = {
         "task": "badgetasks.tasks.assign_weekly_tasks_job",
         "schedule": crontab(hour=0, minute=5, day_of_week="monday"),
     },
+    "flush-email-outbox-every-minute": {
+        "task": "core.tasks.send_outbox_emails",
+        "schedule": crontab(),
+    },
+    "flush-news-view-counts": {
+        "task": "news.tasks.flush_view_counts",
+        "schedule": float(os.getenv("NEWS_VIEW_FLUSH_SECONDS", "30")),
+    },
+    "rebuild-related-news-posts-nightly": {
+        "task": "news.tasks.rebuild_related_posts",
+        "schedule": crontab(hour=3, minute=30),
+    },
 }
 
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
@@ -47,6 +59,8 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_ACCEPT_CONTENT = ["json"]  # IMPORTANT: list, not string
 CELERY_TIMEZONE = TIME_ZONE
+# Run tasks inline (no worker/broker needed), e.g. for local development
+CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "false").lower() == "true"
 
 # Optional: speed up dev, avoid storing results if you don't need them
 # CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", None)
@@ -141,6 +155,8 @@ INSTALLED_APPS = [
     'dashboard.apps.DashboardConfig',
     'badgetasks.apps.BadgetasksConfig',
     'engagement',  # ensure this is a valid app module
+    'notification.apps.NotificationsConfig',
+    'search.apps.SearchConfig',
     'application.apps.ApplicationConfig',
     'uploadmedia.apps.UploadmediaConfig',
 
@@ -173,9 +189,13 @@ elif STORAGE_BACKEND == "s3":
     AWS_S3_CUSTOM_DOMAIN = os.getenv("AWS_S3_CUSTOM_DOMAIN", None)
 
 MIDDLEWARE = [
+    # First, so latency / query metrics cover the whole stack
+    'common.middleware.PrometheusMiddleware',
+    'common.middleware.ProfilingMiddleware',
+    'common.middleware.ReplicaRoutingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'common.middleware.AsyncWhiteNoiseMiddleware',
 
     # CORS must be before CommonMiddleware
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -236,10 +256,100 @@ else:
         }
     }
 
+# ───────────────────────────────── Read replica
+# Optional. Safe-method requests and DATABASE_REPLICA_TASKS read from the
+# replica; clients that wrote stay on the primary for REPLICA_STICKY_SECONDS.
+# See common/db_router.py.
+REPLICA_DATABASE_ALIAS = "replica"
+DATABASE_REPLICA_URL = (os.getenv("DATABASE_REPLICA_URL") or "").strip()
+if DATABASE_REPLICA_URL:
+    DATABASES[REPLICA_DATABASE_ALIAS] = dj_database_url.parse(
+        DATABASE_REPLICA_URL,
+        conn_max_age=60,
+        ssl_require=DATABASE_REPLICA_URL.startswith("postgres"),
+    )
+    # Tests run against the primary's test database
+    DATABASES[REPLICA_DATABASE_ALIAS]["TEST"] = {"MIRROR": "default"}
+DATABASE_ROUTERS = ["common.db_router.ReplicaRouter"]
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+# Celery task names whose reads go to the replica (reporting / aggregation jobs)
+DATABASE_REPLICA_TASKS = [t for t in os.getenv("DATABASE_REPLICA_TASKS", "").split(",") if t]
+
+# ───────────────────────────────── Cache
+# Redis when REDIS_URL is set (shared across workers, throttles included);
+# per-process memory otherwise. Feature caches build on common/cache.py.
+REDIS_URL = (os.getenv("REDIS_URL") or "").strip()
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "nebula",
+            "TIMEOUT": 300,
+            # Fail fast; common.cache falls back to uncached reads on errors.
+            "OPTIONS": {"socket_connect_timeout": 1, "socket_timeout": 1},
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "nebula-local",
+        }
+    }
+
+# Public catalog (programs / modules / lessons) read cache, see common/catalog.py
+CATALOG_CACHE_TIMEOUT = int(os.getenv("CATALOG_CACHE_TIMEOUT", "900"))
+
+# ───────────────────────────────── News view counters
+# Post views are buffered and flushed to NewsPost.view_count in batches
+# (news/view_counts.py): Redis buffer when a URL is set, per-process otherwise.
+# NEWS_VIEW_DEDUPE counts each visitor once per post per day (HyperLogLog).
+NEWS_VIEW_BUFFER_URL = (os.getenv("NEWS_VIEW_BUFFER_URL") or REDIS_URL).strip()
+NEWS_VIEW_FLUSH_SECONDS = float(os.getenv("NEWS_VIEW_FLUSH_SECONDS", "30"))
+NEWS_VIEW_DEDUPE = os.getenv("NEWS_VIEW_DEDUPE", "false").lower() == "true"
+NEWS_VIEW_DEDUPE_SECONDS = 2 * 24 * 3600
+
+# Related posts shown on a news post (TF-IDF neighbours, see news/related.py)
+NEWS_RELATED_POSTS = int(os.getenv("NEWS_RELATED_POSTS", "5"))
+
+# ───────────────────────────────── Metrics
+# /metrics is served by common.views.metrics_view. Under gunicorn, workers
+# share PROMETHEUS_MULTIPROC_DIR (set in config/gunicorn.conf.py).
+# Celery task metrics are scraped from the worker itself on CELERY_METRICS_PORT
+# (see config/celery.py); that exporter does not check METRICS_TOKEN.
+# If METRICS_TOKEN is set, scrapes must send "Authorization: Bearer <token>".
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# ───────────────────────────────── Request profiling
+# Staff get a signed token from POST /api/debug/profiles/token/ and send
+# it as "X-Profile-Token" (or ?_profile=); see common/profiling.py.
+# PROFILING_SAMPLE_RATE additionally profiles that fraction of all requests.
+PROFILING_DIR = os.getenv("PROFILING_DIR", str(BASE_DIR / "tmp" / "profiles"))
+PROFILING_MAX_PROFILES = int(os.getenv("PROFILING_MAX_PROFILES", "200"))
+PROFILING_MAX_QUERIES = int(os.getenv("PROFILING_MAX_QUERIES", "2000"))
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_TOKEN_MAX_AGE = int(os.getenv("PROFILING_TOKEN_MAX_AGE", "3600"))
+
+# ───────────────────────────────── Startup import budget
+# Checked by core/tests/test_import_budget.py; inspect with `manage.py importtime`
+# (targets in common/importtime.py). Budgets are cumulative import time of a
+# cold interpreter, with headroom for slow CI machines. Deferred imports are
+# heavy optional modules that must stay off a target's import path: import them
+# inside the function that needs them.
+STARTUP_IMPORT_BUDGET_MS = {"setup": 2500, "web": 4000, "celery": 4000}
+STARTUP_DEFERRED_IMPORTS = {
+    # Every process: no DRF (and its requests / markdown imports) from models or signals
+    "setup": ["boto3", "botocore", "markdown", "requests", "rest_framework"],
+    "web": ["boto3", "botocore"],
+    "celery": ["boto3", "botocore"],
+}
+
 # ───────────────────────────────── REST / JWT
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
@@ -253,6 +363,19 @@ REST_FRAMEWORK = {
     },
 }
 
+# API_JSON_BACKEND=orjson renders and parses JSON with orjson (pinned in
+# requirements.txt, see common/renderers.py); compare with `manage.py bench_json`.
+if os.getenv("API_JSON_BACKEND", "stdlib").lower() == "orjson":
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        "common.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+        "common.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    )
+
 DEBUG_PROPAGATE_EXCEPTIONS = False
 
 SPECTACULAR_SETTINGS = {
@@ -276,9 +399,15 @@ SIMPLE_JWT = {
 }
 
 AUTH_USER_MODEL = 'core.User'
+# Seconds an authenticated user (plus hot-path profiles) stays cached, see core/authentication.py
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_CACHE_TIMEOUT", "60"))
 
 # ───────────────────────────────── Email (env-driven)
+# For local work without SMTP set EMAIL_BACKEND to
+# django.core.mail.backends.filebased.EmailBackend (writes to EMAIL_FILE_PATH) or
+# django.core.mail.backends.locmem.EmailBackend; tests use locmem automatically.
 EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_FILE_PATH = os.getenv('EMAIL_FILE_PATH', str(BASE_DIR / 'tmp' / 'emails'))
 EMAIL_HOST = os.getenv('EMAIL_HOST', 'sandbox.smtp.mailtrap.io')
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
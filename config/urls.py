@@ -22,6 +22,8 @@ from django.views.decorators.csrf import ensure_csrf_cookie
 from django.conf import settings
 from django.conf.urls.static import static
 
+from common.views import metrics_view
+
 
 def api_root(_):
     return JsonResponse({
@@ -36,7 +38,9 @@ def api_root(_):
             "program": "/api/program/",
             "news": "/api/news/",
             "classes": "/api/classes/",
+            "events": "/api/event/",
             "achievements": "/api/achievement/",
+            "search": "/api/search/?q=",
         }
     })
 
@@ -53,6 +57,7 @@ urlpatterns = [
     # Utilities / global endpoints
     path("health/", health),
     path("csrf/", csrf_ping),
+    path("metrics", metrics_view, name="metrics"),
 
     # Exact API root BEFORE the includes
     re_path(r"^api/$", api_root, name="api-root"),
@@ -63,10 +68,13 @@ urlpatterns = [
     path("api/module/", include("module.urls")),
     path("api/news/", include("news.urls")),
     path("api/classes/", include("classes.urls")),
+    path("api/event/", include("event.urls")),
     path("api/worksheet/", include("worksheet.urls")),
     path("api/achievement/", include("achievement.urls")),
     path("api/dashboard/", include("dashboard.urls")),
     path("api/engagement/", include("engagement.urls")),
+    path("api/notifications/", include("notification.urls")),
+    path("api/search/", include("search.urls")),
     path("api/media/", include("uploadmedia.urls")),  # ← keep this prefix
 ]
 
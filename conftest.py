@@ -0,0 +1,18 @@
+# conftest.py
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def consistent_users(settings):
+    # Baked users need a role that passes the User CHECK constraints (core.tests.bakery)
+    settings.BAKER_CUSTOM_CLASS = "core.tests.bakery.ConsistentBaker"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    # Catalog and other read caches must not leak between tests: versions are
+    # only bumped on commit, which never happens inside django_db tests.
+    cache.clear()
+    yield
+    cache.clear()
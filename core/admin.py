@@ -1,7 +1,7 @@
 # core/admin.py
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, UserActivityLog
+from .models import User, UserActivityLog, EmailOutbox
 
 # If people app is installed with OnboardingSurvey:
 try:
@@ -83,4 +83,12 @@ admin.site.register(User, UserAdmin)
 class UserActivityLogAdmin(admin.ModelAdmin):
     list_display = ['user', 'action', 'ip_address', 'timestamp', 'user_agent', 'device_type']
     search_fields = ['user__email', 'action']
-    list_filter = ['action', 'timestamp']
\ No newline at end of file
+    list_filter = ['action', 'timestamp']
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = ['recipient', 'subject', 'status', 'attempts', 'next_attempt_at', 'sent_at']
+    search_fields = ['recipient', 'subject']
+    list_filter = ['status', 'created_at']
+    readonly_fields = ['created_at', 'sent_at', 'last_error']
@@ -0,0 +1,70 @@
+# core/authentication.py
+"""
+JWT authentication with a short-lived user cache.
+
+simplejwt's JWTAuthentication loads the user row on every request, and many
+views then hit the dashboard / settings / achievement profile one-to-ones.
+CachedJWTAuthentication resolves the user (with those relations preloaded)
+from the cache, keyed by user id and a per-user version. core.signals bumps
+the version when the user or one of the preloaded profiles is saved or
+deleted (which covers password changes and deactivation); the short TTL
+bounds staleness for queryset .update() calls that skip signals.
+"""
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from common.cache import CacheNamespace
+
+# Hot-path relations loaded together with the user (missing ones are skipped).
+PRELOADED_RELATIONS = ('program_level', 'free_dashboard', 'dashboard_setting', 'achievement_profile')
+
+# Versioned per user (scope=user_id), so one user's change drops only their entry.
+auth_user_cache = CacheNamespace(
+    'auth-user', timeout=getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 60),
+)
+
+
+def invalidate_cached_user(user_id):
+    """Bump the user's cache version once the current transaction commits."""
+    auth_user_cache.invalidate(scope=user_id)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def _preloaded_relations(self):
+        names = {field.name for field in self.user_model._meta.get_fields()}
+        return [name for name in PRELOADED_RELATIONS if name in names]
+
+    def _load_user(self, user_id):
+        return (
+            self.user_model.objects
+            .select_related(*self._preloaded_relations())
+            .get(**{api_settings.USER_ID_FIELD: user_id})
+        )
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = auth_user_cache.get_or_set(
+                (user_id,), lambda: self._load_user(user_id), scope=user_id,
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
@@ -0,0 +1,89 @@
+# core/management/commands/bench_json.py
+import io
+import json
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from common import renderers as orjson_renderers
+from common.renderers import ORJSONParser, ORJSONRenderer
+
+# (label, model, serializer) - the serializers behind the heaviest list endpoints
+PAYLOADS = [
+    ('programs', 'program.models.Program', 'program.serializers.ProgramSerializer'),
+    ('modules', 'module.models.Module', 'module.serializers.ModuleSerializer'),
+    ('lessons', 'classes.models.Lesson', 'classes.serializers.lesson.LessonSerializer'),
+    ('attendance', 'classes.models.LessonAttendance', 'classes.serializers.attendance.LessonAttendanceSerializer'),
+    ('quiz-results', 'classes.models.LessonQuizResult', 'classes.serializers.quiz.LessonQuizResultSerializer'),
+    ('events', 'event.models.Event', 'event.serializers.event.EventSerializer'),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's stdlib JSON renderer/parser with common.renderers (orjson) "
+        "on payloads built by the real API serializers from rows in the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=100, help='Rows per payload (default 100).')
+        parser.add_argument('--scale', type=int, default=1,
+                            help='Repeat the serialized rows N times to simulate larger pages.')
+        parser.add_argument('--repeat', type=int, default=200, help='Timed iterations per case.')
+        parser.add_argument('--only', nargs='*', help='Payload labels to run (default: all).')
+
+    def handle(self, *args, **opts):
+        if orjson_renderers.orjson is None:
+            raise CommandError('orjson is not installed (pip install orjson).')
+
+        request = Request(RequestFactory().get('/'))
+        self.stdout.write(
+            f"{'payload':<14}{'rows':>6}{'KiB':>9}"
+            f"{'render std':>12}{'orjson':>9}{'x':>6}{'parse std':>11}{'orjson':>9}{'x':>6}  (ms/op)"
+        )
+        for label, model_path, serializer_path in PAYLOADS:
+            if opts['only'] and label not in opts['only']:
+                continue
+            try:
+                data = self._payload(model_path, serializer_path, request, opts)
+            except Exception as exc:  # a broken serializer must not stop the run
+                self.stdout.write(self.style.WARNING(f"{label:<14}skipped: {type(exc).__name__}: {exc}"))
+                continue
+            if not data:
+                self.stdout.write(self.style.WARNING(f"{label:<14}skipped: no rows"))
+                continue
+            self._bench(label, data, opts['repeat'])
+
+    def _payload(self, model_path, serializer_path, request, opts):
+        # Only rendering / parsing is timed, so query count here does not matter
+        model = import_string(model_path)
+        serializer_class = import_string(serializer_path)
+        queryset = model.objects.order_by('pk')[:opts['limit']]
+        rows = list(serializer_class(queryset, many=True, context={'request': request}).data)
+        return rows * opts['scale']
+
+    def _time(self, func, repeat):
+        return min(timeit.repeat(func, number=repeat, repeat=3)) / repeat * 1000
+
+    def _bench(self, label, data, repeat):
+        std_renderer, fast_renderer = JSONRenderer(), ORJSONRenderer()
+        body = std_renderer.render(data)
+        fast_body = fast_renderer.render(data)
+        if json.loads(body) != json.loads(fast_body):
+            self.stdout.write(self.style.ERROR(f"{label:<14}output differs between renderers"))
+            return
+
+        render_std = self._time(lambda: std_renderer.render(data), repeat)
+        render_fast = self._time(lambda: fast_renderer.render(data), repeat)
+        parse_std = self._time(lambda: JSONParser().parse(io.BytesIO(body)), repeat)
+        parse_fast = self._time(lambda: ORJSONParser().parse(io.BytesIO(body)), repeat)
+        self.stdout.write(
+            f"{label:<14}{len(data):>6}{len(body) / 1024:>9.1f}"
+            f"{render_std:>12.3f}{render_fast:>9.3f}{render_std / render_fast:>6.1f}"
+            f"{parse_std:>11.3f}{parse_fast:>9.3f}{parse_std / parse_fast:>6.1f}"
+        )
@@ -0,0 +1,68 @@
+# core/management/commands/importtime.py
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from common import importtime
+
+
+class Command(BaseCommand):
+    help = (
+        "Report cold-start import time (python -X importtime) for a process target: "
+        "slowest modules by cumulative time, self time per package, and any deferred "
+        "heavy imports (STARTUP_DEFERRED_IMPORTS) that were loaded anyway."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('target', nargs='?', default='setup',
+                            help=f"One of {', '.join(importtime.TARGETS)} (default setup).")
+        parser.add_argument('--top', type=int, default=25, help='Rows per table (default 25).')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs; the fastest is reported (default 3).')
+        parser.add_argument('--prefix', help='Only list modules starting with this (e.g. "news").')
+        parser.add_argument('--json', action='store_true', help='Print every record as JSON.')
+        parser.add_argument('--check', action='store_true',
+                            help='Exit non-zero when over STARTUP_IMPORT_BUDGET_MS or a deferred import loads.')
+
+    def handle(self, *args, **opts):
+        target = opts['target']
+        if target not in importtime.TARGETS:
+            raise CommandError(f"Unknown target {target!r}; choose from {', '.join(importtime.TARGETS)}.")
+        try:
+            records = importtime.measure(target, repeat=opts['repeat'])
+        except RuntimeError as exc:
+            raise CommandError(str(exc))
+
+        if opts['prefix']:
+            listed = [r for r in records if r.module.startswith(opts['prefix'])]
+        else:
+            listed = records
+        if opts['json']:
+            self.stdout.write(json.dumps([vars(r) for r in listed], indent=2))
+            return
+
+        total_ms = importtime.total_us(records) / 1000
+        budget = settings.STARTUP_IMPORT_BUDGET_MS.get(target)
+        self.stdout.write(
+            f"{target}: {total_ms:.1f} ms cumulative, {len(records)} modules"
+            + (f" (budget {budget} ms)" if budget else "")
+        )
+
+        self.stdout.write(f"\n{'cumulative ms':>14}{'self ms':>10}  module")
+        for r in sorted(listed, key=lambda r: -r.cumulative_us)[:opts['top']]:
+            self.stdout.write(f"{r.cumulative_us / 1000:>14.1f}{r.self_us / 1000:>10.1f}  {'  ' * r.depth}{r.module}")
+
+        self.stdout.write(f"\n{'self ms':>14}  package")
+        for package, self_us in list(importtime.by_package(listed).items())[:opts['top']]:
+            self.stdout.write(f"{self_us / 1000:>14.1f}  {package}")
+
+        problems = []
+        if budget and total_ms > budget:
+            problems.append(f"over budget: {total_ms:.1f} ms > {budget} ms")
+        loaded = importtime.loaded_deferred(target, records)
+        if loaded:
+            problems.append(f"deferred imports loaded: {', '.join(loaded)}")
+        for problem in problems:
+            self.stdout.write(self.style.WARNING(problem))
+        if problems and opts['check']:
+            raise CommandError('; '.join(problems))
@@ -0,0 +1,94 @@
+# core/management/commands/loadtest.py
+import asyncio
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+try:
+    import httpx
+except ImportError:  # optional: only needed to drive the load test
+    httpx = None
+
+# label -> (method, path, json body); the async endpoints served natively under ASGI
+ENDPOINTS = {
+    'ping': ('POST', '/api/engagement/ping/', {'page': '/loadtest'}),
+    'overview': ('GET', '/api/dashboard/free/overview/', None),
+    'unread': ('GET', '/api/notifications/unread-count/', None),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive concurrent requests at a running server and report throughput, "
+        "latency percentiles and peak in-flight requests. To compare modes, start "
+        "gunicorn with the same WEB_CONCURRENCY under WEB_SERVER_MODE=wsgi and "
+        "WEB_SERVER_MODE=asgi and run the same load against each."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help='Server base URL.')
+        parser.add_argument('--token', required=True, help='Access token (POST /api/token/) sent as Bearer.')
+        parser.add_argument('--endpoint', choices=sorted(ENDPOINTS), nargs='+', default=['ping'],
+                            help='Endpoints to hit, round-robin (default: ping).')
+        parser.add_argument('--requests', type=int, default=1000, help='Total requests (default 1000).')
+        parser.add_argument('--concurrency', type=int, default=50, help='Requests in flight (default 50).')
+        parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds.')
+
+    def handle(self, *args, **opts):
+        if httpx is None:
+            raise CommandError('httpx is not installed (pip install httpx).')
+        if opts['requests'] < 1 or opts['concurrency'] < 1:
+            raise CommandError('--requests and --concurrency must be positive.')
+
+        result = asyncio.run(self._run(opts))
+        latencies = sorted(result['latencies'])
+        elapsed = result['elapsed']
+
+        self.stdout.write(f"endpoints      {', '.join(opts['endpoint'])} @ {opts['url']}")
+        self.stdout.write(f"requests       {len(latencies)} ({result['errors']} failed)")
+        self.stdout.write(f"concurrency    {opts['concurrency']} (peak in flight {result['peak']})")
+        self.stdout.write(f"elapsed        {elapsed:.2f}s")
+        self.stdout.write(f"throughput     {len(latencies) / elapsed:.1f} req/s")
+        for label, q in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+            self.stdout.write(f"latency {label}    {self._percentile(latencies, q) * 1000:.1f} ms")
+        self.stdout.write(f"latency mean   {statistics.fmean(latencies) * 1000:.1f} ms")
+        if result['statuses']:
+            counts = ', '.join(f'{code}: {n}' for code, n in sorted(result['statuses'].items()))
+            self.stdout.write(f"statuses       {counts}")
+
+    async def _run(self, opts):
+        plan = [ENDPOINTS[opts['endpoint'][i % len(opts['endpoint'])]] for i in range(opts['requests'])]
+        queue = iter(plan)
+        state = {'latencies': [], 'errors': 0, 'statuses': {}, 'in_flight': 0, 'peak': 0}
+        limits = httpx.Limits(max_connections=opts['concurrency'], max_keepalive_connections=opts['concurrency'])
+        headers = {'Authorization': f"Bearer {opts['token']}"}
+
+        async with httpx.AsyncClient(base_url=opts['url'], headers=headers, limits=limits,
+                                     timeout=opts['timeout']) as client:
+            async def worker():
+                for method, path, body in queue:
+                    state['in_flight'] += 1
+                    state['peak'] = max(state['peak'], state['in_flight'])
+                    started = time.perf_counter()
+                    try:
+                        response = await client.request(method, path, json=body)
+                    except httpx.HTTPError:
+                        state['errors'] += 1
+                    else:
+                        code = response.status_code
+                        state['statuses'][code] = state['statuses'].get(code, 0) + 1
+                        if code >= 400:
+                            state['errors'] += 1
+                    finally:
+                        state['latencies'].append(time.perf_counter() - started)
+                        state['in_flight'] -= 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(opts['concurrency'])))
+            state['elapsed'] = time.perf_counter() - started
+        return state
+
+    @staticmethod
+    def _percentile(values, q):
+        return values[min(len(values) - 1, int(q * len(values)))]
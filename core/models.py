@@ -2,7 +2,7 @@
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from django.utils import timezone
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 from django.conf import settings
 from django.db.models import Q
 
@@ -174,3 +174,35 @@ class UserActivityLog(models.Model):
 
     def __str__(self):
         return f"{self.user.email} - {self.action} at {self.timestamp}"
+
+
+class EmailOutbox(models.Model):
+    """
+    Transactional emails waiting to be delivered by core.tasks.send_outbox_emails.
+    Request code only inserts rows; a Celery worker sends them in batches over
+    one SMTP connection and retries failures with exponential backoff.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        SENT = 'SENT', 'Sent'
+        FAILED = 'FAILED', 'Failed'
+
+    recipient = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.recipient} ({self.status})"
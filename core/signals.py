@@ -1,9 +1,10 @@
 # core/signals.py
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver, Signal
 from django.utils.text import slugify
 from common.utils import generate_unique_slug
 from core.utils.email import send_verification_email
+from core.authentication import invalidate_cached_user
 from .models import User
 
 # ✅ Custom signal without providing_args
@@ -34,4 +35,18 @@ def sync_category_from_level(sender, instance: User, **kwargs):
     - keep program_category in sync with the level's program.category
     """
     if instance.role == User.Roles.ENROLLED and instance.program_level_id:
-        instance.program_category = instance.program_level.program.category
\ No newline at end of file
+        instance.program_category = instance.program_level.program.category
+
+
+# --- Authenticated-user cache (core.authentication.CachedJWTAuthentication) ---
+@receiver([post_save, post_delete], sender=User)
+def bump_cached_user(sender, instance, **kwargs):
+    # Covers profile edits, password changes and deactivation.
+    invalidate_cached_user(instance.pk)
+
+
+@receiver([post_save, post_delete], sender='dashboard.FreeStudentDashboard')
+@receiver([post_save, post_delete], sender='dashboard.DashboardSetting')
+@receiver([post_save, post_delete], sender='achievement.UserProfileAchievement')
+def bump_cached_user_on_profile_change(sender, instance, **kwargs):
+    invalidate_cached_user(instance.user_id)
@@ -0,0 +1,95 @@
+# core/tasks.py
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import EmailOutbox
+
+logger = logging.getLogger('core.email')
+
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_BACKOFF_SECONDS = 60     # 1m, 2m, 4m, 8m ... per failed attempt
+OUTBOX_CLAIM_SECONDS = 300      # lease so concurrent workers skip claimed rows
+
+
+def _claim_batch(ids=None, batch_size=OUTBOX_BATCH_SIZE):
+    """
+    Lease a batch of due emails by pushing next_attempt_at past the claim
+    window; other workers' due-queries then skip them while we send.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        qs = EmailOutbox.objects.filter(status=EmailOutbox.Status.PENDING, next_attempt_at__lte=now)
+        if ids:
+            qs = qs.filter(pk__in=ids)
+        batch = list(qs.select_for_update(skip_locked=True).order_by('next_attempt_at')[:batch_size])
+        if batch:
+            EmailOutbox.objects.filter(pk__in=[e.pk for e in batch]).update(
+                next_attempt_at=now + timedelta(seconds=OUTBOX_CLAIM_SECONDS)
+            )
+    return batch
+
+
+def _record_failure(email, exc):
+    email.attempts += 1
+    email.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+    if email.attempts >= OUTBOX_MAX_ATTEMPTS:
+        email.status = EmailOutbox.Status.FAILED
+        logger.error(f"[EMAIL FAILED] Giving up on outbox email {email.pk} to {email.recipient}")
+    else:
+        delay = OUTBOX_BACKOFF_SECONDS * 2 ** (email.attempts - 1)
+        email.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+
+@shared_task(bind=True, max_retries=5, default_retry_delay=OUTBOX_BACKOFF_SECONDS)
+def send_outbox_emails(self, ids=None, batch_size=OUTBOX_BATCH_SIZE):
+    """
+    Deliver pending outbox emails over a single pooled SMTP connection.
+
+    Called with `ids` right after a request enqueues, and without arguments
+    by the beat schedule to flush anything due (retries, broker outages).
+    Per-message failures back off exponentially on the row; a connection
+    failure releases the batch and retries the whole task.
+    """
+    batch = _claim_batch(ids, batch_size)
+    if not batch:
+        return 0
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        EmailOutbox.objects.filter(pk__in=[e.pk for e in batch]).update(next_attempt_at=timezone.now())
+        logger.warning(f"[EMAIL ERROR] SMTP connection failed, retrying batch: {exc}")
+        raise self.retry(exc=exc, countdown=OUTBOX_BACKOFF_SECONDS * 2 ** self.request.retries)
+
+    sent = 0
+    try:
+        for email in batch:
+            message = EmailMessage(
+                subject=email.subject,
+                body=email.body,
+                from_email=email.from_email,
+                to=[email.recipient],
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception as exc:
+                _record_failure(email, exc)
+                continue
+            email.status = EmailOutbox.Status.SENT
+            email.sent_at = timezone.now()
+            email.save(update_fields=['status', 'sent_at'])
+            sent += 1
+    finally:
+        connection.close()
+
+    logger.info(f"[EMAIL SENT] Delivered {sent}/{len(batch)} outbox emails")
+    return sent
@@ -0,0 +1,20 @@
+# core/tests/bakery.py
+from django.contrib.auth import get_user_model
+from model_bakery import baker
+
+User = get_user_model()
+
+
+class ConsistentBaker(baker.Baker):
+    """
+    Baker that keeps generated users valid. A random role would trip the
+    FREE/ENROLLED check constraints on User whenever a related user is
+    created implicitly (lesson.created_by, post.author, ...).
+
+    The root conftest enables it for every test (BAKER_CUSTOM_CLASS).
+    """
+
+    def _make(self, **attrs):
+        if self.model is User:
+            attrs.setdefault("role", User.Roles.ADMIN)
+        return super()._make(**attrs)
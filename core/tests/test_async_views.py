@@ -0,0 +1,97 @@
+# core/tests/test_async_views.py
+"""
+The native async endpoints (common.views.AsyncAPIView), exercised through
+both handler modes: the sync test client (WSGI stack, view run through
+async_to_sync) and the async client (middleware on its __acall__ path).
+"""
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from model_bakery import baker
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from classes.models import LessonAttendance
+from core.models import User
+from engagement.models import EngagementPing
+from notification.models import Notification
+
+PING = "/api/engagement/ping/"
+OVERVIEW = "/api/dashboard/free/overview/"
+UNREAD = "/api/notifications/unread-count/"
+
+
+@pytest.fixture
+def student():
+    return baker.make(User, is_active=True, role=User.Roles.FREE, program_category="BEG", first_name="Ada")
+
+
+def _auth(user):
+    return {"Authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+
+def _async_get(path, headers):
+    return async_to_sync(AsyncClient().get)(path, headers=headers)
+
+
+@pytest.mark.django_db
+def test_ping_is_recorded_once_per_minute(student):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=_auth(student)["Authorization"])
+
+    for _ in range(2):
+        response = client.post(PING, {"page": "/lessons/1"}, format="json")
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+
+    ping = EngagementPing.objects.get(user=student)
+    assert ping.page == "/lessons/1"
+
+
+@pytest.mark.django_db
+def test_async_views_reject_missing_or_bad_credentials(student):
+    response = APIClient().post(PING, {}, format="json")
+    assert response.status_code == 401
+    assert response["WWW-Authenticate"].startswith("Bearer")
+
+    response = _async_get(UNREAD, {"Authorization": "Bearer not-a-token"})
+    assert response.status_code == 401
+    assert response.json()["code"] == "token_not_valid"
+
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=_auth(student)["Authorization"])
+    response = client.post(PING, "[1, 2]", content_type="application/json")
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_unread_count_through_async_stack(student):
+    baker.make(Notification, recipient=student, is_read=False, _quantity=3)
+    baker.make(Notification, recipient=student, is_read=True)
+    baker.make(Notification, recipient=baker.make(User), is_read=False)
+    labels = {"app": "notification", "route": "api/notifications/unread-count/", "method": "GET"}
+    before = REGISTRY.get_sample_value("nebula_http_db_queries_sum", labels) or 0
+
+    response = _async_get(UNREAD, _auth(student))
+
+    assert response.status_code == 200
+    assert response.json() == {"unread_count": 3}
+    # The async middleware path still sees the ORM's queries (run in the executor thread)
+    assert REGISTRY.get_sample_value("nebula_http_db_queries_sum", labels) > before
+
+
+@pytest.mark.django_db
+def test_dashboard_overview_async(student):
+    baker.make(LessonAttendance, user=student, attended=True, duration=90, _quantity=2)
+    baker.make(EngagementPing, user=student, minute=student.date_joined.replace(second=0, microsecond=0))
+
+    response = _async_get(OVERVIEW, _auth(student))
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["first_name"] == "Ada"
+    assert data["completed_lessons"] == 2
+    assert data["total_learning_time"] == "3h 0m"
+    assert set(data["weekly_activity"]) == {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
+    assert student.free_dashboard.program_level == "BEGINNER"
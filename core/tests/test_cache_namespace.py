@@ -0,0 +1,77 @@
+# core/tests/test_cache_namespace.py
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from prometheus_client import REGISTRY
+
+from common.cache import CacheNamespace
+
+
+def _count(namespace, result):
+    return REGISTRY.get_sample_value(
+        "nebula_cache_requests_total",
+        {"namespace": namespace, "key": namespace, "result": result},
+    ) or 0
+
+
+def test_get_or_set_counts_hits_and_misses_per_namespace():
+    ns = CacheNamespace("test-ns")
+    calls = []
+
+    assert ns.get_or_set(("a",), lambda: calls.append(1) or "value") == "value"
+    assert ns.get_or_set(("a",), lambda: calls.append(1) or "other") == "value"
+
+    assert calls == [1]
+    assert _count("test-ns", "miss") == 1
+    assert _count("test-ns", "hit") == 1
+
+
+def test_bump_invalidates_only_its_scope():
+    ns = CacheNamespace("test-scoped")
+    ns.get_or_set(("x",), lambda: "alice-v1", scope="alice")
+    ns.get_or_set(("x",), lambda: "bob-v1", scope="bob")
+
+    ns.bump(scope="alice")
+
+    assert ns.get_or_set(("x",), lambda: "alice-v2", scope="alice") == "alice-v2"
+    assert ns.get_or_set(("x",), lambda: "bob-v2", scope="bob") == "bob-v1"
+
+
+def test_ttl_is_jittered_within_bounds():
+    ns = CacheNamespace("test-ttl", timeout=100, jitter=0.2)
+    ttls = {ns.ttl() for _ in range(50)}
+    assert len(ttls) > 1
+    assert all(80 <= ttl <= 120 for ttl in ttls)
+
+
+def test_backend_errors_fall_back_to_compute():
+    ns = CacheNamespace("test-down")
+    with mock.patch.object(type(caches["default"]), "get", side_effect=ConnectionError("redis down")):
+        assert ns.get_or_set(("a",), lambda: "fresh") == "fresh"
+    assert _count("test-down", "error") == 1
+
+
+def test_lock_and_store_errors_fall_back_to_compute():
+    ns = CacheNamespace("test-lock-down")
+    backend = type(caches["default"])
+    with mock.patch.object(backend, "add", side_effect=ConnectionError("redis down")):
+        assert ns.get_or_set(("a",), lambda: "fresh") == "fresh"
+    assert _count("test-lock-down", "error") == 1
+
+    with mock.patch.object(backend, "set", side_effect=TimeoutError("redis slow")):
+        assert ns.get_or_set(("b",), lambda: "computed") == "computed"
+    assert ns.get_or_set(("b",), lambda: "again") == "again"  # nothing was stored
+
+
+@pytest.mark.django_db
+def test_bump_errors_do_not_fail_the_write(django_capture_on_commit_callbacks):
+    from program.models import Program
+
+    backend = type(caches["default"])
+    with mock.patch.object(backend, "incr", side_effect=ConnectionError("redis down")):
+        assert CacheNamespace("test-bump-down").bump() is None
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            Program.objects.create(name="Saved anyway", category="BEG")  # invalidates the catalog
+    assert callbacks
+    assert Program.objects.filter(name="Saved anyway").exists()
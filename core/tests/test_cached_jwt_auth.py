@@ -0,0 +1,51 @@
+# core/tests/test_cached_jwt_auth.py
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.authentication import CachedJWTAuthentication
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(
+        email="cached@example.com", password="pass1234",
+        first_name="Cache", last_name="User", role="LECTURER", is_active=True,
+    )
+
+
+def _resolve(user):
+    auth = CachedJWTAuthentication()
+    token = auth.get_validated_token(str(AccessToken.for_user(user)))
+    return auth.get_user(token)
+
+
+@pytest.mark.django_db
+def test_user_and_profiles_come_from_cache(user):
+    with CaptureQueriesContext(connection) as ctx:
+        first = _resolve(user)
+    assert len(ctx.captured_queries) == 1  # user + one-to-ones in one join
+
+    with CaptureQueriesContext(connection) as ctx:
+        again = _resolve(user)
+        hasattr(again, "dashboard_setting")
+        hasattr(again, "achievement_profile")
+    assert len(ctx.captured_queries) == 0
+    assert again.pk == first.pk
+
+
+@pytest.mark.django_db
+def test_deactivation_invalidates_cached_user(user, django_capture_on_commit_callbacks):
+    _resolve(user)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.is_active = False
+        user.save()
+
+    with pytest.raises(AuthenticationFailed):
+        _resolve(user)
@@ -0,0 +1,68 @@
+# core/tests/test_email_outbox.py
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.utils import timezone
+
+from core.models import EmailOutbox
+from core.tasks import OUTBOX_MAX_ATTEMPTS, send_outbox_emails
+from core.utils.email import queue_email, send_password_reset_email
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_flows_only_enqueue_and_dispatch_after_commit(django_capture_on_commit_callbacks):
+    user = User.objects.create_user(
+        email="ada@example.com", password="pass1234",
+        first_name="Ada", last_name="Lovelace", role="LECTURER",
+    )
+    with mock.patch("core.tasks.send_outbox_emails.delay") as delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            send_password_reset_email(user, request=None)
+            assert not delay.called  # nothing leaves before commit
+
+    email = EmailOutbox.objects.get()
+    assert email.recipient == "ada@example.com"
+    assert "reset-password?uid=" in email.body
+    assert mail.outbox == []
+    delay.assert_called_once_with(ids=[email.pk])
+
+
+@pytest.mark.django_db
+def test_batch_is_sent_over_one_connection():
+    for i in range(3):
+        queue_email("Hello", "Body", f"user{i}@example.com")
+
+    with mock.patch("core.tasks.get_connection", wraps=mail.get_connection) as get_connection:
+        assert send_outbox_emails() == 3
+
+    assert get_connection.call_count == 1
+    assert len(mail.outbox) == 3
+    assert set(EmailOutbox.objects.values_list("status", flat=True)) == {EmailOutbox.Status.SENT}
+
+
+@pytest.mark.django_db
+def test_failures_back_off_then_give_up():
+    email = queue_email("Hello", "Body", "bounce@example.com")
+
+    with mock.patch("django.core.mail.EmailMessage.send", side_effect=OSError("boom")):
+        send_outbox_emails()
+        email.refresh_from_db()
+        assert email.status == EmailOutbox.Status.PENDING
+        assert email.attempts == 1
+        assert email.next_attempt_at > timezone.now() + timedelta(seconds=30)
+
+        # Not due yet: the periodic flush leaves it alone.
+        assert send_outbox_emails() == 0
+
+        for _ in range(OUTBOX_MAX_ATTEMPTS - 1):
+            EmailOutbox.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+            send_outbox_emails()
+
+    email.refresh_from_db()
+    assert email.status == EmailOutbox.Status.FAILED
+    assert "boom" in email.last_error
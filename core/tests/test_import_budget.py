@@ -0,0 +1,38 @@
+# core/tests/test_import_budget.py
+"""
+Startup import budget: each process target (common/importtime.py) must stay
+under STARTUP_IMPORT_BUDGET_MS and must not import the heavy optional modules
+in STARTUP_DEFERRED_IMPORTS. Measured in fresh interpreters, fastest of two.
+"""
+import pytest
+from django.conf import settings
+
+from common import importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     markdown.util
+import time:       200 |        300 |   markdown
+import time:        50 |        350 | news.models.post
+"""
+
+
+def test_parse_importtime():
+    records = importtime.parse_importtime(SAMPLE)
+
+    assert [(r.module, r.depth) for r in records] == [
+        ("markdown.util", 2), ("markdown", 1), ("news.models.post", 0),
+    ]
+    assert importtime.total_us(records) == 350
+    assert importtime.by_package(records) == {"markdown": 300, "news": 50}
+
+
+@pytest.mark.parametrize("target", sorted(importtime.TARGETS))
+def test_startup_import_budget(target):
+    records = importtime.measure(target, repeat=2)
+    total_ms = importtime.total_us(records) / 1000
+
+    assert importtime.loaded_deferred(target, records) == []
+    assert total_ms <= settings.STARTUP_IMPORT_BUDGET_MS[target], (
+        f"{target} imports take {total_ms:.0f} ms; see `manage.py importtime {target}`"
+    )
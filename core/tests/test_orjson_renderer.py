@@ -0,0 +1,72 @@
+# core/tests/test_orjson_renderer.py
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from model_bakery import baker
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from common.renderers import ORJSONParser, ORJSONRenderer
+from program.models import Program
+from program.views import ProgramViewSet
+
+PAYLOAD = {
+    "watched_percent": Decimal("87.50"),
+    "score": Decimal("9.25"),
+    "submitted_at": datetime.datetime(2024, 5, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+    "local_at": timezone.make_aware(datetime.datetime(2024, 5, 1, 9, 30)),
+    "due": datetime.date(2024, 5, 2),
+    "starts": datetime.time(18, 0),
+    "duration": datetime.timedelta(minutes=90),
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "label": gettext_lazy("Beginner"),
+    "text": "line separator é",
+    "nested": [{"n": 1, 2: "int key"}],
+}
+
+
+def test_renderer_output_matches_drf():
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_indented_requests_fall_back_to_stdlib():
+    media_type = "application/json; indent=4"
+    assert ORJSONRenderer().render(PAYLOAD, media_type) == JSONRenderer().render(PAYLOAD, media_type)
+
+
+def test_parser_matches_drf_and_rejects_bad_json():
+    body = JSONRenderer().render({"score": 9.25, "name": "é", "items": [1, None, True]})
+    assert ORJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body))
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{"score": '))
+
+
+@pytest.mark.django_db
+def test_api_response_is_identical_with_orjson(monkeypatch):
+    # Views read DEFAULT_RENDERER_CLASSES at import, so swap it on the view
+    baker.make(Program, name="Python", category="BEG")
+    stdlib = APIClient().get("/api/program/programs/")
+    cache.clear()
+    monkeypatch.setattr(ProgramViewSet, "renderer_classes", [ORJSONRenderer])
+    response = APIClient().get("/api/program/programs/")
+
+    assert response.accepted_renderer.__class__ is ORJSONRenderer
+    assert response.content == stdlib.content
+
+
+@pytest.mark.django_db
+def test_bench_json_command_reports_payloads():
+    baker.make(Program, _quantity=3, _fill_optional=["description"], category="BEG")
+    out = io.StringIO()
+    call_command("bench_json", "--only", "programs", "--repeat", "2", stdout=out)
+    assert out.getvalue().splitlines()[1].startswith("programs")
@@ -0,0 +1,88 @@
+# core/tests/test_prometheus_metrics.py
+from urllib.request import urlopen
+
+import pytest
+from django.test import override_settings
+from prometheus_client import REGISTRY, Counter, values
+from rest_framework.test import APIClient
+
+from config import celery as celery_config
+from config.celery import app as celery_app
+
+ROUTE_LABELS = {"app": "program", "route": "api/program/programs/$", "method": "GET"}
+
+
+def _sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+def test_requests_are_recorded_per_route_with_query_counts():
+    before = _sample("nebula_http_request_duration_seconds_count", {**ROUTE_LABELS, "status": "200"})
+    queries_before = _sample("nebula_http_db_queries_sum", ROUTE_LABELS)
+
+    response = APIClient().get("/api/program/programs/")
+
+    assert response.status_code == 200
+    assert _sample("nebula_http_request_duration_seconds_count", {**ROUTE_LABELS, "status": "200"}) == before + 1
+    assert _sample("nebula_http_response_size_bytes_count", ROUTE_LABELS) >= 1
+    assert _sample("nebula_http_db_queries_sum", ROUTE_LABELS) > queries_before
+
+
+def test_unmatched_paths_share_one_route_label():
+    APIClient().get("/definitely/not/here/")
+    APIClient().get("/nor/here/")
+
+    labels = {"app": "unknown", "route": "<unmatched>", "method": "GET", "status": "404"}
+    assert _sample("nebula_http_request_duration_seconds_count", labels) >= 2
+
+
+def test_metrics_endpoint_exposes_registry():
+    response = APIClient().get("/metrics")
+
+    assert response.status_code == 200
+    assert b"nebula_http_request_duration_seconds" in response.content
+
+
+@override_settings(METRICS_TOKEN="s3cret")
+def test_metrics_endpoint_requires_token_when_configured():
+    client = APIClient()
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret").status_code == 200
+
+
+def test_celery_tasks_record_duration_and_failures():
+    @celery_app.task(name="tests.metrics.boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    @celery_app.task(name="tests.metrics.ok")
+    def ok():
+        return 1
+
+    ok.apply()
+    boom.apply()
+
+    assert _sample("nebula_celery_task_duration_seconds_count", {"task": "tests.metrics.ok", "state": "SUCCESS"}) == 1
+    assert _sample("nebula_celery_task_duration_seconds_count", {"task": "tests.metrics.boom", "state": "FAILURE"}) == 1
+    assert _sample("nebula_celery_task_failures_total", {"task": "tests.metrics.boom"}) == 1
+
+
+def test_worker_exporter_serves_pool_process_metrics(monkeypatch, tmp_path):
+    assert celery_config._start_metrics_server() is None  # off unless CELERY_METRICS_PORT is set
+
+    monkeypatch.setattr(celery_config, "CELERY_METRICS_PORT", "0")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    (tmp_path / "counter_1.db").write_bytes(b"stale")
+    server, _ = celery_config._start_metrics_server()
+    try:
+        assert not (tmp_path / "counter_1.db").exists()
+        # what a pool process writes in multiprocess mode
+        monkeypatch.setattr(values, "ValueClass", values.MultiProcessValue(lambda: 4242))
+        Counter("nebula_test_pool_tasks", "Pool test counter", registry=None).inc(3)
+
+        body = urlopen(f"http://127.0.0.1:{server.server_port}/metrics").read().decode()
+    finally:
+        server.shutdown()
+    assert "nebula_test_pool_tasks_total 3.0" in body
+
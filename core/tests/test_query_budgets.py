@@ -0,0 +1,170 @@
+# core/tests/test_query_budgets.py
+"""
+Query budgets for every router-registered list/retrieve endpoint.
+
+Each endpoint is requested against fixtures of increasing size. A test fails
+when the number of queries grows with the number of rows (an N+1) or exceeds
+the endpoint's `max_queries` in query_budgets.json. New endpoints must be
+added to that file, either with a budget or with an `exempt` reason.
+
+Budget entries may also set:
+  - "attrs": field values for the baked rows, so they pass the view's filters
+    (e.g. {"status": "PUBLISHED"});
+  - "owner": user foreign keys to point at the requesting user, for views
+    that only show the caller's own rows;
+  - "model": "app_label.Model" for viewsets that only define get_queryset().
+
+Fixtures are made with model_bakery (optional fields filled, so nullable
+relations are exercised too) and requested as a superuser. Nested routes get
+their parents from the URL kwargs: for `program_slug` a Program is baked, its
+slug goes in the URL, and every baked row with a foreign key to Program
+(directly or through one intermediate model) points at it. A user kwarg
+(`user_id`) resolves to the requesting user.
+"""
+import json
+from pathlib import Path
+
+import pytest
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection, models
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from core.models import User
+
+BUDGETS = json.loads(Path(__file__).with_name("query_budgets.json").read_text())
+SIZES = (2, 6)
+MEASURED_ACTIONS = ("list", "retrieve")
+
+
+# ---------- discovery ----------
+def _walk(patterns, namespace=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            inner = f"{namespace}{pattern.namespace}:" if pattern.namespace else namespace
+            yield from _walk(pattern.url_patterns, inner)
+        else:
+            yield namespace, pattern
+
+
+def discover_endpoints():
+    """(route name, action, viewset class, url kwarg names) for every router route."""
+    seen = set()
+    for namespace, pattern in _walk(get_resolver().url_patterns):
+        actions = getattr(pattern.callback, "actions", None) or {}
+        action = actions.get("get")
+        name = f"{namespace}{pattern.name}" if pattern.name else None
+        kwargs = list(pattern.pattern.regex.groupindex)
+        if action not in MEASURED_ACTIONS or not name or name in seen or "format" in kwargs:
+            continue
+        seen.add(name)
+        yield name, action, pattern.callback.cls, kwargs
+
+
+ENDPOINTS = sorted(discover_endpoints(), key=lambda e: e[0])
+BUDGETED = [e for e in ENDPOINTS if e[0] in BUDGETS["budgets"]]
+
+
+# ---------- fixtures ----------
+def _model_for(viewset, spec):
+    if "model" in spec:
+        return apps.get_model(spec["model"])
+    queryset = getattr(viewset, "queryset", None)
+    return queryset.model if queryset is not None else viewset.serializer_class.Meta.model
+
+
+def _foreign_keys(model):
+    return [f for f in model._meta.get_fields() if isinstance(f, models.ForeignKey)]
+
+
+def _matches(field, prefix):
+    return field.name == prefix or field.related_model._meta.model_name.endswith(prefix)
+
+
+def _parent_models(model, prefix):
+    """
+    Models from the URL parent down to `model` for a nested-route prefix:
+    [ProgramLevel] for Session + `level`, [Program, ProgramLevel] for
+    Session + `program`.
+    """
+    for field in _foreign_keys(model):
+        if _matches(field, prefix):
+            return [field.related_model]
+    for field in _foreign_keys(model):
+        for hop in _foreign_keys(field.related_model):
+            if _matches(hop, prefix):
+                return [hop.related_model, field.related_model]
+    raise LookupError(f"{model.__name__} has no foreign key for '{prefix}'")
+
+
+def _links(model, parents):
+    """Foreign keys of `model` that should point at already-built parents."""
+    return {
+        field.name: parents[field.related_model]
+        for field in _foreign_keys(model)
+        if field.related_model in parents
+    }
+
+
+def _bake(model, parents, **attrs):
+    return baker.make(model, _fill_optional=True, **{**_links(model, parents), **attrs})
+
+
+def build_fixtures(model, parent_kwargs, size, spec, user):
+    """Bake the URL parents, then `size` rows of `model`; return (url kwargs, rows)."""
+    parents, url_kwargs = {}, {}
+    for kwarg in parent_kwargs:
+        prefix, _, lookup = kwarg.rpartition("_")
+        chain = _parent_models(model, prefix)
+        for parent_model in chain:
+            if parent_model not in parents:
+                parents[parent_model] = user if parent_model is User else _bake(parent_model, parents)
+        url_kwargs[kwarg] = getattr(parents[chain[0]], lookup)
+    owned = {field: user for field in spec.get("owner", ())}
+    rows = _bake(model, parents, _quantity=size, **owned, **spec.get("attrs", {}))
+    return url_kwargs, rows
+
+
+def count_queries(client, url):
+    cache.clear()  # measure the uncached path of CatalogCacheMixin views
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200, f"GET {url} -> {response.status_code}: {response.content[:300]!r}"
+    return len(ctx), response
+
+
+# ---------- tests ----------
+def test_every_endpoint_has_a_budget():
+    known = set(BUDGETS["budgets"]) | set(BUDGETS["exempt"])
+    missing = sorted(name for name, *_ in ENDPOINTS if name not in known)
+    assert not missing, f"Add these endpoints to core/tests/query_budgets.json: {missing}"
+
+
+@pytest.mark.django_db
+@override_settings(BAKER_CUSTOM_CLASS="core.tests.bakery.ConsistentBaker")
+@pytest.mark.parametrize("name,action,viewset,kwargs", BUDGETED, ids=[e[0] for e in BUDGETED])
+def test_query_count_is_flat_and_within_budget(name, action, viewset, kwargs):
+    spec = BUDGETS["budgets"][name]
+    model = _model_for(viewset, spec)
+    user = baker.make(User, is_staff=True, is_superuser=True, role=User.Roles.ADMIN)
+    client = APIClient()
+    client.force_authenticate(user)
+
+    counts = []
+    for size in SIZES:
+        parent_kwargs = kwargs if action == "list" else kwargs[:-1]
+        url_kwargs, rows = build_fixtures(model, parent_kwargs, size, spec, user)
+        if action == "retrieve":
+            url_kwargs[kwargs[-1]] = getattr(rows[0], viewset.lookup_field)
+        queries, response = count_queries(client, reverse(name, kwargs=url_kwargs))
+        if action == "list":
+            results = response.data["results"] if isinstance(response.data, dict) else response.data
+            assert len(results) >= size, f"{name}: fixtures are not visible to the endpoint"
+        counts.append(queries)
+
+    assert counts[0] == counts[-1], f"{name}: queries grow with rows {dict(zip(SIZES, counts))}"
+    assert counts[-1] <= spec["max_queries"], f"{name}: {counts[-1]} queries, budget {spec['max_queries']}"
@@ -0,0 +1,134 @@
+# core/tests/test_replica_routing.py
+"""
+Replica routing against two SQLite databases: the test primary and a
+replica file that only sees what `replicate()` copied (i.e. a lagging
+replica), so each test can tell which database served a read.
+"""
+import pytest
+from django.core.cache import cache
+from django.db import connections
+from django.test import override_settings
+from model_bakery import baker
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from common.db_router import PIN_COOKIE, ReplicaRouter, use_replica
+from config.celery import app as celery_app
+from core.models import User
+from news.models import NewsCategory
+from program.models import Program
+
+# Uncached, so every read shows which database served it
+CATEGORIES = "/api/news/categories/"
+# Catalog-cached (common.catalog.CatalogCacheMixin)
+PROGRAMS = "/api/program/programs/"
+
+
+@pytest.fixture
+def replicate(db, tmp_path):
+    default = connections["default"]
+    path = tmp_path / "replica.sqlite3"
+    connections.settings["replica"] = {**default.settings_dict, "NAME": str(path), "CONN_MAX_AGE": None}
+    replica = connections["replica"]
+
+    def copy_primary():
+        # Dump through the primary's own connection, so rows written inside
+        # the test transaction are included
+        default.ensure_connection()
+        replica.close()
+        path.unlink(missing_ok=True)
+        # connect() directly: the test case only lets already-open connections
+        # through for aliases that were not configured when it was set up
+        replica.connect()
+        dump = "\n".join(default.connection.iterdump())  # tables in name order
+        replica.connection.executescript(f"PRAGMA foreign_keys=OFF;\n{dump}\nPRAGMA foreign_keys=ON;")
+
+    copy_primary()
+    yield copy_primary
+    replica.close()
+    del connections["replica"]
+    del connections.settings["replica"]
+
+
+def _names(response):
+    assert response.status_code == 200
+    return {p["name"] for p in response.data["results"]}
+
+
+def _decisions(target, reason):
+    labels = {"target": target, "reason": reason}
+    return REGISTRY.get_sample_value("nebula_db_routing_decisions_total", labels) or 0
+
+
+def test_safe_requests_read_from_the_replica(replicate):
+    baker.make(NewsCategory, name="Replicated")
+    replicate()
+    baker.make(NewsCategory, name="Lagging")
+    before = _decisions("replica", "safe_method")
+
+    assert _names(APIClient().get(CATEGORIES)) == {"Replicated"}
+    assert _decisions("replica", "safe_method") == before + 1
+
+
+def test_cache_fills_read_the_primary(replicate):
+    baker.make(Program, name="Replicated", category="BEG")
+    user = baker.make(User, is_active=True, first_name="Old", role=User.Roles.ADMIN)
+    auth = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+    replicate()
+    # Written by someone else: nothing pins this client to the primary
+    baker.make(Program, name="Lagging", category="ADV")
+    User.objects.filter(pk=user.pk).update(first_name="New")
+
+    response = APIClient().get(PROGRAMS, **auth)
+
+    assert _names(response) == {"Replicated", "Lagging"}
+    assert response.wsgi_request.user.first_name == "New"
+
+
+def test_writers_are_pinned_to_primary_by_cookie(replicate):
+    admin = baker.make(User, is_staff=True, is_active=True, role=User.Roles.ADMIN)
+    client = APIClient()
+    client.force_authenticate(admin)
+
+    response = client.post(CATEGORIES, {"name": "Fresh"}, format="json")
+
+    assert response.status_code == 201
+    assert PIN_COOKIE in response.cookies
+    before = _decisions("primary", "sticky")
+    assert _names(client.get(CATEGORIES)) == {"Fresh"}
+    assert _decisions("primary", "sticky") == before + 1
+
+
+def test_jwt_writers_are_pinned_by_cache_marker(replicate):
+    admin = baker.make(User, is_staff=True, is_active=True, role=User.Roles.ADMIN)
+    auth = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(admin)}"}
+    replicate()  # the replica knows the user, but not what they write next
+
+    response = APIClient().post(CATEGORIES, {"name": "Fresh"}, format="json", **auth)
+    assert response.status_code == 201
+
+    # A new client (no cookie) with the same user's token still reads the primary
+    assert _names(APIClient().get(CATEGORIES, **auth)) == {"Fresh"}
+    cache.clear()  # drop the pin
+    assert _names(APIClient().get(CATEGORIES, **auth)) == set()
+
+
+def test_write_inside_replica_block_switches_to_primary(replicate):
+    router = ReplicaRouter()
+    with use_replica() as state:
+        assert router.db_for_read(Program) == "replica"
+        assert router.db_for_write(Program) == "default"
+        assert router.db_for_read(Program) == "default"
+        assert state["wrote"]
+    assert router.db_for_read(Program) == "default"
+
+
+def test_listed_celery_tasks_read_from_the_replica(replicate):
+    @celery_app.task(name="tests.replica_probe")
+    def probe():
+        return ReplicaRouter().db_for_read(Program)
+
+    assert probe.apply().get() == "default"
+    with override_settings(DATABASE_REPLICA_TASKS=["tests.replica_probe"]):
+        assert probe.apply().get() == "replica"
@@ -0,0 +1,82 @@
+# core/tests/test_request_profiling.py
+import pstats
+
+import pytest
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from common.profiling import ProfileStore, issue_token
+from core.models import User
+
+
+@pytest.fixture
+def profiles_dir(tmp_path, settings):
+    settings.PROFILING_DIR = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def staff_client():
+    user = baker.make(User, is_staff=True, is_superuser=True, is_active=True, role=User.Roles.ADMIN)
+    client = APIClient()
+    client.force_authenticate(user)
+    return client, user
+
+
+@pytest.mark.django_db
+def test_token_request_is_profiled_and_listed(profiles_dir, staff_client):
+    client, user = staff_client
+    token = client.post("/api/debug/profiles/token/").data["token"]
+
+    response = APIClient().get("/api/program/programs/", HTTP_X_PROFILE_TOKEN=token)
+
+    profile_id = response["X-Profile-Id"]
+    listed = client.get("/api/debug/profiles/").data
+    assert [p["id"] for p in listed] == [profile_id]
+    assert listed[0]["requested_by"] == user.pk
+
+    detail = client.get(f"/api/debug/profiles/{profile_id}/").data
+    assert detail["route"] == "api/program/programs/$"
+    assert detail["query_count"] == len(detail["queries"]) > 0
+    assert {"alias", "sql", "start_ms", "duration_ms"} <= set(detail["queries"][0])
+
+    download = client.get(f"/api/debug/profiles/{profile_id}/download/")
+    assert download.status_code == 200
+    stats_file = profiles_dir / "downloaded.prof"
+    stats_file.write_bytes(b"".join(download.streaming_content))
+    assert pstats.Stats(str(stats_file)).total_calls > 0
+
+
+@pytest.mark.django_db
+def test_query_flag_works_and_bad_tokens_are_ignored(profiles_dir):
+    staff = baker.make(User, is_staff=True, is_active=True, role=User.Roles.ADMIN)
+    non_staff = baker.make(User, is_staff=False, is_active=True, role=User.Roles.ADMIN)
+
+    assert "X-Profile-Id" in APIClient().get(f"/api/program/programs/?_profile={issue_token(staff)}")
+    assert "X-Profile-Id" not in APIClient().get("/api/program/programs/", HTTP_X_PROFILE_TOKEN="forged")
+    assert "X-Profile-Id" not in APIClient().get(
+        "/api/program/programs/", HTTP_X_PROFILE_TOKEN=issue_token(non_staff)
+    )
+    assert len(ProfileStore().ids()) == 1
+
+
+@pytest.mark.django_db
+def test_sampling_and_store_bound(profiles_dir):
+    with override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_MAX_PROFILES=2):
+        for _ in range(4):
+            APIClient().get("/api/program/programs/")
+        assert len(ProfileStore().ids()) == 2
+    assert len(list(profiles_dir.glob("*.prof"))) == 2
+
+
+@pytest.mark.django_db
+def test_profile_endpoints_are_staff_only(profiles_dir, staff_client):
+    client, _ = staff_client
+    user = baker.make(User, is_staff=False, role=User.Roles.ADMIN)
+    other = APIClient()
+    other.force_authenticate(user)
+
+    assert other.post("/api/debug/profiles/token/").status_code == 403
+    assert other.get("/api/debug/profiles/").status_code == 403
+    assert client.get("/api/debug/profiles/..%2F..%2Fsecret/download/").status_code == 404
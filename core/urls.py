@@ -2,6 +2,12 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from .views_smtp_test import smtp_test
+from .views_profiling import (
+    ProfileTokenAPIView,
+    ProfileListAPIView,
+    ProfileDetailAPIView,
+    ProfileDownloadAPIView,
+)
 
 
 from .views import (
@@ -33,5 +39,11 @@ urlpatterns = [
     path("password-reset/", PasswordResetRequestAPIView.as_view(), name="password-reset-request"),
     path("password-reset-confirm/", PasswordResetConfirmAPIView.as_view(), name="password-reset-confirm"),
     path("debug/smtp-test/", smtp_test, name="smtp-test"),
+
+    # --- Request profiling (staff) ---
+    path("debug/profiles/", ProfileListAPIView.as_view(), name="profile-list"),
+    path("debug/profiles/token/", ProfileTokenAPIView.as_view(), name="profile-token"),
+    path("debug/profiles/<str:profile_id>/", ProfileDetailAPIView.as_view(), name="profile-detail"),
+    path("debug/profiles/<str:profile_id>/download/", ProfileDownloadAPIView.as_view(), name="profile-download"),
 ]
 
@@ -7,7 +7,7 @@ from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
 from django.urls import reverse
 from core.utils.urls import build_full_url
-from django.core.mail import send_mail
+from django.db import transaction
 from django.conf import settings
 from email.utils import formataddr
 from django.utils import timezone
@@ -36,6 +36,65 @@ def _from_email():
     sender_name = getattr(settings, "EMAIL_SENDER_NAME", "Nebula Code Academy")
     return formataddr((sender_name, default_from))
 
+def queue_email(subject: str, message: str, recipient: str):
+    """
+    Store an outgoing email in the outbox and hand it to the Celery sender
+    once the surrounding transaction commits. Never talks to SMTP itself, so
+    request handlers don't block on the mail server; if the broker is down
+    the periodic outbox flush still delivers it.
+    """
+    from core.models import EmailOutbox
+
+    email = EmailOutbox.objects.create(
+        recipient=recipient,
+        subject=subject,
+        body=message,
+        from_email=_from_email(),
+    )
+    transaction.on_commit(lambda: _dispatch_outbox(email.pk))
+    return email
+
+
+def queue_emails(emails):
+    """
+    Bulk queue_email for fan-outs: `emails` are dicts of subject, body,
+    recipient and optionally next_attempt_at (deferred rows wait for the
+    periodic flush). One INSERT; due rows are handed to the sender after
+    commit in outbox-sized batches, each sent over one SMTP connection.
+    """
+    from core.models import EmailOutbox
+    from core.tasks import OUTBOX_BATCH_SIZE
+
+    from_email = _from_email()
+    rows = EmailOutbox.objects.bulk_create(
+        [EmailOutbox(from_email=from_email, **email) for email in emails]
+    )
+    now = timezone.now()
+    due = [row.pk for row in rows if row.next_attempt_at <= now]
+    for start in range(0, len(due), OUTBOX_BATCH_SIZE):
+        ids = due[start:start + OUTBOX_BATCH_SIZE]
+        transaction.on_commit(lambda ids=ids: _dispatch_outbox_batch(ids))
+    return rows
+
+
+def _dispatch_outbox(email_id):
+    from core.tasks import send_outbox_emails
+
+    try:
+        send_outbox_emails.delay(ids=[email_id])
+    except Exception:
+        logger.warning(f"Could not enqueue outbox email {email_id}; the periodic flush will send it")
+
+
+def _dispatch_outbox_batch(ids):
+    from core.tasks import send_outbox_emails
+
+    try:
+        send_outbox_emails.delay(ids=ids, batch_size=len(ids))
+    except Exception:
+        logger.warning(f"Could not enqueue {len(ids)} outbox email(s); the periodic flush will send them")
+
+
 def _build_frontend_verify_url(uid: str, token: str) -> str:
     qs = urlencode({"uid": uid, "token": token})
     return f"{FRONTEND_URL}{VERIFY_PATH}?{qs}"
@@ -81,16 +140,10 @@ If you did not register, please ignore this email.
 """
 
     try:
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=_from_email(),  # ✅ robust sender
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
-        success_logger.info(f"Verification email successfully sent to {user.email}")
+        queue_email(subject=subject, message=message, recipient=user.email)
+        success_logger.info(f"Verification email queued for {user.email}")
     except Exception:
-        logger.exception(f"Failed to send verification email to {user.email}")
+        logger.exception(f"Failed to queue verification email for {user.email}")
         raise
 
 
@@ -116,16 +169,10 @@ def send_password_reset_email(user, request):
     )
 
     try:
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=_from_email(),  # ✅ robust sender
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
-        success_logger.info(f"Password reset email successfully sent to {user.email}")
+        queue_email(subject=subject, message=message, recipient=user.email)
+        success_logger.info(f"Password reset email queued for {user.email}")
     except Exception:
-        logger.exception(f"Failed to send password reset email to {user.email}")
+        logger.exception(f"Failed to queue password reset email for {user.email}")
         raise
 
 
@@ -146,13 +193,7 @@ def send_password_changed_notification(user, request=None):
     )
 
     try:
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=_from_email(),  # ✅ robust sender
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
-        success_logger.info(f"[EMAIL SENT] Password change notification sent to {user.email}")
+        queue_email(subject=subject, message=message, recipient=user.email)
+        success_logger.info(f"[EMAIL QUEUED] Password change notification queued for {user.email}")
     except Exception:
-        logger.exception(f"[EMAIL ERROR] Failed to send password change notification to {user.email}")
\ No newline at end of file
+        logger.exception(f"[EMAIL ERROR] Failed to queue password change notification for {user.email}")
\ No newline at end of file
@@ -0,0 +1,77 @@
+# core/views_profiling.py
+"""
+Staff endpoints for request profiling (see common/profiling.py).
+
+    POST /api/debug/profiles/token/          -> {"token", "expires_in", "header"}
+    GET  /api/debug/profiles/                -> stored profiles, newest first
+    GET  /api/debug/profiles/<id>/           -> metadata + SQL timeline
+    GET  /api/debug/profiles/<id>/download/  -> pstats file
+"""
+from django.conf import settings
+from django.http import FileResponse, Http404
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from common.middleware import ProfilingMiddleware
+from common.profiling import ProfileStore, issue_token
+
+SUMMARY_FIELDS = (
+    'id', 'created_at', 'trigger', 'requested_by', 'method', 'path',
+    'route', 'status', 'duration_ms', 'query_count', 'sql_ms',
+)
+
+
+class ProfileTokenAPIView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request):
+        return Response({
+            'token': issue_token(request.user),
+            'expires_in': settings.PROFILING_TOKEN_MAX_AGE,
+            'header': ProfilingMiddleware.header,
+        })
+
+
+class ProfileListAPIView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        store = ProfileStore()
+        profiles = []
+        for profile_id in store.ids():
+            try:
+                meta = store.meta(profile_id)
+            except KeyError:  # pruned by another worker meanwhile
+                continue
+            profiles.append({field: meta.get(field) for field in SUMMARY_FIELDS})
+        return Response(profiles)
+
+
+class ProfileDetailAPIView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, profile_id):
+        try:
+            return Response(ProfileStore().meta(profile_id))
+        except KeyError:
+            raise Http404
+
+    def delete(self, request, profile_id):
+        try:
+            ProfileStore().delete(profile_id)
+        except KeyError:
+            raise Http404
+        return Response(status=204)
+
+
+class ProfileDownloadAPIView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, profile_id):
+        try:
+            path = ProfileStore().stats_path(profile_id)
+        except KeyError:
+            raise Http404
+        return FileResponse(path.open('rb'), as_attachment=True, filename=path.name,
+                            content_type='application/octet-stream')
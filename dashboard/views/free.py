@@ -2,6 +2,7 @@
 
 from urllib import request
 import urllib.parse
+from asgiref.sync import sync_to_async
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -9,6 +10,7 @@ from django.utils.timezone import now
 from collections import defaultdict
 from datetime import timedelta
 from django.shortcuts import get_object_or_404
+from common.views import AsyncAPIView
 from engagement.models import EngagementPing
 
 from dashboard.serializers.free import FreeDashboardOverviewSerializer
@@ -39,7 +41,7 @@ def _get_profile_picture_url(user):
     return f"https://ui-avatars.com/api/?name={encoded_name}&background=random&color=fff"
 
 
-def _weekly_minutes_last_7_days(user):
+async def _weekly_minutes_last_7_days(user):
     """Return dict of Mon..Sun -> total 'active minutes' = pings + lesson minutes."""
     start = (now() - timedelta(days=6)).date()
 
@@ -50,7 +52,7 @@ def _weekly_minutes_last_7_days(user):
         .values_list("minute", flat=True)
     )
     ping_daily = {"Mon":0,"Tue":0,"Wed":0,"Thu":0,"Fri":0,"Sat":0,"Sun":0}
-    for m in ping_rows:
+    async for m in ping_rows:
         ping_daily[m.strftime("%a")] += 1
 
     # 2) Lesson minutes
@@ -60,7 +62,7 @@ def _weekly_minutes_last_7_days(user):
         .values("timestamp", "duration")
     )
     lesson_daily = {"Mon":0,"Tue":0,"Wed":0,"Thu":0,"Fri":0,"Sat":0,"Sun":0}
-    for r in lesson_rows:
+    async for r in lesson_rows:
         lesson_daily[r["timestamp"].strftime("%a")] += r["duration"] or 0
 
     # 3) Sum
@@ -79,13 +81,13 @@ def _map_status(status_str):
         return "in_progress"
     return "pending"
 
-class FreeDashboardOverviewAPIView(APIView):
-    permission_classes = [IsAuthenticated]
+class FreeDashboardOverviewAPIView(AsyncAPIView):
+    """Loaded on every dashboard visit; native async so its reads don't hold a worker."""
 
-    def get(self, request):
+    async def get(self, request):
         user = request.user
         # Safe fallbacks if objects aren’t created yet
-        dashboard, _ = FreeStudentDashboard.objects.get_or_create(
+        dashboard, _ = await FreeStudentDashboard.objects.aget_or_create(
             user=user,
             defaults={
                 "program_level": "BEGINNER",
@@ -94,47 +96,46 @@ class FreeDashboardOverviewAPIView(APIView):
                 "theme_preference": "LIGHT",
             },
         )
-        settings, _ = DashboardSetting.objects.get_or_create(
+        settings, _ = await DashboardSetting.objects.aget_or_create(
             user=user,
             defaults={"theme": "LIGHT", "content_filter": "ALL", "show_survey_popup": True},
         )
 
         # Lessons Completed
-        completed_lessons = (
+        completed_lessons = await (
             LessonAttendance.objects
             .filter(user=user, attended=True)
             .values_list("lesson_id", flat=True)
             .distinct()
-            .count()
+            .acount()
         )
 
         # Modules In Progress
-        modules_in_progress = (
+        modules_in_progress = await (
             LessonAttendance.objects
             .filter(user=user, attended=True, lesson__module__isnull=False)
             .values("lesson__module_id")
             .distinct()
-            .count()
+            .acount()
         )
 
         # Total Learning Time
         total_minutes = (
-            LessonAttendance.objects
+            await LessonAttendance.objects
             .filter(user=user)
-            .aggregate(total=Sum("duration"))
-            .get("total") or 0
-        )
+            .aaggregate(total=Sum("duration"))
+        ).get("total") or 0
         total_learning_time = f"{total_minutes // 60}h {total_minutes % 60}m"
 
         # Weekly activity (last 7 days)
-        weekly_activity = _weekly_minutes_last_7_days(user)
+        weekly_activity = await _weekly_minutes_last_7_days(user)
 
         # Badges
         badges = AwardedBadge.objects.filter(user=user).select_related("badge")
-        badges_earned = [{"title": b.badge.title, "icon": b.badge.icon or "🏅"} for b in badges]
+        badges_earned = [{"title": b.badge.title, "icon": b.badge.icon or "🏅"} async for b in badges]
 
         # If you want TIME_SPENT to include EngagementPing minutes, set flag True:
-        evaluate_weekly_tasks_for_user(request.user, include_active_minutes_in_time_spent=False)
+        await sync_to_async(evaluate_weekly_tasks_for_user)(request.user, include_active_minutes_in_time_spent=False)
         task_qs = WeeklyTaskAssignment.objects.filter(user=user).select_related("task")
         weekly_tasks = [
             {
@@ -144,7 +145,7 @@ class FreeDashboardOverviewAPIView(APIView):
                 "status": _map_status(ta.status),
                 "progress": ta.progress or {},
             }
-            for ta in task_qs
+            async for ta in task_qs
         ]
 
         # Construct response
@@ -166,7 +167,7 @@ class FreeDashboardOverviewAPIView(APIView):
         }
 
         serializer = FreeDashboardOverviewSerializer(data)
-        return Response(serializer.data)
+        return self.respond(serializer.data)
 
 
 class FreeLessonStatsAPIView(APIView):
@@ -174,7 +175,7 @@ class FreeLessonStatsAPIView(APIView):
 
     def get(self, request):
         user = request.user
-        dashboard = user.dashboard  # FreeStudentDashboard via OneToOne
+        dashboard = user.free_dashboard  # FreeStudentDashboard via OneToOne
 
         program_level = dashboard.program_level
         now_time = now()
@@ -210,23 +211,23 @@ class FreeModulesView(APIView):
 
     def get(self, request):
         user = request.user
-        dashboard = user.dashboard  # FreeStudentDashboard
+        dashboard = user.free_dashboard
 
-        # Step 1: Get all lessons this user has attended
-        attended_lesson_ids = (
+        # Step 1: When the user last viewed each attended lesson (one query)
+        viewed_at = dict(
             LessonAttendance.objects
             .filter(user=user, attended=True)
-            .values_list('lesson_id', flat=True)
+            .values_list('lesson_id', 'timestamp')
         )
 
-        if not attended_lesson_ids:
+        if not viewed_at:
             return Response([])
 
         # Step 2: Get attended lessons that are marked FREE/BOTH and match user's level
         lessons = (
             Lesson.objects
             .filter(
-                id__in=attended_lesson_ids,
+                id__in=viewed_at.keys(),
                 audience__in=["FREE", "BOTH"],
                 program_level=dashboard.program_level
             )
@@ -248,12 +249,10 @@ class FreeModulesView(APIView):
                     "lessons": []
                 }
 
-            # Get attendance object to fetch `timestamp` (i.e., when user viewed)
-            attendance = LessonAttendance.objects.filter(user=user, lesson=lesson).first()
             modules_map[module.id]["lessons"].append({
                 "lesson_id": lesson.id,
                 "title": lesson.title,
-                "viewed_at": attendance.timestamp if attendance else None
+                "viewed_at": viewed_at.get(lesson.id)
             })
 
         return Response(list(modules_map.values()))    
@@ -263,21 +262,21 @@ class ModuleLessonsDetailView(APIView):
 
     def get(self, request, slug):
         user = request.user
-        dashboard = user.dashboard
+        dashboard = user.free_dashboard
 
         module = get_object_or_404(Module, slug=slug)
 
-        # Get all attended lesson IDs
-        attended_ids = (
+        # When the user last viewed each attended lesson (one query)
+        viewed_at = dict(
             LessonAttendance.objects
             .filter(user=user, attended=True)
-            .values_list("lesson_id", flat=True)
+            .values_list("lesson_id", "timestamp")
         )
 
         lessons = (
             Lesson.objects
             .filter(
-                id__in=attended_ids,
+                id__in=viewed_at.keys(),
                 module=module,
                 audience__in=["FREE", "BOTH"],
                 program_level=dashboard.program_level
@@ -289,14 +288,13 @@ class ModuleLessonsDetailView(APIView):
         # Map results
         results = []
         for lesson in lessons:
-            attendance = LessonAttendance.objects.filter(user=user, lesson=lesson).first()
             results.append({
                 "lesson_id": lesson.id,
                 "title": lesson.title,
                 "date": lesson.date,
                 "delivery": lesson.delivery,
                 "delivery_display": lesson.get_delivery_display(),
-                "viewed_at": attendance.timestamp if attendance else None,
+                "viewed_at": viewed_at.get(lesson.id),
                 "video_embed_url": lesson.video_embed_url,
                 "worksheet_link": lesson.worksheet_link,
                 "has_comment_access": lesson.allow_comments,
@@ -9,9 +9,5 @@ python manage.py migrate --noinput
 echo "Collecting static..."
 python manage.py collectstatic --noinput || true
 
-echo "Starting gunicorn..."
-exec gunicorn config.wsgi:application \
-  --bind 0.0.0.0:${PORT:-8000} \
-  --workers 3 \
-  --timeout 120 \
-  --log-file -
+echo "Starting gunicorn (${WEB_SERVER_MODE:-wsgi})..."
+exec gunicorn -c config/gunicorn.conf.py
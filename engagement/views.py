@@ -1,33 +1,32 @@
 # engagement/views.py
 from django.utils.timezone import now
-from django.db import IntegrityError
-from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from datetime import timedelta
 
+from common.views import AsyncAPIView
 from engagement.models import EngagementPing
 
 def _floor_to_minute(dt):
     return dt.replace(second=0, microsecond=0)
 
-class EngagementPingView(APIView):
-    permission_classes = [IsAuthenticated]
+class EngagementPingView(AsyncAPIView):
+    """Sent by the frontend every minute per open tab, so it is a native async view."""
 
-    def post(self, request):
+    async def post(self, request):
         user = request.user
-        client_ts = request.data.get("timestamp")  # optional ISO string from FE
-        page = request.data.get("page") or ""
-        meta = request.data.get("meta") or {}
+        data = self.get_data(request)
+        client_ts = data.get("timestamp")  # optional ISO string from FE
+        page = data.get("page") or ""
+        meta = data.get("meta") or {}
 
         # Use server time for trust; optionally parse client_ts if you want
         minute = _floor_to_minute(now())
 
-        try:
-            EngagementPing.objects.create(user=user, minute=minute, page=page, meta=meta)
-        except IntegrityError:
-            # Already have a ping this minute → ignore (idempotent)
-            pass
+        # Already have a ping this minute → ignore (idempotent). ON CONFLICT DO
+        # NOTHING instead of catching IntegrityError: one round trip, no error path
+        await EngagementPing.objects.abulk_create(
+            [EngagementPing(user=user, minute=minute, page=page, meta=meta)],
+            ignore_conflicts=True,
+        )
 
-        return Response({"ok": True})
+        return self.respond({"ok": True})
 
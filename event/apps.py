@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class EventConfig(AppConfig):
@@ -11,3 +12,7 @@ class EventConfig(AppConfig):
         # This is necessary to ensure that the signal handlers are connected
         # when the application starts.
         # The import should be done here to avoid circular imports.
+
+        # Re-create SQLite full-text triggers dropped by table rebuilds
+        from common.search_index import ensure_search_indexes
+        post_migrate.connect(ensure_search_indexes, sender=self)
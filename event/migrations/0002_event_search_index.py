@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-19 04:10
+
+from django.db import migrations
+
+from common.search_index import CreateSearchIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0001_initial'),
+    ]
+
+    operations = [
+        CreateSearchIndex(
+            model_name='event',
+            fields=[('title', 'A'), ('audience_description', 'B'), ('description', 'C'), ('venue', 'D'), ('tags', 'D')],
+        ),
+    ]
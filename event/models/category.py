@@ -1,6 +1,6 @@
 # event/models/category.py
 from django.db import models
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 
 class EventCategory(SlugModelMixin, models.Model):
     slug_source_field = 'name'
@@ -2,7 +2,7 @@
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 from .category import EventCategory
 from .base import EventType, EventTargetGroup, EventFormat, EventStatus
 from .speaker import EventSpeaker
@@ -10,6 +10,10 @@ from .speaker import EventSpeaker
 class Event(SlugModelMixin, models.Model):
     slug_source_field = 'title'
     slug_max_length = 200
+    # Weighted full-text document (common.search_index; built by migration 0002)
+    search_vector_fields = (
+        ('title', 'A'), ('audience_description', 'B'), ('description', 'C'), ('venue', 'D'), ('tags', 'D'),
+    )
 
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True, blank=True)
@@ -65,7 +69,13 @@ class Event(SlugModelMixin, models.Model):
 
     @property
     def is_full(self):
-        return self.capacity and self.registrations.count() >= self.capacity
+        """Uses an annotated `registration_count` when present (see EventViewSet.queryset)."""
+        if not self.capacity:
+            return False
+        count = getattr(self, 'registration_count', None)
+        if count is None:
+            count = self.registrations.count()
+        return count >= self.capacity
 
     @property
     def computed_status(self):
@@ -82,9 +92,14 @@ class Event(SlugModelMixin, models.Model):
     def speakers_list(self):
         """
         Returns a combined list of both user and guest speakers for easy display.
+        Uses prefetched `event_speakers__user` / `event_speakers__guest` when present.
         """
+        if 'event_speakers' in getattr(self, '_prefetched_objects_cache', {}):
+            event_speakers = self.event_speakers.all()
+        else:
+            event_speakers = self.event_speakers.select_related('user', 'guest')
         speakers = []
-        for es in self.event_speakers.select_related('user', 'guest'):
+        for es in event_speakers:
             if es.speaker_type == EventSpeaker.SpeakerType.USER and es.user:
                 speakers.append(es.user.get_full_name() or es.user.username)
             elif es.speaker_type == EventSpeaker.SpeakerType.GUEST and es.guest:
@@ -2,6 +2,9 @@
 
 from rest_framework import serializers
 
+# Defined in common.serializers; re-exported here for existing imports
+from common.serializers.choices import ChoiceDisplayField, ChoiceDisplaySerializerMixin  # noqa: F401
+
 
 class TimestampedSerializerMixin:
     """
@@ -10,21 +13,3 @@ class TimestampedSerializerMixin:
     """
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
-
-
-class ChoiceDisplayField(serializers.ChoiceField):
-    """
-    When used on a model choice field, adds an extra field <field>_display
-    to expose the human-readable version via `get_<field>_display`.
-    """
-
-    def __init__(self, choices, **kwargs):
-        super().__init__(choices=choices, **kwargs)
-
-    def bind(self, field_name, parent):
-        super().bind(field_name, parent)
-        display_method = f'get_{field_name}_display'
-        if hasattr(parent.Meta.model, display_method):
-            parent.fields[f'{field_name}_display'] = serializers.CharField(
-                source=display_method, read_only=True
-            )
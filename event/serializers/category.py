@@ -2,17 +2,16 @@
 
 from rest_framework import serializers
 from event.models import EventCategory
-from event.serializers.base import TimestampedSerializerMixin
 
 
-class EventCategorySerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
+class EventCategorySerializer(serializers.ModelSerializer):
     """
     Public-facing serializer for displaying event categories.
     """
     class Meta:
         model = EventCategory
-        fields = ['id', 'name', 'slug', 'description', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'slug', 'created_at', 'updated_at']
+        fields = ['id', 'name', 'slug', 'description']
+        read_only_fields = ['id', 'slug']
 
 
 class EventCategoryCreateUpdateSerializer(serializers.ModelSerializer):
@@ -5,21 +5,27 @@ from django.utils.timesince import timesince
 from django.utils import timezone
 
 from event.models import Event
+from event.models.base import EventFormat, EventStatus, EventTargetGroup, EventType
 from event.serializers.category import EventCategorySerializer
 from event.serializers.speaker import EventSpeakerSerializer, EventSpeakerCreateSerializer
-from event.serializers.base import TimestampedSerializerMixin, ChoiceDisplayField
+from event.serializers.base import TimestampedSerializerMixin, ChoiceDisplayField, ChoiceDisplaySerializerMixin
 from core.serializers import UserSerializer
+from common.search import SearchHitFieldsMixin
+from common.serializers import SparseFieldsetsMixin
 
 
-class EventSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
+class EventSerializer(
+    SparseFieldsetsMixin, SearchHitFieldsMixin, TimestampedSerializerMixin, ChoiceDisplaySerializerMixin,
+    serializers.ModelSerializer,
+):
     category = EventCategorySerializer(read_only=True)
     organizers = UserSerializer(many=True, read_only=True)
     speakers = EventSpeakerSerializer(source='event_speakers', many=True, read_only=True)
 
-    event_type = ChoiceDisplayField(choices=Event.EventType.choices)
-    target_group = ChoiceDisplayField(choices=Event.EventTargetGroup.choices)
-    format = ChoiceDisplayField(choices=Event.EventFormat.choices)
-    status = ChoiceDisplayField(choices=Event.EventStatus.choices)
+    event_type = ChoiceDisplayField(choices=EventType.choices)
+    target_group = ChoiceDisplayField(choices=EventTargetGroup.choices)
+    format = ChoiceDisplayField(choices=EventFormat.choices)
+    status = ChoiceDisplayField(choices=EventStatus.choices)
 
     published_on_display = serializers.SerializerMethodField()
     time_until_start = serializers.SerializerMethodField()
@@ -36,7 +42,7 @@ class EventSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
             'audience_description',
             'format', 'format_display',
             'status', 'status_display', 'computed_status',
-            'start_datetime', 'end_datetime',
+            'start_datetime', 'end_datetime', 'time_until_start',
             'event_link', 'venue',
             'tags', 'banner_image', 'attached_file',
             'is_published', 'is_featured', 'published_on', 'published_on_display',
@@ -47,10 +53,21 @@ class EventSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'slug', 'published_on_display', 'computed_status', 'speakers_list',
+            'slug', 'published_on_display', 'time_until_start', 'computed_status', 'speakers_list',
             'is_full', 'created_at', 'updated_at'
         ]
 
+    # ?fields= / ?expand= support (see common.serializers.SparseFieldsetsMixin)
+    expandable_fields = ('category', 'organizers', 'speakers')
+    field_select_related = {
+        'category': ('category',),
+    }
+    field_prefetch_related = {
+        'organizers': ('organizers',),
+        'speakers': ('event_speakers__user', 'event_speakers__guest'),
+        'speakers_list': ('event_speakers__user', 'event_speakers__guest'),
+    }
+
     def get_published_on_display(self, obj):
         return timesince(obj.published_on) + " ago" if obj.published_on else None
 
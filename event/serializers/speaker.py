@@ -3,7 +3,7 @@
 from rest_framework import serializers
 from event.models import Speaker, EventSpeaker
 from core.serializers import UserSerializer
-from .base import TimestampedSerializerMixin, ChoiceDisplayField
+from .base import TimestampedSerializerMixin, ChoiceDisplayField, ChoiceDisplaySerializerMixin
 
 
 class SpeakerSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
@@ -14,12 +14,12 @@ class SpeakerSerializer(TimestampedSerializerMixin, serializers.ModelSerializer)
         model = Speaker
         fields = [
             'id', 'name', 'bio', 'profile_image', 'website',
-            'created_at', 'updated_at'
+            'created_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at']
 
 
-class EventSpeakerSerializer(serializers.ModelSerializer):
+class EventSpeakerSerializer(ChoiceDisplaySerializerMixin, serializers.ModelSerializer):
     """
     Read-only serializer for speaker info attached to an event.
     Includes both guest and platform speakers.
@@ -0,0 +1,53 @@
+# event/tests/test_event_search.py
+import pytest
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from event.models import Event, EventRegistration
+
+EVENTS = "/api/event/events/"
+
+
+def _event(**kwargs):
+    kwargs.setdefault("description", "Details to follow.")
+    kwargs.setdefault("audience_description", "")
+    kwargs.setdefault("venue", "")
+    kwargs.setdefault("tags", [])
+    kwargs.setdefault("is_published", True)
+    kwargs.setdefault("published_on", timezone.now())
+    return baker.make(Event, start_datetime=timezone.now(), **kwargs)
+
+
+def _search(query, **params):
+    response = APIClient().get(EVENTS, {"search": query, **params})
+    assert response.status_code == 200
+    return response.json()["results"]
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_above_audience_above_description():
+    description = _event(title="Open evening", description="Try a robotics kit with our tutors.")
+    audience = _event(title="Workshop", audience_description="Robotics beginners aged 12-16")
+    title = _event(title="Robotics hackathon")
+    _event(title="Unrelated", description="Gardening club")
+
+    results = _search("robotics")
+
+    assert [r["id"] for r in results] == [title.pk, audience.pk, description.pk]
+    assert all(r["search_rank"] > 0 for r in results)
+
+
+@pytest.mark.django_db
+def test_unpublished_events_are_not_searchable():
+    _event(title="Robotics hackathon", is_published=False, published_on=None)
+
+    assert _search("robotics") == []
+
+
+@pytest.mark.django_db
+def test_is_full_uses_the_annotated_registration_count():
+    event = _event(title="Robotics hackathon", capacity=1)
+    baker.make(EventRegistration, event=event)
+
+    assert [r["is_full"] for r in _search("robotics")] == [True]
@@ -0,0 +1,25 @@
+# event/tests/test_registration_list.py
+import pytest
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from event.models import Event, EventRegistration
+
+
+@pytest.mark.django_db
+def test_registration_list_renders_the_nested_event(django_assert_max_num_queries):
+    staff = baker.make("core.User", is_staff=True)
+    event = baker.make(Event, capacity=2, start_datetime=timezone.now(), tags=[])
+    baker.make(EventRegistration, event=event, _quantity=2)
+    client = APIClient()
+    client.force_authenticate(staff)
+
+    with django_assert_max_num_queries(6):
+        response = client.get(f"/api/event/events/{event.slug}/registrations/")
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 2
+    assert all(r["event"]["is_full"] for r in results)
+    assert results[0]["event"]["event_type_display"] == event.get_event_type_display()
@@ -1,12 +1,16 @@
 # event/views/event.py
 
-from rest_framework import viewsets, filters, status
+from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from django.db.models import Count
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 
+from common.mixins import SparseFieldsetsQuerysetMixin
+from common.search import FullTextSearchFilter, SearchRankOrderingFilter
+
 from event.models import Event
 from event.serializers.event import EventSerializer, EventCreateUpdateSerializer
 from .base import (
@@ -17,6 +21,7 @@ from .base import (
 
 
 class EventViewSet(
+    SparseFieldsetsQuerysetMixin,
     StatusFilterMixin,
     DynamicSerializerMixin,
     viewsets.ModelViewSet
@@ -29,19 +34,16 @@ class EventViewSet(
     - Admins can publish events via a custom action.
     - Searchable and filterable by key event fields.
     """
-    queryset = Event.objects.select_related('category') \
-                            .prefetch_related(
-                                'organizers',
-                                'event_speakers__user',
-                                'event_speakers__guest'
-                            ).all()
+    # Related lookups come from EventSerializer.field_select_related / field_prefetch_related;
+    # the registration count feeds Event.is_full without a COUNT per row
+    queryset = Event.objects.annotate(registration_count=Count('registrations'))
 
     serializer_class = EventSerializer
     write_serializer_class = EventCreateUpdateSerializer
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = 'slug'
 
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, SearchRankOrderingFilter]
     filterset_fields = [
         'event_type', 'target_group', 'format', 'status',
         'category', 'is_published', 'is_featured'
@@ -5,7 +5,10 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, NotFound
 
-from event.models import EventRegistration
+from django.db.models import Count, Prefetch
+
+from common.pagination import RegisteredAtCursorPagination
+from event.models import Event, EventRegistration
 from event.serializers.registration import (
     EventRegistrationSerializer,
     EventRegistrationCreateSerializer,
@@ -26,7 +29,12 @@ class EventRegistrationViewSet(
     - Authenticated users can view their own registrations
     - Staff can view/search all, approve/decline, and mark attendance
     """
-    queryset = EventRegistration.objects.select_related('user', 'event')
+    # The nested EventSerializer reads the category, organizers, speakers and Event.is_full
+    queryset = EventRegistration.objects.select_related('user').prefetch_related(
+        Prefetch('event', queryset=Event.objects.select_related('category').prefetch_related(
+            'organizers', 'event_speakers__user', 'event_speakers__guest',
+        ).annotate(registration_count=Count('registrations'))),
+    )
     serializer_class = EventRegistrationSerializer
     write_serializer_class = EventRegistrationCreateSerializer
     permission_classes = [permissions.IsAuthenticated]   # default; overridden per-action in get_permissions()
@@ -37,6 +45,7 @@ class EventRegistrationViewSet(
     search_fields = ['event__title', 'user__email', 'email', 'first_name', 'last_name']
     ordering_fields = ['registered_at', 'updated_at']
     ordering = ['-registered_at']
+    pagination_class = RegisteredAtCursorPagination
 
     # ─────────────────────────────────────────────────────────────────────────
     # Permissions: allow public register; staff controls elsewhere
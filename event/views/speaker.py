@@ -16,13 +16,12 @@ class SpeakerViewSet(EventScopedQuerysetMixin, DynamicSerializerMixin, viewsets.
     
     - Staff can create/update/delete.
     - Anyone can view.
-    - Supports search, ordering, and slug-based lookup.
+    - Supports search and ordering.
     """
     queryset = Speaker.objects.all()
     serializer_class = SpeakerSerializer
     permission_classes = [IsStaffOrReadOnly]
 
-    lookup_field = 'slug'
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'bio']
     ordering_fields = ['name', 'created_at']
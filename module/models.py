@@ -2,7 +2,7 @@
 from django.db import models
 from django.conf import settings
 from django.utils.text import slugify
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 from django.core.exceptions import ValidationError
 import uuid
 
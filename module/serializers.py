@@ -9,6 +9,7 @@ from .models import (
 )
 from program.models import ProgramLevel
 from core.serializers import UserSerializer  # for lecturers
+from common.serializers import SparseFieldsetsMixin
 
 
 # ---------- Evaluation Component ----------
@@ -131,12 +132,12 @@ class ModuleMaterialCreateUpdateSerializer(serializers.ModelSerializer):
 
 
 # ---------- Module (READ) ----------
-class ModuleSerializer(serializers.ModelSerializer):
+class ModuleSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     slug = serializers.SlugField(read_only=True)
 
     # Nested read
     levels = ModuleLevelLinkSerializer(source='modulelevellink_set', many=True, read_only=True)
-    lecturers = ModuleLecturerSerializer(source='modulelecturer_set', many=True, read_only=True)
+    lecturers = ModuleLecturerSerializer(many=True, read_only=True)
     materials = ModuleMaterialSerializer(many=True, read_only=True)
     evaluations = EvaluationComponentSerializer(many=True, read_only=True)
 
@@ -150,6 +151,14 @@ class ModuleSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['slug', 'created_at', 'updated_at']
 
+    # ?fields= / ?expand= support (see common.serializers.SparseFieldsetsMixin)
+    expandable_fields = ('levels', 'lecturers', 'materials', 'evaluations')
+    field_prefetch_related = {
+        'levels': ('modulelevellink_set__level',),
+        'lecturers': ('lecturers__lecturer',),
+        'materials': ('materials',),
+        'evaluations': ('evaluations',),
+    }
 
 
 # ---------- Module (CREATE/UPDATE) ----------
@@ -206,7 +215,7 @@ class ModuleCreateUpdateSerializer(serializers.ModelSerializer):
 
         # Replace lecturers if provided
         if lecturers_data is not None:
-            instance.modulelecturer_set.all().delete()
+            instance.lecturers.all().delete()
             for item in lecturers_data:
                 ModuleLecturer.objects.create(module=instance, **item)
 
@@ -1,8 +1,9 @@
 # module/signals.py
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.utils.text import slugify
-from .models import Module
+from common.catalog import invalidate_catalog
+from .models import Module, ModuleMaterial, ModuleLevelLink, ModuleLecturer, EvaluationComponent
 from achievement.models import Badge
 
 @receiver(pre_save, sender=Module)
@@ -19,3 +20,13 @@ def auto_create_module_badge(sender, instance, created, **kwargs):
             achievement_type='module_completion',
             xp_reward=100
         )
+
+
+# ModuleLecturer / EvaluationComponent are rendered inside ModuleSerializer too.
+@receiver([post_save, post_delete], sender=Module)
+@receiver([post_save, post_delete], sender=ModuleMaterial)
+@receiver([post_save, post_delete], sender=ModuleLevelLink)
+@receiver([post_save, post_delete], sender=ModuleLecturer)
+@receiver([post_save, post_delete], sender=EvaluationComponent)
+def bump_catalog_on_module_change(sender, **kwargs):
+    invalidate_catalog()
@@ -0,0 +1,63 @@
+# module/tests/test_module_conditional_get.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from module.models import Module
+
+URL = "/api/module/modules/"
+
+
+@pytest.fixture
+def module(db):
+    return Module.objects.create(title="Intro to Python", description="Basics")
+
+
+@pytest.mark.django_db
+def test_list_sends_weak_etag_and_answers_304(module):
+    client = APIClient()
+    first = client.get(URL)
+    etag = first["ETag"]
+
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+    assert "Last-Modified" not in first
+
+    with CaptureQueriesContext(connection) as ctx:
+        second = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert second.status_code == 304
+    assert second["ETag"] == etag
+    assert not second.content
+    # Only the aggregate fingerprint query; nothing serialized.
+    assert len(ctx.captured_queries) == 1
+
+
+@pytest.mark.django_db
+def test_etag_changes_with_rows_and_query_string(module):
+    client = APIClient()
+    etag = client.get(URL)["ETag"]
+
+    assert client.get(URL, {"fields": "id,title"})["ETag"] != etag
+
+    Module.objects.create(title="Intro to SQL")
+    response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_retrieve_honours_if_modified_since(module):
+    client = APIClient()
+    url = f"{URL}{module.slug}/"
+    first = client.get(url)
+
+    assert first.status_code == 200
+    assert "Last-Modified" in first
+
+    second = client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+    assert second.status_code == 304
+
+    missing = client.get(f"{URL}nope/", HTTP_IF_NONE_MATCH="*")
+    assert missing.status_code == 404
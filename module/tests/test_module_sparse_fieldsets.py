@@ -0,0 +1,53 @@
+# module/tests/test_module_sparse_fieldsets.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from module.models import Module, EvaluationComponent
+
+URL = "/api/module/modules/"
+
+
+@pytest.fixture
+def modules(db):
+    items = []
+    for i in range(3):
+        module = Module.objects.create(title=f"Module {i}", description="Intro")
+        EvaluationComponent.objects.create(module=module, type="QUIZ", title=f"Quiz {i}")
+        items.append(module)
+    return items
+
+
+@pytest.mark.django_db
+def test_default_payload_renders_every_relation(modules):
+    response = APIClient().get(URL)
+
+    assert response.status_code == 200
+    row = response.data["results"][0]
+    for name in ("levels", "lecturers", "materials", "evaluations"):
+        assert name in row
+
+
+@pytest.mark.django_db
+def test_fields_param_limits_payload_and_skips_prefetches(modules):
+    with CaptureQueriesContext(connection) as ctx:
+        response = APIClient().get(URL, {"fields": "id,title,slug"})
+
+    assert response.status_code == 200
+    assert set(response.data["results"][0]) == {"id", "title", "slug"}
+    # ETag fingerprint + COUNT + page: no prefetches for unrendered relations.
+    assert len(ctx.captured_queries) == 3
+
+
+@pytest.mark.django_db
+def test_expand_opts_in_to_named_relations_only(modules):
+    with CaptureQueriesContext(connection) as ctx:
+        response = APIClient().get(URL, {"expand": "evaluations"})
+
+    assert response.status_code == 200
+    row = response.data["results"][0]
+    assert "title" in row and "evaluations" in row
+    assert not {"levels", "lecturers", "materials"} & set(row)
+    assert row["evaluations"][0]["type"] == "QUIZ"
+    assert len(ctx.captured_queries) == 4
@@ -6,8 +6,9 @@ from rest_framework.exceptions import MethodNotAllowed, PermissionDenied, NotFou
 from django.http import FileResponse, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 
-from common.mixins import ModuleScopedQueryMixin
+from common.mixins import ModuleScopedQueryMixin, SparseFieldsetsQuerysetMixin, ConditionalGetMixin
 from common.pagination import SmallSetPagination, LargeSetPagination
+from common.catalog import CatalogCacheMixin
 
 from .models import (
     Module, ModuleLevelLink, ModuleLecturer,
@@ -51,13 +52,14 @@ def user_can_access_material(user, material: ModuleMaterial) -> bool:
 
 
 # --- Module ViewSet ---
-class ModuleViewSet(viewsets.ModelViewSet):
-    queryset = Module.objects.prefetch_related(
-        'modulelevellink_set__level',
-        'modulelecturer_set__lecturer',
-        'materials',
-        'evaluations',
-    )
+class ModuleViewSet(
+    ConditionalGetMixin,
+    CatalogCacheMixin,
+    SparseFieldsetsQuerysetMixin,
+    viewsets.ModelViewSet
+):
+    # Nested prefetches come from ModuleSerializer.field_prefetch_related
+    queryset = Module.objects.all()
     permission_classes = [IsAdminOnlyOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description']
@@ -65,6 +67,7 @@ class ModuleViewSet(viewsets.ModelViewSet):
     ordering = ['title']
     lookup_field = 'slug'
     pagination_class = SmallSetPagination
+    etag_uses_catalog_version = True
 
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
@@ -154,7 +157,7 @@ class ModuleMaterialViewSet(ModuleScopedQueryMixin, viewsets.ModelViewSet):
         module = self._get_module_from_request(serializer)
         user = self.request.user
 
-        if getattr(user, "role", None) == 'LECTURER' and not module.modulelecturer_set.filter(lecturer=user).exists():
+        if getattr(user, "role", None) == 'LECTURER' and not module.lecturers.filter(lecturer=user).exists():
             raise PermissionDenied("You are not assigned to this module.")
 
         serializer.save(module=module)
@@ -162,7 +165,7 @@ class ModuleMaterialViewSet(ModuleScopedQueryMixin, viewsets.ModelViewSet):
     def perform_update(self, serializer):
         module = self._get_module_from_request(serializer, fallback_instance=self.get_object())
         user = self.request.user
-        if getattr(user, "role", None) == 'LECTURER' and not module.modulelecturer_set.filter(lecturer=user).exists():
+        if getattr(user, "role", None) == 'LECTURER' and not module.lecturers.filter(lecturer=user).exists():
             raise PermissionDenied("You are not assigned to this module.")
         serializer.save(module=module)
 
@@ -235,7 +238,7 @@ class EvaluationComponentViewSet(ModuleScopedQueryMixin, viewsets.ModelViewSet):
     def perform_create(self, serializer):
         module = self._get_module()
         user = self.request.user
-        if getattr(user, "role", None) == 'LECTURER' and not module.modulelecturer_set.filter(lecturer=user).exists():
+        if getattr(user, "role", None) == 'LECTURER' and not module.lecturers.filter(lecturer=user).exists():
             raise PermissionDenied("You are not assigned to this module.")
         serializer.save(module=module)
 
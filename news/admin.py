@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from news import counters
 from news.models import (
     NewsCategory,
     NewsPost,
@@ -12,7 +13,7 @@ from news.models import (
 # ---------- NewsCategory ----------
 @admin.register(NewsCategory)
 class NewsCategoryAdmin(admin.ModelAdmin):
-    list_display = ['name', 'slug', 'description']
+    list_display = ['name', 'slug', 'description', 'post_count']
     prepopulated_fields = {"slug": ("name",)}
     search_fields = ['name']
     ordering = ['name']
@@ -38,7 +39,10 @@ class NewsReactionInline(admin.TabularInline):
 # ---------- Actions ----------
 @admin.action(description="✅ Approve selected comments")
 def approve_selected_comments(modeladmin, request, queryset):
+    post_ids = set(queryset.values_list('post_id', flat=True))
     updated = queryset.update(is_approved=True)
+    # update() skips the save signals that keep NewsPost.comment_count
+    counters.reconcile_posts(post_ids)
     modeladmin.message_user(request, f"{updated} comment(s) approved.")
 
 
@@ -47,7 +51,7 @@ def approve_selected_comments(modeladmin, request, queryset):
 class NewsPostAdmin(admin.ModelAdmin):
     list_display = [
         'title', 'author', 'status', 'published_on', 'created_at',
-        'view_count', 'trending_status'
+        'view_count', 'like_count', 'comment_count', 'trending_status'
     ]
     list_filter = ['status', 'category', 'created_at', 'published_on']
     search_fields = ['title', 'summary', 'tags']
@@ -0,0 +1,101 @@
+# news/counters.py
+"""
+Denormalized counters: NewsPost.like_count / dislike_count / comment_count
+and NewsCategory.post_count.
+
+Listing posts or categories used to COUNT reactions, comments and posts per
+row. The counts are now stored and moved by the rows that contribute to
+them (NewsReaction, NewsComment, NewsPost; see CountedMixin.counter_key):
+news.signals compares a row's key as loaded with its key after save (or
+before delete) and applies the difference as `F()` updates, so concurrent
+reactions never overwrite each other. A full NewsPost.save() leaves the
+counter columns out (NewsPost.update_managed_fields) for the same reason.
+
+Bulk `QuerySet.update()` calls skip the signals; callers pass the affected
+rows to `reconcile_posts` / `reconcile_categories` instead, and
+`manage.py reconcile_news_counters` recounts everything.
+"""
+from collections import defaultdict
+
+from django.apps import apps
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from news.models.base import Status
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+def move(model, old, new):
+    """Apply the change of a row's counter key from `old` to `new` (either may be None)."""
+    if old == new:
+        return
+    deltas = defaultdict(dict)
+    for key, delta in ((old, -1), (new, 1)):
+        if key is not None and key[0] is not None:
+            pk, field = key
+            deltas[pk][field] = deltas[pk].get(field, 0) + delta
+    target = apps.get_model(model.counter_model)
+    for pk, fields in deltas.items():
+        changes = {
+            field: F(field) + delta if delta > 0 else Greatest(F(field) + delta, Value(0))
+            for field, delta in fields.items() if delta
+        }
+        if changes:
+            target.objects.filter(pk=pk).update(**changes)
+
+
+def _count(model, fk, **filters):
+    rows = (
+        model.objects.filter(**{fk: OuterRef('pk')}, **filters)
+        .order_by().values(fk).annotate(n=Count('pk')).values('n')
+    )
+    return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+
+def post_counts():
+    from news.models import NewsComment, NewsReaction
+
+    return {
+        'like_count': _count(NewsReaction, 'post', reaction=NewsReaction.ReactionType.LIKE),
+        'dislike_count': _count(NewsReaction, 'post', reaction=NewsReaction.ReactionType.DISLIKE),
+        'comment_count': _count(NewsComment, 'post', is_approved=True, is_deleted=False),
+    }
+
+
+def category_counts():
+    from news.models import NewsPost
+
+    return {'post_count': _count(NewsPost, 'category', status=Status.PUBLISHED)}
+
+
+def _reconcile(queryset, counts, batch_size):
+    """Recount the rows of `queryset` whose stored counters drifted; returns how many were fixed."""
+    expected = {f'expected_{field}': value for field, value in counts.items()}
+    drift = Q()
+    for field in counts:
+        drift |= ~Q(**{field: F(f'expected_{field}')})
+    drifted = queryset.annotate(**expected).filter(drift).order_by('pk').values_list('pk', flat=True)
+
+    fixed, last_pk = 0, None
+    while True:
+        chunk = drifted if last_pk is None else drifted.filter(pk__gt=last_pk)
+        pks = list(chunk[:batch_size])
+        if not pks:
+            return fixed
+        fixed += queryset.model.objects.filter(pk__in=pks).update(**counts)
+        last_pk = pks[-1]
+
+
+def reconcile_posts(pks=None, batch_size=RECONCILE_BATCH_SIZE):
+    from news.models import NewsPost
+
+    posts = NewsPost.objects.all() if pks is None else NewsPost.objects.filter(pk__in=pks)
+    return _reconcile(posts, post_counts(), batch_size)
+
+
+def reconcile_categories(pks=None, batch_size=RECONCILE_BATCH_SIZE):
+    from news.models import NewsCategory
+
+    categories = NewsCategory.objects.all() if pks is None else NewsCategory.objects.filter(pk__in=pks)
+    return _reconcile(categories, category_counts(), batch_size)
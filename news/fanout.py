@@ -0,0 +1,177 @@
+# news/fanout.py
+"""
+Publish fan-out: tell a post's subscribers that it is out.
+
+Publishing (NewsPostViewSet.publish) queues news.tasks.notify_subscribers
+after commit. The task walks the users subscribed to the post's category or
+its author (each user once, the author excluded) in pk-ordered chunks of
+FANOUT_CHUNK_SIZE, reading plain rows joined to their
+NotificationPreference, so memory stays flat however many subscribers a
+category has. Per chunk it bulk-creates the in-app Notification rows and
+queues the emails through the outbox (core.utils.email.queue_emails), in
+one transaction that also moves NewsPost.subscribers_notified_through to
+the chunk's last user pk.
+
+Preferences: users without a NotificationPreference get both channels.
+Otherwise `in_app` / `email` pick the channels, a non-empty `types` list
+must include ARTICLE, and emails falling in quiet hours wait in the outbox
+until they end.
+
+A post is fanned out once. Each chunk is read and delivered while holding
+the post's row lock, so a duplicate task waits and then continues after
+the cursor instead of repeating a chunk; an interrupted run (the task is
+acked late and retried) resumes after the last committed chunk.
+NewsPost.subscribers_notified_at is set after the last chunk, and
+re-publishing or a later duplicate task sends nothing.
+"""
+import logging
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FANOUT_CHUNK_SIZE = 1000
+
+PREFERENCE_FIELDS = ('email', 'in_app', 'types', 'quiet_hours_start', 'quiet_hours_end')
+
+
+def queue_fanout(post):
+    transaction.on_commit(lambda: _dispatch_fanout(post.pk))
+
+
+def _dispatch_fanout(post_id):
+    from news.tasks import notify_subscribers
+
+    try:
+        notify_subscribers.delay(post_id)
+    except Exception:
+        logger.warning("Could not enqueue subscriber notifications for news post %s", post_id)
+
+
+def subscribers(post):
+    """Active users subscribed to the post's category or author, once each, by pk."""
+    from news.models import NewsSubscriber
+
+    targets = Q()
+    if post.category_id:
+        targets |= Q(category_id=post.category_id)
+    if post.author_id:
+        targets |= Q(author_id=post.author_id)
+    if not targets:
+        return get_user_model().objects.none()
+    subscribed = NewsSubscriber.objects.filter(targets).values('user_id')
+    users = get_user_model().objects.filter(pk__in=subscribed, is_active=True)
+    if post.author_id:
+        users = users.exclude(pk=post.author_id)
+    return users.order_by('pk')
+
+
+def _rows(users, after, chunk_size):
+    """The next chunk of recipient rows (user + preference columns) with pk above `after`."""
+    columns = ['pk', 'email', 'first_name', *(f'notification_preferences__{f}' for f in PREFERENCE_FIELDS)]
+    chunk = users if after is None else users.filter(pk__gt=after)
+    return list(chunk.values(*columns)[:chunk_size])
+
+
+def _preference(row, field, default):
+    value = row[f'notification_preferences__{field}']
+    return default if value is None else value
+
+
+def _wants_articles(row):
+    from notification.models import NotificationType
+
+    types = _preference(row, 'types', [])
+    return not types or NotificationType.ARTICLE in types
+
+
+def _quiet_until(row, now):
+    """End of the recipient's quiet hours if `now` falls inside them, else None."""
+    start, end = row['notification_preferences__quiet_hours_start'], row['notification_preferences__quiet_hours_end']
+    if start is None or end is None or start == end:
+        return None
+    local = timezone.localtime(now)
+    current = local.time()
+    quiet = start <= current < end if start < end else (current >= start or current < end)
+    if not quiet:
+        return None
+    until = timezone.make_aware(datetime.combine(local.date(), end), local.tzinfo)
+    return until if until > now else until + timedelta(days=1)
+
+
+def _post_link(post):
+    return f"{settings.FRONTEND_URL.rstrip('/')}/news/{post.slug}"
+
+
+def _email(post, row, link):
+    summary = f"{post.summary}\n\n" if post.summary else ""
+    body = (
+        f"Hello {row['first_name'] or 'there'},\n\n"
+        f"A new article you follow has been published: {post.title}\n\n"
+        f"{summary}"
+        f"Read it here: {link}\n\n"
+        "— The Nebula Code Academy Team"
+    )
+    return dict(subject=f"New article: {post.title}"[:255], body=body, recipient=row['email'])
+
+
+def _deliver(post, rows, now):
+    from core.utils.email import queue_emails
+    from notification.models import DeliveryMethod, Notification, NotificationType
+
+    link = _post_link(post)
+    title = post.title[:255]
+    message = post.summary or f"{post.title} has just been published."
+    notifications, emails = [], []
+    for row in rows:
+        if not _wants_articles(row):
+            continue
+        if _preference(row, 'in_app', True):
+            notifications.append(Notification(
+                recipient_id=row['pk'], type=NotificationType.ARTICLE, title=title, message=message,
+                link=link, delivery_method=DeliveryMethod.IN_APP, sent_at=now,
+            ))
+        if _preference(row, 'email', True) and row['email']:
+            email = _email(post, row, link)
+            quiet_until = _quiet_until(row, now)
+            if quiet_until is not None:
+                email['next_attempt_at'] = quiet_until
+            emails.append(email)
+
+    Notification.objects.bulk_create(notifications)
+    if emails:
+        queue_emails(emails)
+    return len(notifications), len(emails)
+
+
+def fan_out(post_id, chunk_size=None):
+    """Notify the subscribers of a published post; returns (notifications, emails) created."""
+    from news.models import NewsPost, Status
+
+    pending = NewsPost.objects.filter(pk=post_id, status=Status.PUBLISHED, subscribers_notified_at__isnull=True)
+    post = pending.only('slug', 'title', 'summary', 'category', 'author').first()
+    if post is None:
+        return 0, 0
+
+    users = subscribers(post)
+    chunk_size = max(1, chunk_size or FANOUT_CHUNK_SIZE)
+    now = timezone.now()
+    notified = emailed = 0
+    while True:
+        with transaction.atomic():
+            claim = pending.select_for_update().values('subscribers_notified_through').first()
+            if claim is None:  # finished by a concurrent run, or unpublished meanwhile
+                return notified, emailed
+            rows = _rows(users, claim['subscribers_notified_through'], chunk_size)
+            if not rows:
+                pending.update(subscribers_notified_at=now)
+                return notified, emailed
+            in_app, email = _deliver(post, rows, now)
+            pending.update(subscribers_notified_through=rows[-1]['pk'])
+        notified += in_app
+        emailed += email
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from news import counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount NewsPost like/dislike/comment counters and NewsCategory post counts "
+        "from their source rows, rewriting only the rows that drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=counters.RECONCILE_BATCH_SIZE,
+                            help='Rows recounted per UPDATE.')
+
+    def handle(self, *args, **opts):
+        started = time.perf_counter()
+        size = max(1, opts['batch_size'])
+        posts = counters.reconcile_posts(batch_size=size)
+        categories = counters.reconcile_categories(batch_size=size)
+        self.stdout.write(self.style.SUCCESS(
+            f"Fixed counters on {posts} post(s) and {categories} categor{'y' if categories == 1 else 'ies'} "
+            f"in {time.perf_counter() - started:.1f}s."
+        ))
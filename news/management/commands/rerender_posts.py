@@ -0,0 +1,60 @@
+# news/management/commands/rerender_posts.py
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from news import rendering
+from news.models import NewsPost
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-render NewsPost.content_html for posts whose content_hash is stale "
+        "(e.g. after bumping news.rendering.RENDERER_VERSION), in a process pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Re-render every post, not just stale ones.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='Worker processes (default: CPU count; 0 renders in this process).')
+        parser.add_argument('--batch-size', type=int, default=50, help='Posts per worker task and per UPDATE.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the posts that would be re-rendered.')
+
+    def handle(self, *args, **opts):
+        started = time.perf_counter()
+        pending = self._pending(opts['all'])
+        if opts['dry_run'] or not pending:
+            self.stdout.write(f"{len(pending)} post(s) to re-render.")
+            return
+
+        size = max(1, opts['batch_size'])
+        batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+        if opts['workers'] > 0:
+            # spawn: workers only import news.rendering and never inherit DB connections
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=opts['workers'], mp_context=context) as pool:
+                updated = sum(self._store(rendered) for rendered in pool.map(rendering.render_batch, batches))
+        else:
+            updated = sum(self._store(rendering.render_batch(batch)) for batch in batches)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Re-rendered {updated} post(s) in {time.perf_counter() - started:.1f}s "
+            f"(renderer v{rendering.RENDERER_VERSION})."
+        ))
+
+    def _pending(self, everything):
+        """[(pk, content)] of the posts to render; hashing is cheap next to markdown."""
+        rows = NewsPost.objects.order_by('pk').values_list('pk', 'content', 'content_hash')
+        return [
+            (pk, content) for pk, content, stored in rows.iterator(chunk_size=500)
+            if everything or stored != rendering.content_hash(content)
+        ]
+
+    def _store(self, rendered):
+        # bulk_update skips save(): updated_at stays, nothing else is re-derived
+        posts = [NewsPost(pk=pk, content_hash=digest, content_html=html) for pk, digest, html in rendered]
+        NewsPost.objects.bulk_update(posts, ['content_hash', 'content_html'])
+        return len(posts)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newspost',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-19 04:10
+
+from django.db import migrations
+
+from common.search_index import CreateSearchIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_newspost_content_hash'),
+    ]
+
+    operations = [
+        CreateSearchIndex(
+            model_name='newspost',
+            fields=[('title', 'A'), ('summary', 'B'), ('content', 'C'), ('tags', 'D')],
+        ),
+    ]
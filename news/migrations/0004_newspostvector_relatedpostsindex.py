@@ -0,0 +1,68 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:45
+
+import django.db.models.deletion
+from django.db import DatabaseError, migrations, models, transaction
+
+# news.related.DIMENSIONS when this column was created
+EMBEDDING_DIMENSIONS = 1024
+
+
+def add_pgvector_embedding(apps, schema_editor):
+    """
+    Optional: an `embedding` vector column with an HNSW cosine index, on
+    PostgreSQL servers that have the pgvector extension (and let us enable it).
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'vector'")
+        if cursor.fetchone() is None:
+            return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    except DatabaseError:
+        return  # not allowed to create extensions: numpy neighbours only
+    schema_editor.execute(
+        f'ALTER TABLE "news_newspostvector" ADD COLUMN "embedding" vector({EMBEDDING_DIMENSIONS})'
+    )
+    schema_editor.execute(
+        'CREATE INDEX "news_newspostvector_embedding_hnsw" ON "news_newspostvector" '
+        'USING hnsw ("embedding" vector_cosine_ops)'
+    )
+
+
+def drop_pgvector_embedding(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('ALTER TABLE "news_newspostvector" DROP COLUMN IF EXISTS "embedding"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_newspost_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NewsPostVector',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='tfidf', serialize=False, to='news.newspost')),
+                ('vector', models.BinaryField()),
+                ('source_hash', models.CharField(max_length=64)),
+                ('related', models.JSONField(blank=True, default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RelatedPostsIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimensions', models.PositiveIntegerField()),
+                ('documents', models.PositiveIntegerField(default=0)),
+                ('doc_freq', models.BinaryField()),
+                ('built_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(add_pgvector_embedding, drop_pgvector_embedding),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:51
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count(model, fk, **filters):
+    rows = (
+        model.objects.filter(**{fk: OuterRef('pk')}, **filters)
+        .order_by().values(fk).annotate(n=Count('pk')).values('n')
+    )
+    return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+
+def backfill_counters(apps, schema_editor):
+    NewsPost = apps.get_model('news', 'NewsPost')
+    NewsCategory = apps.get_model('news', 'NewsCategory')
+    NewsReaction = apps.get_model('news', 'NewsReaction')
+    NewsComment = apps.get_model('news', 'NewsComment')
+    NewsPost.objects.update(
+        like_count=_count(NewsReaction, 'post', reaction='LIKE'),
+        dislike_count=_count(NewsReaction, 'post', reaction='DISLIKE'),
+        comment_count=_count(NewsComment, 'post', is_approved=True, is_deleted=False),
+    )
+    NewsCategory.objects.update(post_count=_count(NewsPost, 'category', status='PUBLISHED'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_newspostvector_relatedpostsindex'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newscategory',
+            name='post_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='newspost',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='newspost',
+            name='dislike_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='newspost',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_post_and_category_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newspost',
+            name='subscribers_notified_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
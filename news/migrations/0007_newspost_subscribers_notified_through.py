@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 04:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_newspost_subscribers_notified_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newspost',
+            name='subscribers_notified_through',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
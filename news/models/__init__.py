@@ -5,3 +5,4 @@ from .post import NewsPost
 from .comment import NewsComment
 from .reaction import NewsReaction
 from .subscriber import NewsSubscriber
+from .related import NewsPostVector, RelatedPostsIndex
@@ -5,3 +5,26 @@ class Status(models.TextChoices):
     DRAFT = 'DRAFT', 'Draft'
     PUBLISHED = 'PUBLISHED', 'Published'
     PENDING = 'PENDING', 'Pending Approval'
+
+
+class CountedMixin:
+    """
+    A row that adds one to a denormalized counter elsewhere (news.counters).
+
+    `counter_key()` names the (row pk, field) it currently counts towards on
+    `counter_model`, or None. The key as loaded is kept on the instance, so
+    news.signals can move the count on save / delete with F() updates.
+    """
+    counter_model = None
+    counter_fields = ()
+
+    def counter_key(self):
+        raise NotImplementedError
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        attnames = {cls._meta.get_field(name).attname for name in cls.counter_fields}
+        if attnames.issubset(field_names):
+            instance._counted = instance.counter_key()
+        return instance
@@ -1,6 +1,6 @@
 # news/models/category.py
 from django.db import models
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 
 class NewsCategory(SlugModelMixin, models.Model):
     slug_source_field = 'name'
@@ -10,6 +10,8 @@ class NewsCategory(SlugModelMixin, models.Model):
     slug = models.SlugField(max_length=100, unique=True, blank=True)
     description = models.TextField(blank=True)
     icon = models.CharField(max_length=100, blank=True, help_text="Optional CSS icon class or emoji")
+    # Published posts in this category (news.counters)
+    post_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ['name']
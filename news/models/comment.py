@@ -1,8 +1,13 @@
 # news/models/comment.py
 from django.db import models
 from django.conf import settings
+from .base import CountedMixin
+
+class NewsComment(CountedMixin, models.Model):
+    # Approved, not deleted comments are counted on NewsPost.comment_count
+    counter_model = 'news.NewsPost'
+    counter_fields = ('post', 'is_approved', 'is_deleted')
 
-class NewsComment(models.Model):
     post = models.ForeignKey(
         'news.NewsPost',
         on_delete=models.CASCADE,
@@ -47,6 +52,11 @@ class NewsComment(models.Model):
         status = "Deleted" if self.is_deleted else "Active"
         return f"[{status}] Comment by {self.user.email} on {self.post.title}"
 
+    def counter_key(self):
+        if self.is_approved and not self.is_deleted:
+            return (self.post_id, 'comment_count')
+        return None
+
     @property
     def nesting_depth(self):
         depth = 0
@@ -1,19 +1,26 @@
 # news/models/post.py
-# news/models/post.py
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
 from django.utils.html import mark_safe
-from common.mixins import SlugModelMixin
-from .base import Status
-
-# 3rd-party
-import markdown as md
-import re
+from common.models import SlugModelMixin
+from news import rendering
+from .base import CountedMixin, Status
 
-class NewsPost(SlugModelMixin, models.Model):
+class NewsPost(CountedMixin, SlugModelMixin, models.Model):
     slug_source_field = 'title'
     slug_max_length = 200
+    # Weighted full-text document (common.search_index; built by migration 0003)
+    search_vector_fields = (('title', 'A'), ('summary', 'B'), ('content', 'C'), ('tags', 'D'))
+    # Published posts are counted on NewsCategory.post_count
+    counter_model = 'news.NewsCategory'
+    counter_fields = ('category', 'status')
+    # Columns only moved by queryset updates (news.counters, news.view_counts,
+    # news.fanout); a full save() of an existing row leaves them alone
+    update_managed_fields = (
+        'view_count', 'like_count', 'dislike_count', 'comment_count',
+        'subscribers_notified_at', 'subscribers_notified_through',
+    )
 
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True, blank=True)
@@ -44,6 +51,8 @@ class NewsPost(SlugModelMixin, models.Model):
 
     # Cached rendered HTML (auto-filled on save)
     content_html = models.TextField(blank=True)
+    # news.rendering.content_hash() of what content_html was rendered from
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
 
     image = models.ImageField(
         upload_to='news/images/',
@@ -67,12 +76,21 @@ class NewsPost(SlugModelMixin, models.Model):
     allow_comments = models.BooleanField(default=True)
     view_count = models.PositiveIntegerField(default=0)
 
+    # Denormalized counters (news.counters); `manage.py reconcile_news_counters` repairs drift
+    like_count = models.PositiveIntegerField(default=0, editable=False)
+    dislike_count = models.PositiveIntegerField(default=0, editable=False)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+
     # SEO
     meta_title = models.CharField(max_length=255, blank=True)
     meta_description = models.CharField(max_length=512, blank=True)
 
     # Publish control
     published_on = models.DateTimeField(null=True, blank=True)
+    # Set once every subscriber was told about the post (news.fanout)
+    subscribers_notified_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # pk of the last subscriber told so far; an interrupted fan-out resumes after it
+    subscribers_notified_through = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -81,26 +99,17 @@ class NewsPost(SlugModelMixin, models.Model):
         ordering = ['-published_on', '-created_at']
 
     # ---------- Rendering ----------
-    def _render_markdown(self) -> str:
-        return md.markdown(
-            self.content or "",
-            extensions=[
-                "extra",       # tables, lists, etc.
-                "nl2br",       # keep \n as <br>
-                "sane_lists",
-                "smarty",      # typographic quotes/dashes
-            ]
-        )
-
-    def _extract_meta_description(self) -> str:
+    def render_content(self, force=False) -> bool:
         """
-        Make a readable meta description from rendered HTML.
-        Keeps existing behavior but strips tags for cleaner SEO.
+        Render content_html unless it was already rendered from this exact
+        content (see news.rendering). Returns whether it rendered.
         """
-        html = self._render_markdown()
-        text = re.sub(r"<[^>]+>", " ", html)  # strip tags
-        text = " ".join(text.split()).strip()
-        return (text[:500] + '...') if len(text) > 500 else text
+        digest = rendering.content_hash(self.content)
+        if not force and digest == self.content_hash:
+            return False
+        self.content_html = rendering.render_markdown(self.content)
+        self.content_hash = digest
+        return True
 
     # ---------- Save ----------
     def save(self, *args, **kwargs):
@@ -108,18 +117,33 @@ class NewsPost(SlugModelMixin, models.Model):
         if self.status == Status.PUBLISHED and not self.published_on:
             self.published_on = timezone.now()
 
+        # Render & cache HTML; saves limited to other fields leave it alone
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            if self.render_content() and update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'content_html', 'content_hash'}
+
         # SEO defaults
         if not self.meta_title:
             self.meta_title = (self.title or "")[:255]
         if not self.meta_description:
-            # Prefer summary if present; otherwise derive from content
-            self.meta_description = (self.summary or self._extract_meta_description())[:512]
-
-        # Render & cache HTML
-        self.content_html = self._render_markdown()
+            # Prefer summary if present; otherwise derive from the rendered content
+            self.meta_description = (self.summary or rendering.meta_description(self.content_html))[:512]
+
+        # Writing back stale in-memory counters would drop concurrent F() updates
+        if update_fields is None and not self._state.adding and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.update_managed_fields
+            ]
 
         super().save(*args, **kwargs)
 
+    def counter_key(self):
+        if self.status == Status.PUBLISHED and self.category_id:
+            return (self.category_id, 'post_count')
+        return None
+
     @property
     def is_visible(self):
         return (
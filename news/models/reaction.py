@@ -1,8 +1,12 @@
 # news/models/reaction.py
 from django.db import models
 from django.conf import settings
+from .base import CountedMixin
+
+class NewsReaction(CountedMixin, models.Model):
+    counter_model = 'news.NewsPost'
+    counter_fields = ('post', 'reaction')
 
-class NewsReaction(models.Model):
     class ReactionType(models.TextChoices):
         LIKE = 'LIKE', '👍 Like'
         DISLIKE = 'DISLIKE', '👎 Dislike'
@@ -33,5 +37,9 @@ class NewsReaction(models.Model):
         unique_together = ('post', 'user')
         ordering = ['-reacted_at']
 
+    def counter_key(self):
+        field = 'like_count' if self.reaction == self.ReactionType.LIKE else 'dislike_count'
+        return (self.post_id, field)
+
     def __str__(self):
         return f"{self.user.email} reacted {self.reaction} on '{self.post.title}'"
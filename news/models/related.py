@@ -0,0 +1,42 @@
+# news/models/related.py
+from django.db import models
+
+
+class NewsPostVector(models.Model):
+    """
+    TF-IDF vector of a post and its precomputed nearest neighbours
+    (news.related). On PostgreSQL with the pgvector extension the table
+    also carries an `embedding vector(n)` column, managed outside the ORM.
+    """
+    post = models.OneToOneField(
+        'news.NewsPost',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='tfidf'
+    )
+    # float32, L2-normalised, news.related.DIMENSIONS long
+    vector = models.BinaryField()
+    # news.related.source_hash() of the text the vector was built from
+    source_hash = models.CharField(max_length=64)
+    # [[post id, cosine similarity], ...] best first
+    related = models.JSONField(default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"TF-IDF vector for post {self.post_id}"
+
+
+class RelatedPostsIndex(models.Model):
+    """
+    The vector space of the last full build: document frequencies per hashed
+    term, so posts published in between are vectorised with the same IDF.
+    A single row.
+    """
+    dimensions = models.PositiveIntegerField()
+    documents = models.PositiveIntegerField(default=0)
+    # float32 document frequency per dimension
+    doc_freq = models.BinaryField()
+    built_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Related posts index ({self.documents} posts, {self.built_at:%Y-%m-%d %H:%M})"
@@ -1,7 +1,7 @@
 # news/models.py
 from django.db import models
 from django.conf import settings
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 from django.utils import timezone
 
 class Status(models.TextChoices):
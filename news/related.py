@@ -0,0 +1,322 @@
+# news/related.py
+"""
+"Related posts" for NewsPost from TF-IDF vectors built locally with numpy.
+
+Each published post is turned into a bag of hashed terms (title, summary,
+tags and content, the title counting most), weighted by TF-IDF and
+L2-normalised, so the dot product of two vectors is their cosine
+similarity. Feature hashing (DIMENSIONS buckets) keeps the vector space
+fixed, so a post published after the last build is vectorised with the
+stored document frequencies (RelatedPostsIndex) without re-vocabularising.
+
+- `rebuild()` (manage.py build_related_posts, nightly beat task): vectorise
+  every published post, compute each post's top-k neighbours in row blocks
+  (one matrix product per block) and store them on NewsPostVector.
+- `update_post()` (news.tasks.update_related_posts, queued by news.signals
+  when a published post's text changes): vectorise one post, pick its
+  neighbours and slot it into the lists of the CANDIDATES most similar posts.
+- `related_posts()`: the stored list for the detail endpoint, one lookup
+  regardless of corpus size.
+
+On PostgreSQL with the pgvector extension (see migration 0004) vectors are
+also written to an `embedding vector(DIMENSIONS)` column with an HNSW index,
+and `update_post()` asks the database for the nearest posts instead of
+loading every vector.
+
+numpy is imported on first use: news.signals loads this module at setup.
+"""
+import hashlib
+import re
+from collections import Counter
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections, transaction
+
+# Changing these changes the vector space: rebuild afterwards. DIMENSIONS is
+# also frozen into the pgvector column (migration 0004).
+VECTOR_VERSION = 1
+DIMENSIONS = 1024
+FIELD_WEIGHTS = (('title', 3), ('summary', 2), ('tags', 2), ('content', 1))
+
+MIN_SIMILARITY = 0.05
+CANDIDATES = 50
+BLOCK_ROWS = 512
+EMBEDDING_COLUMN = 'embedding'
+
+_TOKEN_RE = re.compile(r"[a-z0-9]{2,}")
+_STOPWORDS = frozenset("""
+    about after again all also an and any are as at be been before being but by can could did do does
+    for from had has have he her his how if in into is it its just more most my no not of on one only or
+    other our out over she so some such than that the their them then there these they this those to too
+    up us was we were what when where which while who will with would you your
+""".split())
+
+_pgvector_cache = {}
+
+
+# ----- vectors -----
+
+def _text(value):
+    if isinstance(value, (list, tuple)):
+        return ' '.join(str(item) for item in value)
+    return value or ''
+
+
+def source_hash(title, summary, content, tags):
+    digest = hashlib.sha256(f"{VECTOR_VERSION}\0".encode())
+    for value in (title, summary, content, tags):
+        digest.update(_text(value).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=65536)
+def _bucket(token):
+    # blake2b, not hash(): buckets must agree across processes
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), 'little') % DIMENSIONS
+
+
+def term_counts(title, summary, content, tags):
+    """{bucket: weighted count} over the post's fields."""
+    fields = {'title': title, 'summary': summary, 'content': content, 'tags': tags}
+    counts = Counter()
+    for name, weight in FIELD_WEIGHTS:
+        for token in _TOKEN_RE.findall(_text(fields[name]).lower()):
+            if token not in _STOPWORDS:
+                counts[_bucket(token)] += weight
+    return counts
+
+
+def count_matrix(rows):
+    """[(title, summary, content, tags)] -> float32 (n, DIMENSIONS) weighted term counts."""
+    import numpy as np
+
+    matrix = np.zeros((len(rows), DIMENSIONS), dtype=np.float32)
+    for i, row in enumerate(rows):
+        counts = term_counts(*row)
+        if counts:
+            np.add.at(matrix[i], np.fromiter(counts.keys(), dtype=np.int64),
+                      np.fromiter(counts.values(), dtype=np.float32))
+    return matrix
+
+
+def tfidf(counts, doc_freq, documents):
+    """Sublinear TF x smoothed IDF, rows L2-normalised (all-zero rows stay zero)."""
+    import numpy as np
+
+    idf = np.log((1.0 + documents) / (1.0 + doc_freq)) + 1.0
+    vectors = np.log1p(counts) * idf.astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def top_neighbours(vectors, ids, k):
+    """For every row, [[id, similarity], ...] of its k most similar other rows, best first."""
+    import numpy as np
+
+    n = len(ids)
+    ids = np.asarray(ids)
+    k = min(k, n - 1)
+    if k <= 0:
+        return [[] for _ in range(n)]
+    result = []
+    for start in range(0, n, BLOCK_ROWS):
+        block = vectors[start:start + BLOCK_ROWS] @ vectors.T
+        rows = np.arange(block.shape[0])
+        block[rows, rows + start] = -1.0  # never yourself
+        best = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(block, best, axis=1)
+        order = np.argsort(-scores, axis=1)
+        best, scores = np.take_along_axis(best, order, axis=1), np.take_along_axis(scores, order, axis=1)
+        for row_ids, row_scores in zip(ids[best], scores):
+            result.append([
+                [int(pk), round(float(score), 4)]
+                for pk, score in zip(row_ids, row_scores) if score >= MIN_SIMILARITY
+            ])
+    return result
+
+
+def _merge_neighbour(related, pk, score, k):
+    """`related` with (pk, score) inserted in rank order, capped at k."""
+    merged = [pair for pair in related if pair[0] != pk]
+    merged.append([pk, score])
+    merged.sort(key=lambda pair: -pair[1])
+    return merged[:k]
+
+
+# ----- storage -----
+
+def top_k():
+    return settings.NEWS_RELATED_POSTS
+
+
+def _published_posts():
+    from news.models import NewsPost
+    from news.models.base import Status
+
+    return NewsPost.objects.filter(status=Status.PUBLISHED, published_on__isnull=False)
+
+
+def pgvector_enabled(using='default'):
+    """True when the vector table has the pgvector `embedding` column (PostgreSQL only)."""
+    from news.models import NewsPostVector
+
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return False
+    key = (using, connection.settings_dict['NAME'])
+    if key not in _pgvector_cache:
+        with connection.cursor() as cursor:
+            columns = connection.introspection.get_table_description(cursor, NewsPostVector._meta.db_table)
+        _pgvector_cache[key] = any(column.name == EMBEDDING_COLUMN for column in columns)
+    return _pgvector_cache[key]
+
+
+def _write_embeddings(pairs):
+    """[(post id, vector)] into the pgvector column."""
+    from pgvector import Vector
+    from news.models import NewsPostVector
+
+    connection = connections['default']
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"UPDATE {qn(NewsPostVector._meta.db_table)} SET {qn(EMBEDDING_COLUMN)} = %s::vector "
+            f"WHERE {qn('post_id')} = %s",
+            [(Vector(vector).to_text(), pk) for pk, vector in pairs],
+        )
+
+
+def _save_vectors(rows):
+    """Upsert [NewsPostVector] (vector, hash and neighbours)."""
+    from news.models import NewsPostVector
+
+    NewsPostVector.objects.bulk_create(
+        rows, update_conflicts=True, unique_fields=['post'],
+        update_fields=['vector', 'source_hash', 'related', 'updated_at'],
+    )
+
+
+def rebuild(batch_size=500):
+    """Vectorise every published post and store its top-k neighbours. Returns the post count."""
+    import numpy as np
+    from news.models import NewsPostVector, RelatedPostsIndex
+
+    ids, texts = [], []
+    rows = _published_posts().order_by('pk').values_list('pk', 'title', 'summary', 'content', 'tags')
+    for pk, *text in rows.iterator(chunk_size=batch_size):
+        ids.append(pk)
+        texts.append(text)
+    counts = count_matrix(texts)
+    doc_freq = (counts > 0).sum(axis=0).astype(np.float32)
+    vectors = tfidf(counts, doc_freq, len(ids))
+    del counts
+    neighbours = top_neighbours(vectors, ids, top_k())
+
+    with transaction.atomic():
+        for start in range(0, len(ids), batch_size):
+            _save_vectors([
+                NewsPostVector(post_id=pk, vector=vectors[i].tobytes(), source_hash=source_hash(*texts[i]),
+                               related=neighbours[i])
+                for i, pk in enumerate(ids[start:start + batch_size], start)
+            ])
+            if pgvector_enabled():
+                _write_embeddings(zip(ids[start:start + batch_size], vectors[start:start + batch_size]))
+        NewsPostVector.objects.exclude(post__in=_published_posts()).delete()
+        RelatedPostsIndex.objects.update_or_create(pk=1, defaults={
+            'dimensions': DIMENSIONS, 'documents': len(ids), 'doc_freq': doc_freq.tobytes(),
+        })
+    return len(ids)
+
+
+def _candidates(post_id, vector, limit):
+    """[(post id, similarity)] of the published posts most similar to `vector`."""
+    import numpy as np
+    from news.models import NewsPostVector
+
+    published = NewsPostVector.objects.filter(post__in=_published_posts()).exclude(post_id=post_id)
+    if pgvector_enabled():
+        from pgvector import Vector
+
+        connection = connections['default']
+        qn = connection.ops.quote_name
+        query = Vector(vector).to_text()
+        sql, params = published.values('post_id').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {qn('post_id')}, 1 - ({qn(EMBEDDING_COLUMN)} <=> %s::vector) "
+                f"FROM {qn(NewsPostVector._meta.db_table)} WHERE {qn('post_id')} IN ({sql}) "
+                f"ORDER BY {qn(EMBEDDING_COLUMN)} <=> %s::vector LIMIT %s",
+                [query, *params, query, limit],
+            )
+            return [(pk, float(score)) for pk, score in cursor.fetchall()]
+
+    stored = list(published.values_list('post_id', 'vector'))
+    if not stored:
+        return []
+    matrix = np.frombuffer(b''.join(bytes(blob) for _, blob in stored), dtype=np.float32).reshape(len(stored), -1)
+    scores = matrix @ vector
+    best = np.argsort(-scores)[:limit]
+    return [(stored[i][0], float(scores[i])) for i in best]
+
+
+def update_post(post_id):
+    """
+    Re-vectorise one post after it was published or edited (or drop it when
+    it is no longer published) and update the neighbour lists it enters.
+    Falls back to a full rebuild when no index has been built yet.
+    """
+    import numpy as np
+    from news.models import NewsPostVector, RelatedPostsIndex
+
+    row = _published_posts().filter(pk=post_id).values_list('title', 'summary', 'content', 'tags').first()
+    if row is None:
+        NewsPostVector.objects.filter(post_id=post_id).delete()
+        return False
+    index = RelatedPostsIndex.objects.filter(pk=1, dimensions=DIMENSIONS).first()
+    if index is None:
+        rebuild()
+        return True
+
+    doc_freq = np.frombuffer(bytes(index.doc_freq), dtype=np.float32)
+    vector = tfidf(count_matrix([row]), doc_freq, index.documents)[0]
+    k = top_k()
+    candidates = [
+        (pk, round(score, 4)) for pk, score in _candidates(post_id, vector, max(k, CANDIDATES))
+        if score >= MIN_SIMILARITY
+    ]
+
+    with transaction.atomic():
+        _save_vectors([NewsPostVector(
+            post_id=post_id, vector=vector.tobytes(), source_hash=source_hash(*row),
+            related=[[pk, score] for pk, score in candidates[:k]],
+        )])
+        if pgvector_enabled():
+            _write_embeddings([(post_id, vector)])
+        scores = dict(candidates)
+        neighbours = list(NewsPostVector.objects.select_for_update().filter(post_id__in=scores).only('post_id', 'related'))
+        changed = []
+        for neighbour in neighbours:
+            merged = _merge_neighbour(neighbour.related, post_id, scores[neighbour.post_id], k)
+            if merged != neighbour.related:
+                neighbour.related = merged
+                changed.append(neighbour)
+        NewsPostVector.objects.bulk_update(changed, ['related'])
+    return True
+
+
+def related_posts(post, limit=None):
+    """The stored neighbours of `post` that are still visible, best first."""
+    from django.utils import timezone
+    from news.models import NewsPostVector
+
+    related = NewsPostVector.objects.filter(post_id=post.pk).values_list('related', flat=True).first()
+    if not related:
+        return []
+    ids = [pk for pk, _ in related[:limit or top_k()]]
+    posts = _published_posts().filter(pk__in=ids, published_on__lte=timezone.now()).only(
+        'id', 'title', 'slug', 'summary', 'image', 'published_on',
+    )
+    by_id = {p.pk: p for p in posts}
+    return [by_id[pk] for pk in ids if pk in by_id]
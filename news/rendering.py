@@ -0,0 +1,57 @@
+# news/rendering.py
+"""
+Markdown rendering for NewsPost.
+
+NewsPost stores `content_hash` = hash of (RENDERER_VERSION, content) next to
+`content_html`, and save() only renders when that hash changes, so saves
+that don't touch the content skip markdown entirely. The meta description is
+derived from the same rendered HTML.
+
+When MARKDOWN_EXTENSIONS (or anything else affecting the output) changes,
+bump RENDERER_VERSION: every stored hash goes stale and
+`manage.py rerender_posts` re-renders the posts in a process pool.
+
+Deliberately Django-free so pool workers only import markdown.
+"""
+import hashlib
+import re
+
+RENDERER_VERSION = 1
+
+MARKDOWN_EXTENSIONS = [
+    "extra",       # tables, lists, etc.
+    "nl2br",       # keep \n as <br>
+    "sane_lists",
+    "smarty",      # typographic quotes/dashes
+]
+
+META_DESCRIPTION_CHARS = 500
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def content_hash(content):
+    """Hex sha256 of the markdown source and the renderer version."""
+    digest = hashlib.sha256(f"{RENDERER_VERSION}\0".encode())
+    digest.update((content or "").encode())
+    return digest.hexdigest()
+
+
+def render_markdown(content):
+    # Imported on first render: news.models loads in every process at setup
+    import markdown
+
+    return markdown.markdown(content or "", extensions=MARKDOWN_EXTENSIONS)
+
+
+def meta_description(html):
+    """Readable meta description from rendered HTML (tags stripped)."""
+    text = " ".join(_TAG_RE.sub(" ", html).split()).strip()
+    if len(text) > META_DESCRIPTION_CHARS:
+        return text[:META_DESCRIPTION_CHARS] + "..."
+    return text
+
+
+def render_batch(rows):
+    """[(pk, content)] -> [(pk, hash, html)]; the process-pool unit of work."""
+    return [(pk, content_hash(content), render_markdown(content)) for pk, content in rows]
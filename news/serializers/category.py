@@ -4,8 +4,6 @@ from news.models import NewsCategory
 
 
 class NewsCategorySerializer(serializers.ModelSerializer):
-    post_count = serializers.SerializerMethodField()
-
     class Meta:
         model = NewsCategory
         fields = [
@@ -16,7 +14,5 @@ class NewsCategorySerializer(serializers.ModelSerializer):
             'icon',
             'post_count',
         ]
+        # post_count: published posts, kept by news.counters
         read_only_fields = ['slug', 'post_count']
-
-    def get_post_count(self, obj):
-        return obj.posts.count()
@@ -4,8 +4,9 @@ from django.utils.timesince import timesince
 from news.models import NewsPost
 from core.serializers import UserSerializer
 from news.serializers.category import NewsCategorySerializer
+from common.search import SearchHitFieldsMixin
 
-class NewsPostSerializer(serializers.ModelSerializer):
+class NewsPostSerializer(SearchHitFieldsMixin, serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
     category = NewsCategorySerializer(read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
@@ -20,12 +21,13 @@ class NewsPostSerializer(serializers.ModelSerializer):
             'summary', 'content', 'content_html', 'image', 'tags',
             'status', 'status_display', 'is_visible',
             'allow_comments', 'view_count',
+            'like_count', 'dislike_count', 'comment_count',
             'meta_title', 'meta_description',
             'published_on', 'time_since_published',
             'created_at', 'updated_at',
         ]
         read_only_fields = [
-            'slug', 'status_display', 'view_count',
+            'slug', 'status_display', 'view_count', 'like_count', 'dislike_count', 'comment_count',
             'created_at', 'updated_at', 'is_visible', 'time_since_published'
         ]
 
@@ -34,9 +36,29 @@ class NewsPostSerializer(serializers.ModelSerializer):
             return timesince(obj.published_on) + " ago"
         return None
 
+
+class RelatedNewsPostSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = NewsPost
+        fields = ['id', 'title', 'slug', 'summary', 'image', 'published_on']
+        read_only_fields = fields
+
+
+class NewsPostDetailSerializer(NewsPostSerializer):
+    """Detail payload: the post plus its precomputed related posts (news.related)."""
+    related_posts = serializers.SerializerMethodField()
+
+    class Meta(NewsPostSerializer.Meta):
+        fields = NewsPostSerializer.Meta.fields + ['related_posts']
+
+    def get_related_posts(self, obj):
+        from news import related
+
+        return RelatedNewsPostSerializer(related.related_posts(obj), many=True, context=self.context).data
+
 from rest_framework import serializers
 from django.utils import timezone
-from news.models import NewsPost
+from news.models import NewsPost, Status
 
 class NewsPostCreateUpdateSerializer(serializers.ModelSerializer):
     author_id = serializers.PrimaryKeyRelatedField(
@@ -63,7 +85,7 @@ class NewsPostCreateUpdateSerializer(serializers.ModelSerializer):
     def validate(self, attrs):
         # Auto-set published_on if status is 'PUBLISHED' and no value exists
         if (
-            attrs.get('status') == NewsPost.Status.PUBLISHED
+            attrs.get('status') == Status.PUBLISHED
             and (not self.instance or not self.instance.published_on)
         ):
             attrs['published_on'] = timezone.now()
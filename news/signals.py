@@ -0,0 +1,76 @@
+# news/signals.py
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from news import counters, related
+from news.models import NewsComment, NewsPost, NewsPostVector, NewsReaction
+from news.models.base import Status
+
+logger = logging.getLogger(__name__)
+
+# Fields that change a post's vector or whether it has one
+RELATED_FIELDS = frozenset({'title', 'summary', 'content', 'tags', 'status', 'published_on'})
+
+
+@receiver(post_save, sender=NewsPost)
+def queue_related_posts_update(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Publishing, editing or unpublishing a post refreshes its related posts after commit."""
+    if raw or (update_fields is not None and RELATED_FIELDS.isdisjoint(update_fields)):
+        return
+    stored = NewsPostVector.objects.filter(post_id=instance.pk).values_list('source_hash', flat=True).first()
+    if instance.status == Status.PUBLISHED and instance.published_on:
+        if stored == related.source_hash(instance.title, instance.summary, instance.content, instance.tags):
+            return
+    elif stored is None:
+        return
+    transaction.on_commit(lambda: _dispatch_related_update(instance.pk))
+
+
+def _dispatch_related_update(post_id):
+    from news.tasks import update_related_posts
+
+    try:
+        update_related_posts.delay(post_id)
+    except Exception:
+        logger.warning("Could not enqueue related posts update for post %s; the nightly rebuild will cover it", post_id)
+
+
+# ---------- Denormalized counters (news.counters) ----------
+COUNTED_MODELS = (NewsPost, NewsComment, NewsReaction)
+
+
+def _counts_change(sender, update_fields):
+    return update_fields is None or not set(sender.counter_fields).isdisjoint(update_fields)
+
+
+def remember_counter_key(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Instances not loaded with their counter fields look up what they count as stored."""
+    if raw or hasattr(instance, '_counted') or not _counts_change(sender, update_fields):
+        return
+    stored = None
+    if not instance._state.adding:
+        stored = sender._default_manager.filter(pk=instance.pk).first()
+    instance._counted = stored._counted if stored is not None else None
+
+
+def move_counters_on_save(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if raw or not _counts_change(sender, update_fields):
+        return
+    key = instance.counter_key()
+    counters.move(sender, None if created else getattr(instance, '_counted', None), key)
+    instance._counted = key
+
+
+def move_counters_on_delete(sender, instance, **kwargs):
+    counters.move(sender, getattr(instance, '_counted', instance.counter_key()), None)
+    instance._counted = None
+
+
+for _model in COUNTED_MODELS:
+    _uid = _model._meta.model_name
+    pre_save.connect(remember_counter_key, sender=_model, dispatch_uid=f'news-counters-pre-{_uid}')
+    post_save.connect(move_counters_on_save, sender=_model, dispatch_uid=f'news-counters-save-{_uid}')
+    post_delete.connect(move_counters_on_delete, sender=_model, dispatch_uid=f'news-counters-delete-{_uid}')
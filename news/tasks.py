@@ -0,0 +1,50 @@
+# news/tasks.py
+import logging
+
+from celery import shared_task
+
+from news import view_counts
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def flush_view_counts():
+    """Fold buffered post views into NewsPost.view_count (scheduled by beat)."""
+    applied = view_counts.flush()
+    if applied:
+        logger.info('Flushed %d buffered news post view(s)', applied)
+    return applied
+
+
+@shared_task(bind=True, acks_late=True, max_retries=5, default_retry_delay=60)
+def notify_subscribers(self, post_id):
+    """Notify a newly published post's category and author subscribers (queued by publish)."""
+    from news import fanout
+
+    # Late ack + retry: a run that dies part-way resumes after its last delivered chunk
+    try:
+        notified, emailed = fanout.fan_out(post_id)
+    except Exception as exc:
+        logger.warning('Fan-out of news post %s stopped, retrying: %s', post_id, exc)
+        raise self.retry(exc=exc)
+    logger.info('News post %s: %d in-app notification(s), %d email(s) queued', post_id, notified, emailed)
+    return notified, emailed
+
+
+@shared_task
+def update_related_posts(post_id):
+    """Re-vectorise one post and refresh the neighbour lists it enters (queued on publish / edit)."""
+    from news import related
+
+    return related.update_post(post_id)
+
+
+@shared_task
+def rebuild_related_posts():
+    """Full TF-IDF rebuild of every published post's related posts (scheduled by beat)."""
+    from news import related
+
+    count = related.rebuild()
+    logger.info('Rebuilt related posts for %d news post(s)', count)
+    return count
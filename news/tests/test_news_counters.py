@@ -0,0 +1,125 @@
+# news/tests/test_news_counters.py
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from core.models import User
+from news.admin import approve_selected_comments
+from news.models import NewsCategory, NewsComment, NewsPost, NewsReaction
+from news.models.base import Status
+
+REACTIONS = "/api/news/reactions/"
+CATEGORIES = "/api/news/categories/"
+
+
+@pytest.fixture
+def category():
+    return baker.make(NewsCategory, name="Clubs")
+
+
+@pytest.fixture
+def post(category):
+    return baker.make(NewsPost, category=category, status=Status.PUBLISHED, published_on=timezone.now())
+
+
+def _counts(post):
+    post.refresh_from_db()
+    return post.like_count, post.dislike_count, post.comment_count
+
+
+def _client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_reaction_toggle_moves_counts(post):
+    alice, bob = baker.make(User, is_active=True, _quantity=2)
+
+    assert _client(alice).post(REACTIONS, {"post": post.pk, "reaction": "LIKE"}).status_code == 201
+    assert _client(bob).post(REACTIONS, {"post": post.pk, "reaction": "LIKE"}).status_code == 201
+    assert _counts(post) == (2, 0, 0)
+
+    response = _client(alice).post(REACTIONS, {"post": post.pk, "reaction": "DISLIKE"})
+    assert response.status_code == 200
+    assert _counts(post) == (1, 1, 0)
+    _client(alice).post(REACTIONS, {"post": post.pk, "reaction": "DISLIKE"})  # same reaction again
+    assert _counts(post) == (1, 1, 0)
+
+    NewsReaction.objects.get(user=bob).delete()
+    assert _counts(post) == (0, 1, 0)
+
+
+@pytest.mark.django_db
+def test_full_save_keeps_concurrent_counter_updates(post):
+    stale = NewsPost.objects.get(pk=post.pk)
+    baker.make(NewsReaction, post=post, reaction="LIKE")
+    baker.make(NewsComment, post=post)
+
+    stale.title = "Edited"
+    stale.save()
+
+    assert _counts(post) == (1, 0, 1)
+    assert post.title == "Edited"
+
+
+@pytest.mark.django_db
+def test_comment_moderation_and_deletes_move_comment_count(post, rf):
+    comment = baker.make(NewsComment, post=post)
+    pending = baker.make(NewsComment, post=post, is_approved=False)
+    reply = baker.make(NewsComment, post=post, parent=comment)
+    assert _counts(post)[2] == 2
+
+    approve_selected_comments(type("Admin", (), {"message_user": lambda *a: None})(), rf.get("/"),
+                              NewsComment.objects.filter(pk=pending.pk))
+    assert _counts(post)[2] == 3
+
+    reply = NewsComment.objects.get(pk=reply.pk)
+    reply.is_deleted = True
+    reply.save(update_fields=["is_deleted"])
+    assert _counts(post)[2] == 2
+    comment.delete()  # cascades to its (already uncounted) reply
+    assert _counts(post)[2] == 1
+
+
+@pytest.mark.django_db
+def test_category_post_count_follows_status_and_category(category, post):
+    other = baker.make(NewsCategory, name="Events")
+    draft = baker.make(NewsPost, category=category, status=Status.DRAFT)
+    category.refresh_from_db()
+    assert category.post_count == 1
+
+    draft = NewsPost.objects.get(pk=draft.pk)
+    draft.status = Status.PUBLISHED
+    draft.save(update_fields=["status", "published_on"])
+    post.category = other
+    post.save()
+    category.refresh_from_db()
+    other.refresh_from_db()
+    assert (category.post_count, other.post_count) == (1, 1)
+
+    draft.delete()
+    with CaptureQueriesContext(connection) as ctx:
+        rows = APIClient().get(CATEGORIES).json()["results"]
+    assert {row["name"]: row["post_count"] for row in rows} == {"Clubs": 0, "Events": 1}
+    assert not [q for q in ctx.captured_queries if "news_newspost" in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_reconcile_command_repairs_drift(category, post, capsys):
+    baker.make(NewsReaction, post=post, reaction="LIKE")
+    baker.make(NewsComment, post=post)
+    NewsPost.objects.filter(pk=post.pk).update(like_count=7, comment_count=0)
+    NewsCategory.objects.update(post_count=0)
+
+    call_command("reconcile_news_counters", batch_size=1)
+
+    assert "Fixed counters on 1 post(s) and 1 category" in capsys.readouterr().out
+    assert _counts(post) == (1, 0, 1)
+    category.refresh_from_db()
+    assert category.post_count == 1
@@ -0,0 +1,44 @@
+# news/tests/test_post_conditional_get.py
+import pytest
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from news.models import NewsPost, NewsReaction
+from news.models.base import Status
+
+POSTS = "/api/news/posts/"
+
+
+@pytest.mark.django_db
+def test_list_etag_follows_counter_updates():
+    post = baker.make(NewsPost, status=Status.PUBLISHED, published_on=timezone.now())
+    client = APIClient()
+    etag = client.get(POSTS)["ETag"]
+    assert client.get(POSTS, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # like_count moves through an F() update; updated_at stays put
+    baker.make(NewsReaction, post=post, reaction=NewsReaction.ReactionType.LIKE)
+    post.refresh_from_db()
+    assert post.like_count == 1
+
+    response = client.get(POSTS, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.json()["results"][0]["like_count"] == 1
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_list_etag_sees_counter_moves_that_cancel_out():
+    first, second = baker.make(NewsPost, status=Status.PUBLISHED, published_on=timezone.now(), _quantity=2)
+    reaction = baker.make(NewsReaction, post=first, reaction=NewsReaction.ReactionType.LIKE)
+    client = APIClient()
+    etag = client.get(POSTS)["ETag"]
+
+    # the reader moves their like from one post to the other: totals are unchanged
+    reaction.delete()
+    baker.make(NewsReaction, post=second, reaction=NewsReaction.ReactionType.LIKE)
+
+    response = client.get(POSTS, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
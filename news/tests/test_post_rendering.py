@@ -0,0 +1,70 @@
+# news/tests/test_post_rendering.py
+import pytest
+from django.core.management import call_command
+from model_bakery import baker
+
+from news import rendering
+from news.models import NewsPost
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    calls = []
+    real = rendering.render_markdown
+
+    def counting(content):
+        calls.append(content)
+        return real(content)
+
+    monkeypatch.setattr(rendering, "render_markdown", counting)
+    return calls
+
+
+@pytest.mark.django_db
+def test_save_renders_once_per_distinct_content(renders):
+    post = baker.make(NewsPost, title="Launch", summary="", meta_description="", content="Hello **world**")
+
+    assert len(renders) == 1
+    assert post.content_html == "<p>Hello <strong>world</strong></p>"
+    assert post.content_hash == rendering.content_hash("Hello **world**")
+    assert post.meta_description == "Hello world"
+
+    post.title = "Launch day"
+    post.save()
+    post.view_count += 1
+    post.save(update_fields=["view_count"])
+    assert len(renders) == 1
+
+    post.content = "Changed"
+    post.save(update_fields=["content"])
+    assert len(renders) == 2
+    post.refresh_from_db()
+    assert post.content_html == "<p>Changed</p>"
+    assert post.content_hash == rendering.content_hash("Changed")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workers", [0, 2])
+def test_rerender_posts_updates_stale_rows(workers):
+    stale = baker.make(NewsPost, content="*one*", _quantity=3)
+    fresh = baker.make(NewsPost, content="two")
+    NewsPost.objects.filter(pk__in=[p.pk for p in stale]).update(content_html="old", content_hash="")
+
+    call_command("rerender_posts", workers=workers, batch_size=2)
+
+    for post in NewsPost.objects.filter(pk__in=[p.pk for p in stale]):
+        assert post.content_html == "<p><em>one</em></p>"
+        assert post.content_hash == rendering.content_hash("*one*")
+    untouched = NewsPost.objects.get(pk=fresh.pk)
+    assert (untouched.content_html, untouched.updated_at) == (fresh.content_html, fresh.updated_at)
+
+
+@pytest.mark.django_db
+def test_renderer_version_bump_marks_posts_stale(monkeypatch, capsys):
+    baker.make(NewsPost, content="text", _quantity=2)
+    call_command("rerender_posts", dry_run=True)
+    assert "0 post(s)" in capsys.readouterr().out
+
+    monkeypatch.setattr(rendering, "RENDERER_VERSION", rendering.RENDERER_VERSION + 1)
+    call_command("rerender_posts", dry_run=True)
+    assert "2 post(s)" in capsys.readouterr().out
@@ -0,0 +1,93 @@
+# news/tests/test_post_search.py
+import pytest
+from django.db import connection
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from common import search_index
+from news.models import NewsPost
+from news.models.base import Status
+
+POSTS = "/api/news/posts/"
+
+
+def _post(**kwargs):
+    kwargs.setdefault("summary", "")
+    kwargs.setdefault("content", "Nothing to see here.")
+    return baker.make(NewsPost, status=Status.PUBLISHED, published_on=timezone.now(), **kwargs)
+
+
+def _search(query, **params):
+    response = APIClient().get(POSTS, {"search": query, **params})
+    assert response.status_code == 200
+    return response.json()["results"]
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_above_summary_above_body_above_tags():
+    tagged = _post(title="Weekly notes", tags=["robotics"])
+    body = _post(title="Club update", content="This term we started a robotics club.")
+    summary = _post(title="Open day", summary="Robotics demos all afternoon")
+    title = _post(title="Robotics championship results")
+    _post(title="Unrelated", content="Gardening tips")
+
+    results = _search("robotics")
+
+    assert [r["id"] for r in results] == [title.pk, summary.pk, body.pk, tagged.pk]
+    assert all(r["search_rank"] > 0 for r in results)
+    assert "<mark>" in results[2]["search_snippet"]
+    # explicit ordering wins over rank
+    ordered = _search("robotics", ordering="-view_count,published_on")
+    assert {r["id"] for r in ordered} == {title.pk, summary.pk, body.pk, tagged.pk}
+
+
+@pytest.mark.django_db
+def test_search_matches_stems_and_requires_every_term():
+    match = _post(title="Students building robots", content="Our coders built three robots.")
+    _post(title="Students reading", content="Book club")
+
+    assert [r["id"] for r in _search("build robot")] == [match.pk]
+    assert _search('robot "OR students') == []  # user input is never query syntax
+    assert "search_rank" not in APIClient().get(POSTS).json()["results"][0]
+
+
+@pytest.mark.django_db
+def test_snippet_is_escaped_except_highlights():
+    _post(title="Markup", content="Use <script>alert(1)</script> carefully with markup")
+
+    snippet = _search("markup")[0]["search_snippet"]
+
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;" in snippet
+    assert "<mark>markup</mark>" in snippet
+
+
+@pytest.mark.django_db
+def test_index_follows_edits_and_deletes():
+    post = _post(title="Hackathon")
+    assert [r["id"] for r in _search("hackathon")] == [post.pk]
+
+    post.title = "Coding marathon"
+    post.save()
+    assert _search("hackathon") == []
+    assert [r["id"] for r in _search("marathon")] == [post.pk]
+
+    post.delete()
+    assert _search("marathon") == []
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite shadow-table triggers")
+def test_post_migrate_restores_triggers_dropped_by_table_rebuild():
+    post = _post(title="Orienteering")
+    with connection.cursor() as cursor:
+        for suffix in ("ai", "ad", "au"):
+            cursor.execute(f'DROP TRIGGER "news_newspost_fts_{suffix}"')
+    NewsPost.objects.filter(pk=post.pk).update(title="Astronomy")
+
+    from django.apps import apps
+    search_index.ensure_search_indexes(sender=apps.get_app_config("news"), using=connection.alias)
+
+    assert [r["id"] for r in _search("astronomy")] == [post.pk]
+    assert _search("orienteering") == []
@@ -0,0 +1,131 @@
+# news/tests/test_publish_fanout.py
+import datetime
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from core.models import EmailOutbox, User
+from news import fanout, tasks
+from news.models import NewsCategory, NewsPost, NewsSubscriber
+from news.models.base import Status
+from notification.models import Notification, NotificationPreference, NotificationType
+
+PUBLISH = "/api/news/posts/{}/publish/"
+
+
+@pytest.fixture(autouse=True)
+def setup(settings, monkeypatch):
+    settings.FRONTEND_URL = "https://academy.example"
+    monkeypatch.setattr(fanout, "FANOUT_CHUNK_SIZE", 2)
+    # run the queued task inline
+    monkeypatch.setattr(tasks.notify_subscribers, "delay", tasks.notify_subscribers)
+
+
+@pytest.fixture
+def author():
+    return baker.make(User, is_active=True, is_staff=True)
+
+
+@pytest.fixture
+def post(author):
+    return baker.make(NewsPost, author=author, category=baker.make(NewsCategory, name="Clubs"),
+                      title="Robotics club wins", summary="", status=Status.DRAFT)
+
+
+def _subscriber(post, *, category=True, author=False, **preferences):
+    user = baker.make(User, is_active=True)
+    if category:
+        baker.make(NewsSubscriber, user=user, category=post.category)
+    if author:
+        baker.make(NewsSubscriber, user=user, author=post.author)
+    if preferences:
+        baker.make(NotificationPreference, user=user, **preferences)
+    return user
+
+
+@pytest.mark.django_db
+def test_publish_notifies_category_and_author_subscribers_once(post, author, django_capture_on_commit_callbacks):
+    both = _subscriber(post, author=True)
+    follower = _subscriber(post, category=False, author=True)
+    reader = _subscriber(post)
+    no_email = _subscriber(post, email=False)
+    no_in_app = _subscriber(post, in_app=False)
+    events_only = _subscriber(post, types=[NotificationType.EVENT])
+    baker.make(NewsSubscriber, user=author, category=post.category)  # the author is not told
+    _subscriber(baker.make(NewsPost, category=baker.make(NewsCategory, name="Other")))
+
+    client = APIClient()
+    client.force_authenticate(author)
+    with mock.patch("core.tasks.send_outbox_emails.delay") as send:
+        with django_capture_on_commit_callbacks(execute=True):
+            assert client.post(PUBLISH.format(post.slug)).status_code == 200
+
+    notified = set(Notification.objects.values_list("recipient_id", flat=True))
+    assert notified == {both.pk, follower.pk, reader.pk, no_email.pk}
+    notification = Notification.objects.get(recipient=reader)
+    assert notification.type == NotificationType.ARTICLE
+    assert notification.link == f"https://academy.example/news/{post.slug}"
+
+    emailed = set(EmailOutbox.objects.values_list("recipient", flat=True))
+    assert emailed == {both.email, follower.email, reader.email, no_in_app.email}
+    assert events_only.email not in emailed
+    # one batch per chunk of subscribers, sent after its transaction commits
+    assert sorted(id for call in send.call_args_list for id in call.kwargs["ids"]) == sorted(
+        EmailOutbox.objects.values_list("pk", flat=True)
+    )
+
+    post.refresh_from_db()
+    assert post.subscribers_notified_at is not None
+    assert tasks.notify_subscribers(post.pk) == (0, 0)  # duplicate task
+    assert Notification.objects.count() == 4
+
+
+@pytest.mark.django_db
+def test_quiet_hours_defer_the_email(post):
+    now = timezone.localtime()
+    start = (now - datetime.timedelta(hours=1)).time()
+    end = (now + datetime.timedelta(hours=1)).time()
+    user = _subscriber(post, quiet_hours_start=start, quiet_hours_end=end)
+    post.status = Status.PUBLISHED
+    post.save()
+
+    with mock.patch("core.tasks.send_outbox_emails.delay") as send:
+        assert tasks.notify_subscribers(post.pk) == (1, 1)
+
+    email = EmailOutbox.objects.get(recipient=user.email)
+    assert email.next_attempt_at > timezone.now()
+    assert not send.called  # left for the periodic flush
+
+
+@pytest.mark.django_db
+def test_interrupted_fan_out_resumes_after_the_last_delivered_chunk(post, monkeypatch):
+    users = [_subscriber(post) for _ in range(5)]
+    post.status = Status.PUBLISHED
+    post.save()
+    deliver = fanout._deliver
+    calls = []
+
+    def crash_on_second_chunk(*args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise RuntimeError("worker died")
+        return deliver(*args)
+
+    monkeypatch.setattr(fanout, "_deliver", crash_on_second_chunk)
+    with mock.patch("core.tasks.send_outbox_emails.delay"):
+        with pytest.raises(RuntimeError):
+            fanout.fan_out(post.pk)
+        post.refresh_from_db()
+        assert post.subscribers_notified_at is None
+        assert post.subscribers_notified_through == users[1].pk
+        assert Notification.objects.count() == 2
+
+        assert fanout.fan_out(post.pk) == (3, 3)
+
+    assert sorted(Notification.objects.values_list("recipient_id", flat=True)) == [u.pk for u in users]
+    assert EmailOutbox.objects.count() == 5
+    post.refresh_from_db()
+    assert post.subscribers_notified_at is not None
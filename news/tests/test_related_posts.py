@@ -0,0 +1,99 @@
+# news/tests/test_related_posts.py
+import numpy as np
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from news import related, tasks
+from news.models import NewsPost, NewsPostVector
+from news.models.base import Status
+
+POST = "/api/news/posts/{}/"
+
+
+@pytest.fixture(autouse=True)
+def setup(settings, monkeypatch):
+    settings.NEWS_RELATED_POSTS = 2
+    # run the queued task inline
+    monkeypatch.setattr(tasks.update_related_posts, "delay", tasks.update_related_posts)
+
+
+def _post(title, content, **kwargs):
+    return baker.make(NewsPost, title=title, summary="", content=content, tags=kwargs.pop("tags", []),
+                      status=Status.PUBLISHED, published_on=timezone.now(), **kwargs)
+
+
+@pytest.fixture
+def posts():
+    return {
+        "robots": _post("Robotics club wins", "Our robotics team built robots with sensors and motors."),
+        "rover": _post("Building a rover", "Students built a robot rover with motors and sensors.",
+                       tags=["robotics"]),
+        "drones": _post("Drone workshop", "Flying drones with sensors; robotics meets aviation."),
+        "baking": _post("Bake sale", "Cakes, cookies and bread baked by parents for the fundraiser."),
+    }
+
+
+def _related(post):
+    return [pk for pk, _ in NewsPostVector.objects.get(post=post).related]
+
+
+@pytest.mark.django_db
+def test_rebuild_stores_nearest_neighbours_and_detail_serves_them(posts, capsys):
+    call_command("build_related_posts", batch_size=3)
+    assert "4 post(s)" in capsys.readouterr().out
+
+    robots = posts["robots"]
+    assert _related(robots) == [posts["rover"].pk, posts["drones"].pk]
+
+    client = APIClient()
+    client.get(POST.format(robots.slug))
+    with CaptureQueriesContext(connection) as ctx:
+        data = client.get(POST.format(robots.slug)).json()
+    assert [p["slug"] for p in data["related_posts"]] == [posts["rover"].slug, posts["drones"].slug]
+    related_queries = [q for q in ctx.captured_queries if "news_newspostvector" in q["sql"]]
+    assert len(related_queries) == 1
+
+
+@pytest.mark.django_db
+def test_publishing_updates_the_new_post_and_its_neighbours(posts, django_capture_on_commit_callbacks):
+    related.rebuild()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        arm = _post("Robot arm kit", "A robotics kit: robot arm with motors and sensors.", tags=["robotics"])
+
+    assert set(_related(arm)) <= {posts["robots"].pk, posts["rover"].pk, posts["drones"].pk}
+    assert len(_related(arm)) == 2
+    assert arm.pk in _related(posts["rover"])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        arm.status = Status.DRAFT
+        arm.save()
+    assert not NewsPostVector.objects.filter(post=arm).exists()
+    # stale neighbour entries are skipped when serving
+    assert arm.pk not in [p.pk for p in related.related_posts(posts["rover"])]
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        posts["rover"].view_count = 3
+        posts["rover"].save(update_fields=["view_count"])
+        posts["rover"].save()  # text unchanged: vector is current
+    assert callbacks == []
+
+
+def test_block_wise_neighbours_match_brute_force(monkeypatch):
+    monkeypatch.setattr(related, "BLOCK_ROWS", 3)
+    rng = np.random.default_rng(7)
+    vectors = rng.random((8, 16), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = list(range(100, 108))
+
+    result = related.top_neighbours(vectors, ids, 3)
+
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, -1)
+    for row, neighbours in enumerate(result):
+        assert [pk for pk, _ in neighbours] == [ids[i] for i in np.argsort(-similarity[row])[:3]]
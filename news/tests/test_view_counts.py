@@ -0,0 +1,94 @@
+# news/tests/test_view_counts.py
+import os
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from news import view_counts
+from news.models import NewsPost
+from news.models.base import Status
+
+POST = "/api/news/posts/{}/"
+
+
+@pytest.fixture(autouse=True)
+def local_buffer(settings):
+    settings.NEWS_VIEW_BUFFER_URL = ""
+    settings.NEWS_VIEW_FLUSH_SECONDS = 3600
+    settings.NEWS_VIEW_DEDUPE = False
+    view_counts.reset_buffer()
+    yield
+    view_counts.reset_buffer()
+
+
+@pytest.fixture
+def post():
+    return baker.make(NewsPost, status=Status.PUBLISHED, published_on=timezone.now(), view_count=10)
+
+
+def _updates(ctx):
+    return [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+
+
+@pytest.mark.django_db
+def test_reads_are_buffered_and_flushed_in_one_update(post):
+    client = APIClient()
+    with CaptureQueriesContext(connection) as ctx:
+        counts = [client.get(POST.format(post.slug)).data["view_count"] for _ in range(3)]
+
+    assert counts == [11, 12, 13]
+    assert _updates(ctx) == []
+    post.refresh_from_db()
+    assert post.view_count == 10
+
+    other = baker.make(NewsPost, status=Status.PUBLISHED, published_on=timezone.now())
+    client.get(POST.format(other.slug))
+    with CaptureQueriesContext(connection) as ctx:
+        assert view_counts.flush() == 4
+    assert len(_updates(ctx)) == 1
+
+    post.refresh_from_db()
+    assert post.view_count == 13
+    assert NewsPost.objects.get(pk=other.pk).view_count == 1
+    assert client.get(POST.format(post.slug)).data["view_count"] == 14
+
+
+@pytest.mark.django_db
+def test_dedupe_counts_each_visitor_once(settings, post):
+    settings.NEWS_VIEW_DEDUPE = True
+    url = POST.format(post.slug)
+
+    APIClient().get(url, HTTP_USER_AGENT="reader-a")
+    assert APIClient().get(url, HTTP_USER_AGENT="reader-a").data["view_count"] == 11
+    assert APIClient().get(url, HTTP_USER_AGENT="reader-b").data["view_count"] == 12
+
+
+@pytest.mark.django_db
+def test_unreachable_redis_falls_back_to_direct_update(settings, post):
+    settings.NEWS_VIEW_BUFFER_URL = "redis://127.0.0.1:1/0"
+    view_counts.reset_buffer()
+
+    assert APIClient().get(POST.format(post.slug)).data["view_count"] == 11
+    post.refresh_from_db()
+    assert post.view_count == 11
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(not os.getenv("REDIS_URL"), reason="needs a Redis server (REDIS_URL)")
+def test_redis_buffer_round_trip(settings, post):
+    settings.NEWS_VIEW_BUFFER_URL = os.environ["REDIS_URL"]
+    settings.NEWS_VIEW_DEDUPE = True
+    view_counts.reset_buffer()
+    buffer = view_counts.get_buffer()
+    buffer.client.delete(view_counts.PENDING_KEY, view_counts.FLUSHING_KEY, view_counts.FLUSH_LOCK_KEY,
+                         *buffer.client.keys(f"{view_counts.KEY_PREFIX}:seen:*"))
+
+    assert [buffer.record(post.pk, visitor) for visitor in ("a", "b", "a")] == [1, 2, 2]
+    assert view_counts.flush() == 2
+    post.refresh_from_db()
+    assert post.view_count == 12
+    assert buffer.record(post.pk, "c") == 1
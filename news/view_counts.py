@@ -0,0 +1,187 @@
+# news/view_counts.py
+"""
+Write-behind view counters for NewsPost.
+
+Reading a post used to UPDATE its row on every hit, so popular articles
+serialized their readers on the row lock. Views are now counted in a buffer
+and folded into NewsPost.view_count by `flush()` (Celery beat runs
+news.tasks.flush_view_counts every NEWS_VIEW_FLUSH_SECONDS) with one batched
+UPDATE per flush. The count a reader sees is the stored value plus the
+post's pending delta.
+
+Buffers:
+- RedisViewBuffer when NEWS_VIEW_BUFFER_URL (default REDIS_URL) is set: one
+  hash of post id -> pending views, incremented with a Lua script that also
+  applies the optional per-visitor dedupe (a HyperLogLog per post per day,
+  NEWS_VIEW_DEDUPE) and returns the pending delta in the same round trip.
+  A flush renames the hash aside, applies it and deletes it; a flush that
+  died half way is re-applied by the next one (at-least-once).
+- LocalViewBuffer otherwise (development, tests): per-process, flushed by
+  the process itself once NEWS_VIEW_FLUSH_SECONDS have passed.
+
+If Redis is unreachable the view is written straight to the row, as before.
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 500
+
+# Hash tag keeps every key in one Redis Cluster slot (the script touches several)
+KEY_PREFIX = '{news-views}'
+PENDING_KEY = f'{KEY_PREFIX}:pending'
+FLUSHING_KEY = f'{KEY_PREFIX}:flushing'
+FLUSH_LOCK_KEY = f'{KEY_PREFIX}:flush-lock'
+
+# KEYS: pending, flushing, seen (HLL; '' = no dedupe)
+# ARGV: post id, visitor id, seen ttl -> pending delta after this view
+_RECORD_SCRIPT = """
+local counted = 1
+if KEYS[3] ~= '' then
+    counted = redis.call('PFADD', KEYS[3], ARGV[2])
+    redis.call('EXPIRE', KEYS[3], ARGV[3])
+end
+local pending
+if counted == 1 then
+    pending = redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+else
+    pending = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+end
+return pending + tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or '0')
+"""
+
+
+def visitor_id(request):
+    """Stable per-visitor id for dedupe: the user, else a hash of IP + user agent."""
+    from core.utils.request import get_client_ip
+
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'u:{user.pk}'
+    raw = f"{get_client_ip(request)}|{request.META.get('HTTP_USER_AGENT', '')}"
+    return 'a:' + hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+def apply_deltas(deltas):
+    """Add {post id: views} to NewsPost.view_count, one UPDATE per batch."""
+    from news.models import NewsPost
+
+    items = [(pk, n) for pk, n in deltas.items() if n > 0]
+    for start in range(0, len(items), FLUSH_BATCH_SIZE):
+        batch = items[start:start + FLUSH_BATCH_SIZE]
+        increment = Case(*(When(pk=pk, then=Value(n)) for pk, n in batch), default=Value(0))
+        NewsPost.objects.filter(pk__in=[pk for pk, _ in batch]).update(view_count=F('view_count') + increment)
+    return sum(n for _, n in items)
+
+
+class LocalViewBuffer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._seen = set()
+        self._seen_day = None
+        self._last_flush = time.monotonic()
+
+    def record(self, post_id, visitor):
+        with self._lock:
+            if settings.NEWS_VIEW_DEDUPE:
+                today = timezone.now().date()
+                if today != self._seen_day:
+                    self._seen, self._seen_day = set(), today
+                seen = (post_id, visitor)
+                counted = seen not in self._seen
+                self._seen.add(seen)
+            else:
+                counted = True
+            if counted:
+                self._pending[post_id] += 1
+            pending = self._pending[post_id]
+            due = time.monotonic() - self._last_flush >= settings.NEWS_VIEW_FLUSH_SECONDS
+        if due:
+            # The caller's row was read before this flush, so the delta still applies
+            self.flush()
+        return pending
+
+    def flush(self):
+        with self._lock:
+            deltas, self._pending = dict(self._pending), Counter()
+            self._last_flush = time.monotonic()
+        return apply_deltas(deltas)
+
+
+class RedisViewBuffer:
+    def __init__(self, url):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+        self._record = self.client.register_script(_RECORD_SCRIPT)
+
+    def record(self, post_id, visitor):
+        seen_key = ''
+        if settings.NEWS_VIEW_DEDUPE:
+            seen_key = f'{KEY_PREFIX}:seen:{post_id}:{timezone.now():%Y%m%d}'
+        return int(self._record(
+            keys=[PENDING_KEY, FLUSHING_KEY, seen_key],
+            args=[post_id, visitor, settings.NEWS_VIEW_DEDUPE_SECONDS],
+        ))
+
+    def flush(self):
+        import redis
+
+        if not self.client.set(FLUSH_LOCK_KEY, 1, nx=True, ex=60):
+            return 0  # another worker is flushing
+        try:
+            if not self.client.exists(FLUSHING_KEY):
+                try:
+                    self.client.rename(PENDING_KEY, FLUSHING_KEY)
+                except redis.ResponseError:
+                    return 0  # nothing pending
+            deltas = {int(pk): int(n) for pk, n in self.client.hgetall(FLUSHING_KEY).items()}
+            applied = apply_deltas(deltas)
+            self.client.delete(FLUSHING_KEY)
+            return applied
+        finally:
+            self.client.delete(FLUSH_LOCK_KEY)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            url = settings.NEWS_VIEW_BUFFER_URL
+            _buffer = RedisViewBuffer(url) if url else LocalViewBuffer()
+        return _buffer
+
+
+def reset_buffer():
+    """Drop the process buffer (tests / settings changes); unflushed local views are lost."""
+    global _buffer
+    with _buffer_lock:
+        _buffer = None
+
+
+def record_view(post, request):
+    """Count a view of `post`; returns the pending delta to add to post.view_count."""
+    try:
+        return get_buffer().record(post.pk, visitor_id(request))
+    except Exception:
+        # Buffer down: count it on the row, like before buffering
+        logger.warning('View buffer unavailable; writing view of post %s directly', post.pk, exc_info=True)
+        apply_deltas({post.pk: 1})
+        return 1  # not in the caller's already-loaded view_count
+
+
+def flush():
+    return get_buffer().flush()
@@ -1,6 +1,8 @@
 # news/views/comment.py
 from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
+from django.db import models
+from django.db.models import Prefetch
 
 from news.models import NewsComment
 from news.serializers.comment import (
@@ -11,6 +13,7 @@ from news.serializers.comment import (
 )
 from news.views.base import DynamicSerializerMixin, SoftDeleteMixin
 from common.permissions import IsAuthorOrAdminOrReadOnly
+from common.pagination import CreatedAtCursorPagination
 
 
 class NewsCommentViewSet(
@@ -25,11 +28,14 @@ class NewsCommentViewSet(
     - Soft delete supported.
     - Public and other users only see approved comments.
     """
-    queryset = NewsComment.objects.select_related('user', 'post', 'parent')
+    queryset = NewsComment.objects.select_related('user', 'post', 'parent').prefetch_related(
+        Prefetch('replies', queryset=NewsComment.objects.select_related('user'))
+    )
     serializer_class = NewsCommentSerializer
     write_serializer_class = NewsCommentCreateSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsAuthorOrAdminOrReadOnly]
     lookup_field = 'id'
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -1,17 +1,20 @@
-from rest_framework import viewsets, permissions, filters, status
+from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
 from rest_framework.permissions import SAFE_METHODS
-from django.db.models import F
 from django_filters.rest_framework import DjangoFilterBackend
 
-from news.models import NewsPost
+from news import fanout, view_counts
+from news.models import NewsPost, Status
 from news.serializers.post import (
     NewsPostSerializer,
+    NewsPostDetailSerializer,
     NewsPostCreateUpdateSerializer
 )
 from news.views.base import DynamicSerializerMixin, SoftDeleteMixin
+from common.mixins import ConditionalGetMixin
+from common.search import FullTextSearchFilter, SearchRankOrderingFilter
 
 
 class IsAuthorOrReadOnly(permissions.BasePermission):
@@ -25,6 +28,7 @@ class IsAuthorOrReadOnly(permissions.BasePermission):
 
 
 class NewsPostViewSet(
+    ConditionalGetMixin,
     SoftDeleteMixin,
     DynamicSerializerMixin,
     viewsets.ModelViewSet
@@ -35,13 +39,18 @@ class NewsPostViewSet(
     queryset = NewsPost.objects.select_related('author', 'category')
     serializer_class = NewsPostSerializer
     write_serializer_class = NewsPostCreateUpdateSerializer
+    serializer_action_classes = {'retrieve': NewsPostDetailSerializer}
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
     lookup_field = 'slug'
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, SearchRankOrderingFilter]
     filterset_fields = ['category', 'status']
     search_fields = ['title', 'summary', 'content', 'tags']
-    ordering_fields = ['published_on', 'created_at', 'view_count']
+    ordering_fields = ['published_on', 'created_at', 'view_count', 'like_count', 'comment_count']
     ordering = ['-published_on', '-created_at']
+    # retrieve bumps view_count on every hit, so only lists answer 304
+    conditional_get_actions = ('list',)
+    # Counters move through F() updates (news.counters, news.view_counts)
+    etag_sum_fields = ('view_count', 'like_count', 'dislike_count', 'comment_count')
 
     def get_queryset(self):
         user = self.request.user
@@ -59,14 +68,9 @@ class NewsPostViewSet(
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
 
-        if (
-            instance.status == NewsPost.Status.PUBLISHED and
-            instance.published_on and
-            instance.published_on <= timezone.now()
-        ):
-            instance.view_count = F('view_count') + 1
-            instance.save(update_fields=['view_count'])
-            instance.refresh_from_db(fields=['view_count'])
+        if instance.is_visible:
+            # Buffered (news/view_counts.py); report stored count + pending views
+            instance.view_count += view_counts.record_view(instance, request)
 
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
@@ -74,11 +78,12 @@ class NewsPostViewSet(
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def publish(self, request, slug=None):
         """
-        Custom action: manually publish a post.
+        Custom action: manually publish a post and notify its subscribers (news.fanout).
         """
         post = self.get_object()
-        if post.status != NewsPost.Status.PUBLISHED:
-            post.status = NewsPost.Status.PUBLISHED
+        if post.status != Status.PUBLISHED:
+            post.status = Status.PUBLISHED
             post.published_on = timezone.now()
             post.save(update_fields=['status', 'published_on'])
+            fanout.queue_fanout(post)
         return Response(self.get_serializer(post).data, status=status.HTTP_200_OK)
@@ -21,6 +21,8 @@ class NewsReactionViewSet(DynamicSerializerMixin, viewsets.ModelViewSet):
     queryset = NewsReaction.objects.select_related('user', 'post')
     serializer_class = NewsReactionSerializer
     write_serializer_class = NewsReactionCreateUpdateSerializer
+    # POST toggles through update_or_create (counted on the post by news.counters)
+    serializer_action_classes = {'create': NewsReactionCreateUpdateSerializer}
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get_queryset(self):
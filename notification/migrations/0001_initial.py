@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:11
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationPreference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.BooleanField(default=True)),
+                ('sms', models.BooleanField(default=False)),
+                ('in_app', models.BooleanField(default=True)),
+                ('types', models.JSONField(default=list, help_text='List of NotificationType values the user wants to receive')),
+                ('quiet_hours_start', models.TimeField(blank=True, help_text='Silence period start (e.g., 22:00)', null=True)),
+                ('quiet_hours_end', models.TimeField(blank=True, help_text='Silence period end (e.g., 07:00)', null=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='notification_preferences', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('SYSTEM', 'System Message'), ('EVENT', 'Event Update'), ('CLASS', 'Class Reminder'), ('ARTICLE', 'New Article / Comment'), ('SUPPORT', 'Support Reply'), ('CERTIFICATE', 'Certificate Issued'), ('REMINDER', 'Reminder'), ('APPLICATION', 'Application Update'), ('PAYMENT', 'Payment Notice'), ('GENERAL', 'General Info')], default='GENERAL', max_length=20)),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField()),
+                ('link', models.URLField(blank=True, help_text='Optional URL for redirection (e.g., class, article, dashboard item)')),
+                ('delivery_method', models.CharField(choices=[('IN_APP', 'In-App'), ('EMAIL', 'Email'), ('PUSH', 'Push Notification')], default='IN_APP', max_length=10)),
+                ('is_read', models.BooleanField(default=False)),
+                ('sent_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('read_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-sent_at'],
+                'indexes': [models.Index(fields=['recipient', 'is_read'], name='notificatio_recipie_dd6756_idx')],
+            },
+        ),
+    ]
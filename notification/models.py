@@ -61,6 +61,10 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ['-sent_at']
+        indexes = [
+            # unread badge count: recipient + is_read=False
+            models.Index(fields=['recipient', 'is_read']),
+        ]
 
     def mark_as_read(self):
         if not self.is_read:
@@ -0,0 +1,7 @@
+# notification/urls.py
+from django.urls import path
+from notification.views import NotificationUnreadCountView
+
+urlpatterns = [
+    path("unread-count/", NotificationUnreadCountView.as_view(), name="notification-unread-count"),
+]
@@ -1,3 +1,11 @@
-from django.shortcuts import render
+# notification/views.py
+from common.views import AsyncAPIView
+from notification.models import Notification
 
-# Create your views here.
+
+class NotificationUnreadCountView(AsyncAPIView):
+    """Unread badge count, polled by the frontend on every page."""
+
+    async def get(self, request):
+        count = await Notification.objects.filter(recipient=request.user, is_read=False).acount()
+        return self.respond({"unread_count": count})
@@ -1,7 +1,8 @@
 # program/models.py
 from django.db import models
 from django.conf import settings
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
+from common.utils import generate_unique_slug
 from django.utils.text import slugify
 
 class ProgramCategory(models.TextChoices):
@@ -65,13 +66,7 @@ class ProgramLevel(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            base = self._slug_base()
-            slug = base
-            i = 1
-            while ProgramLevel.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base}-{i}"
-                i += 1
-            self.slug = slug
+            self.slug = generate_unique_slug(self, self._slug_base(), max_length=140)
         super().save(*args, **kwargs)
 
 
@@ -1,9 +1,11 @@
 # program/signals.py
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.apps import apps
 from common.utils import generate_unique_slug
-from .models import Program
+from common.catalog import invalidate_catalog
+from .utils import invalidate_level_slug_index
+from .models import Program, ProgramLevel, Session
 
 @receiver(pre_save, sender=Program)
 def program_slug_generator(sender, instance, **kwargs):
@@ -35,3 +37,16 @@ def ensure_program_certificate_template(sender, instance: Program, created, **kw
             layout_config={},
             is_active=True,
         )
+
+
+@receiver([post_save, post_delete], sender=Program)
+@receiver([post_save, post_delete], sender=ProgramLevel)
+@receiver([post_save, post_delete], sender=Session)
+def bump_catalog_on_program_change(sender, **kwargs):
+    invalidate_catalog()
+
+
+@receiver([post_save, post_delete], sender=Program)
+@receiver([post_save, post_delete], sender=ProgramLevel)
+def drop_level_slug_index(sender, **kwargs):
+    invalidate_level_slug_index()
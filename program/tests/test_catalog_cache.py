@@ -0,0 +1,70 @@
+# program/tests/test_catalog_cache.py
+import threading
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from common.catalog import catalog_key, get_catalog_version, get_or_compute
+from program.models import Program
+
+URL = "/api/program/programs/"
+
+
+def _samples(key, result):
+    return REGISTRY.get_sample_value(
+        "nebula_cache_requests_total", {"namespace": "catalog", "key": key, "result": result}
+    ) or 0
+
+
+@pytest.mark.django_db
+def test_repeat_list_is_served_from_cache():
+    Program.objects.create(name="Web Basics", category="BEG")
+    client = APIClient()
+    hits_before = _samples("ProgramViewSet.list", "hit")
+
+    first = client.get(URL)
+    with CaptureQueriesContext(connection) as ctx:
+        second = client.get(URL)
+
+    assert first.status_code == second.status_code == 200
+    assert second.data == first.data
+    # Only the conditional-GET fingerprint; the body comes from the cache.
+    assert len(ctx.captured_queries) == 1
+    assert _samples("ProgramViewSet.list", "hit") == hits_before + 1
+
+
+@pytest.mark.django_db
+def test_save_bumps_version_after_commit(django_capture_on_commit_callbacks):
+    program = Program.objects.create(name="Web Basics", category="BEG")
+    client = APIClient()
+    client.get(URL)
+    version = get_catalog_version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        program.name = "Web Foundations"
+        program.save()
+
+    assert get_catalog_version() == version + 1
+    names = [row["name"] for row in client.get(URL).data["results"]]
+    assert names == ["Web Foundations"]
+
+
+def test_concurrent_miss_waits_for_lock_holder():
+    calls = []
+    key = catalog_key("probe", "a")
+    cache.add(f"{key}:lock", 1)  # another worker is recomputing
+
+    result = {}
+    waiter = threading.Thread(
+        target=lambda: result.setdefault("value", get_or_compute("probe", ("a",), lambda: calls.append(1)))
+    )
+    waiter.start()
+    cache.set(key, "computed elsewhere")
+    waiter.join(timeout=5)
+
+    assert result["value"] == "computed elsewhere"
+    assert calls == []
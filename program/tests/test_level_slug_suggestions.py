@@ -0,0 +1,56 @@
+# program/tests/test_level_slug_suggestions.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from program.models import Program, ProgramLevel
+from program.utils import LevelSlugIndex, suggest_similar_level_slugs, trigrams
+
+
+@pytest.fixture
+def levels(db):
+    web = Program.objects.create(name="Web", category="BEG")
+    data = Program.objects.create(name="Data", category="ADV")
+    titles = ["HTML Basics", "CSS Layouts", "JavaScript Intro", "React Apps", "Deploying"]
+    made = [
+        ProgramLevel.objects.create(program=web, level_number=i, title=title, description="-")
+        for i, title in enumerate(titles, start=1)
+    ]
+    made.append(ProgramLevel.objects.create(program=data, level_number=1, title="Pandas", description="-"))
+    return made
+
+
+def test_trigrams_match_pg_trgm_padding():
+    assert trigrams("Cat") == {"  c", " ca", "cat", "at "}
+
+
+def test_index_ranks_by_jaccard_over_slug_and_title():
+    index = LevelSlugIndex([
+        ("web-level-1-html", "HTML Basics", "web", "BEG"),
+        ("web-level-2-css", "CSS Layouts", "web", "BEG"),
+    ])
+    assert index.search("web-level-1-htm") == ["web-level-1-html", "web-level-2-css"]
+    # Title-only hit still maps back to the slug.
+    assert index.search("layouts", limit=1) == ["web-level-2-css"]
+    assert index.search("zzzz") == []
+
+
+@pytest.mark.django_db
+def test_suggestions_are_scoped_and_query_free_when_warm(levels):
+    typo = levels[2].slug.replace("javascript", "javscript")
+    suggestions = suggest_similar_level_slugs(typo, program_slug=levels[0].program.slug)
+    assert suggestions[0] == levels[2].slug
+    assert levels[5].slug not in suggestions
+
+    with CaptureQueriesContext(connection) as ctx:
+        suggest_similar_level_slugs(typo, category="BEG")
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_index_is_rebuilt_after_level_changes(levels):
+    suggest_similar_level_slugs("anything")
+    new = ProgramLevel.objects.create(
+        program=levels[0].program, level_number=9, title="Kubernetes", description="-"
+    )
+    assert suggest_similar_level_slugs("kubernetes", program_slug=levels[0].program.slug)[0] == new.slug
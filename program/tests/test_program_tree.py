@@ -0,0 +1,83 @@
+# program/tests/test_program_tree.py
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from classes.models import Lesson
+from module.models import Module, ModuleLevelLink
+from program.models import Program, ProgramLevel, Session
+
+User = get_user_model()
+
+
+@pytest.fixture
+def program(db):
+    program = Program.objects.create(name="Web Dev", category="BEG")
+    now = timezone.now()
+    for number in (1, 2):
+        level = ProgramLevel.objects.create(
+            program=program, level_number=number, title=f"Level {number}", description="-"
+        )
+        Session.objects.create(level=level, title=f"Kickoff {number}", mode="LIVE", start_datetime=now)
+        # Link order deliberately differs from title order.
+        for order, title in ((2, f"HTML {number}"), (1, f"Git {number}")):
+            module = Module.objects.create(title=title)
+            ModuleLevelLink.objects.create(module=module, level=level, order=order)
+            for i, audience in enumerate(("FREE", "STAFF")):
+                Lesson.objects.create(
+                    title=f"{title} lesson {audience}", description="-",
+                    date=now + timedelta(days=i), module=module, program_level=level,
+                    audience=audience, is_published=True,
+                )
+    return program
+
+
+def _url(program):
+    return f"/api/program/programs/{program.slug}/tree/"
+
+
+@pytest.mark.django_db
+def test_tree_nests_layers_in_link_order(program):
+    response = APIClient().get(_url(program))
+
+    assert response.status_code == 200
+    levels = response.data["levels"]
+    assert [level["level_number"] for level in levels] == [1, 2]
+    assert [s["title"] for s in levels[0]["sessions"]] == ["Kickoff 1"]
+    assert [m["title"] for m in levels[0]["modules"]] == ["Git 1", "HTML 1"]
+    # Anonymous callers only see FREE/BOTH lessons.
+    assert [l["title"] for l in levels[0]["modules"][0]["lessons"]] == ["Git 1 lesson FREE"]
+
+
+@pytest.mark.django_db
+def test_staff_see_all_lessons(program):
+    staff = User.objects.create_user(
+        email="staff@example.com", password="pass1234",
+        first_name="Staff", last_name="User", role="LECTURER", is_staff=True,
+    )
+    client = APIClient()
+    client.force_authenticate(user=staff)
+
+    lessons = client.get(_url(program)).data["levels"][1]["modules"][1]["lessons"]
+    assert [l["audience"] for l in lessons] == ["FREE", "STAFF"]
+
+
+@pytest.mark.django_db
+def test_tree_query_count_is_constant_and_cached(program):
+    with CaptureQueriesContext(connection) as ctx:
+        APIClient().get(_url(program))
+    assert len(ctx.captured_queries) == 5
+
+    with CaptureQueriesContext(connection) as ctx:
+        APIClient().get(_url(program))
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_unknown_program_is_404(program):
+    assert APIClient().get("/api/program/programs/nope/tree/").status_code == 404
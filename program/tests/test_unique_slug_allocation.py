@@ -0,0 +1,63 @@
+# program/tests/test_unique_slug_allocation.py
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from common.utils import _slug_candidates, generate_unique_slug
+from program.models import Program, ProgramLevel
+
+
+@pytest.mark.django_db
+def test_collisions_resolved_with_one_query():
+    for i, suffix in enumerate(("", "-2", "-3", "-5")):
+        Program.objects.create(name=f"Program {i}", category="BEG", slug=f"taken{suffix}")
+
+    with CaptureQueriesContext(connection) as ctx:
+        slug = generate_unique_slug(Program(), "Taken")
+
+    assert slug == "taken-4"  # first gap, same as the old counter loop
+    assert len(ctx.captured_queries) == 1
+
+
+@pytest.mark.django_db
+def test_only_the_slug_and_its_numbered_variants_are_loaded():
+    for i, slug in enumerate(("taken", "taken-2", "taken-over", "takenaway", "taken-2-b")):
+        Program.objects.create(name=f"Program {i}", category="BEG", slug=slug)
+
+    candidates = Program.objects.filter(_slug_candidates("taken", "slug", 100))
+
+    assert set(candidates.values_list("slug", flat=True)) == {"taken", "taken-2"}
+    assert generate_unique_slug(Program(), "Taken") == "taken-3"
+
+
+@pytest.mark.django_db
+def test_suffix_respects_max_length():
+    long_title = "x" * 120
+    first = generate_unique_slug(Program(), long_title, max_length=100)
+    Program.objects.create(name="Long", category="BEG", slug=first)
+
+    second = generate_unique_slug(Program(), long_title, max_length=100)
+    assert second == "x" * 98 + "-2"
+
+
+@pytest.mark.django_db
+def test_bulk_assignment_is_unique_within_batch_and_table():
+    Program.objects.create(name="Intro", category="BEG")  # slug "intro-beg"
+    batch = [Program(name="Intro", category="BEG") for _ in range(3)]
+    batch.append(Program(name="Keep", category="ADV", slug="intro-beg-3"))
+
+    with CaptureQueriesContext(connection) as ctx:
+        Program.assign_slugs(batch)
+    assert len(ctx.captured_queries) == 1
+
+    assert [p.slug for p in batch] == ["intro-beg-2", "intro-beg-4", "intro-beg-5", "intro-beg-3"]
+
+
+@pytest.mark.django_db
+def test_program_level_slug_uses_shared_allocator():
+    program = Program.objects.create(name="Web", category="BEG")
+    first = ProgramLevel.objects.create(program=program, level_number=1, title="Start", description="-")
+    ProgramLevel.objects.filter(pk=first.pk).update(level_number=2)
+    again = ProgramLevel.objects.create(program=program, level_number=1, title="Start", description="-")
+
+    assert again.slug == f"{first.slug}-2"
@@ -0,0 +1,94 @@
+# program/tree.py
+"""
+Single-pass assembly of the full program hierarchy:
+
+    program -> levels -> sessions
+                      -> modules (ModuleLevelLink.order) -> lessons
+
+Each layer is fetched with one query and stitched together in Python, so the
+whole tree costs five queries no matter how many levels/modules/lessons it has.
+"""
+from collections import defaultdict
+
+from common.mixins import filter_lessons_by_audience
+from .models import Program, ProgramLevel, Session
+
+LEVEL_FIELDS = ('id', 'slug', 'level_number', 'title', 'description')
+SESSION_FIELDS = ('id', 'level_id', 'title', 'mode', 'start_datetime', 'end_datetime')
+LESSON_FIELDS = (
+    'id', 'slug', 'title', 'date', 'delivery', 'audience',
+    'duration_minutes', 'module_id', 'program_level_id', 'session_id',
+)
+
+
+def _visible_lessons(user):
+    from classes.models import Lesson
+
+    qs = Lesson.objects.filter(is_active=True)
+    if not user.is_staff:
+        qs = qs.filter(is_published=True)
+    return filter_lessons_by_audience(qs, user)
+
+
+def build_program_tree(slug, user):
+    """
+    Return the nested tree for the program with `slug` as plain dicts.
+    Raises Program.DoesNotExist for an unknown slug.
+    """
+    from module.models import ModuleLevelLink
+
+    program = Program.objects.values('id', 'name', 'slug', 'category', 'description').get(slug=slug)
+
+    levels = list(
+        ProgramLevel.objects.filter(program_id=program['id'])
+        .order_by('level_number')
+        .values(*LEVEL_FIELDS)
+    )
+    level_ids = [level['id'] for level in levels]
+
+    sessions_by_level = defaultdict(list)
+    for session in Session.objects.filter(level_id__in=level_ids).order_by('start_datetime').values(*SESSION_FIELDS):
+        sessions_by_level[session.pop('level_id')].append(session)
+
+    links = list(
+        ModuleLevelLink.objects
+        .filter(level_id__in=level_ids, module__is_active=True)
+        .order_by('level_id', 'order')
+        .values('level_id', 'order', 'module_id', 'module__slug', 'module__title', 'module__is_standalone')
+    )
+    module_ids = {link['module_id'] for link in links}
+
+    # Lessons pinned to a level only show there; level-less lessons follow
+    # their module into every level that links it.
+    lessons_by_module_level = defaultdict(list)
+    lessons = (
+        _visible_lessons(user)
+        .filter(module_id__in=module_ids)
+        .order_by('date', 'id')
+        .values(*LESSON_FIELDS)
+    )
+    for lesson in lessons:
+        key = (lesson.pop('module_id'), lesson.pop('program_level_id'))
+        lessons_by_module_level[key].append(lesson)
+
+    modules_by_level = defaultdict(list)
+    for link in links:
+        module_id, level_id = link['module_id'], link['level_id']
+        modules_by_level[level_id].append({
+            'id': module_id,
+            'slug': link['module__slug'],
+            'title': link['module__title'],
+            'is_standalone': link['module__is_standalone'],
+            'order': link['order'],
+            'lessons': sorted(
+                lessons_by_module_level[(module_id, level_id)] + lessons_by_module_level[(module_id, None)],
+                key=lambda lesson: (lesson['date'], lesson['id']),
+            ),
+        })
+
+    for level in levels:
+        level['sessions'] = sessions_by_level[level['id']]
+        level['modules'] = modules_by_level[level['id']]
+
+    program['levels'] = levels
+    return program
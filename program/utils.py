@@ -1,9 +1,124 @@
 # program/utils.py
-from difflib import get_close_matches
+import re
+import threading
+from collections import defaultdict
 from typing import List, Optional
 
-from django.db.models import Q
-from program.models import ProgramLevel, Program
+from common.catalog import get_catalog_version
+from program.models import ProgramLevel
+
+SIMILARITY_CUTOFF = 0.3  # same default threshold as pg_trgm
+
+_WORD_SPLIT = re.compile(r'[^a-z0-9]+')
+
+
+def trigrams(value: str) -> frozenset:
+    """
+    pg_trgm-style character trigrams: lowercase, split on non-alphanumerics,
+    pad every word with two leading spaces and one trailing space.
+    """
+    grams = set()
+    for word in _WORD_SPLIT.split(value.lower()):
+        if word:
+            padded = f"  {word} "
+            grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class LevelSlugIndex:
+    """
+    In-memory inverted index (trigram -> level entries) over ProgramLevel
+    slugs and titles. Built once per worker and reused until the catalog
+    version moves or a ProgramLevel/Program signal drops it.
+    """
+    SLUG, TITLE = 0, 1
+
+    def __init__(self, rows):
+        # rows: iterable of (slug, title, program_slug, program_category)
+        self.entries = []
+        self.all_slugs = []
+        self.grams = []       # per entry: (slug_grams, title_grams)
+        self.postings = defaultdict(list)
+        self.slugs_by_program = defaultdict(list)
+        self.slugs_by_category = defaultdict(list)
+        for entry_id, (slug, title, program_slug, category) in enumerate(rows):
+            self.entries.append((slug, program_slug, category))
+            self.all_slugs.append(slug)
+            self.slugs_by_program[program_slug].append(slug)
+            self.slugs_by_category[category].append(slug)
+            slug_grams, title_grams = trigrams(slug), trigrams(title or '')
+            self.grams.append((slug_grams, title_grams))
+            for gram in slug_grams:
+                self.postings[gram].append((entry_id, self.SLUG))
+            for gram in title_grams:
+                self.postings[gram].append((entry_id, self.TITLE))
+
+    @classmethod
+    def build(cls):
+        return cls(
+            ProgramLevel.objects.values_list('slug', 'title', 'program__slug', 'program__category')
+        )
+
+    def _matches_scope(self, entry_id, program_slug, category):
+        _, entry_program, entry_category = self.entries[entry_id]
+        if program_slug:
+            return entry_program == program_slug
+        if category:
+            return entry_category == category
+        return True
+
+    def candidates(self, program_slug=None, category=None):
+        if program_slug:
+            return self.slugs_by_program.get(program_slug, [])
+        if category:
+            return self.slugs_by_category.get(category, [])
+        return self.all_slugs
+
+    def search(self, value, program_slug=None, category=None, limit=5, cutoff=SIMILARITY_CUTOFF):
+        query = trigrams(value)
+        if not query:
+            return []
+
+        shared = defaultdict(int)
+        for gram in query:
+            for key in self.postings.get(gram, ()):
+                shared[key] += 1
+
+        best = {}
+        for (entry_id, field), overlap in shared.items():
+            if not self._matches_scope(entry_id, program_slug, category):
+                continue
+            field_grams = self.grams[entry_id][field]
+            score = overlap / (len(query) + len(field_grams) - overlap)
+            if score >= cutoff and score > best.get(entry_id, 0):
+                best[entry_id] = score
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1], self.entries[item[0]][0]))
+        return [self.entries[entry_id][0] for entry_id, _ in ranked[:limit]]
+
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def get_level_slug_index() -> LevelSlugIndex:
+    global _index, _index_version
+    version = get_catalog_version()
+    index = _index
+    if index is not None and _index_version == version:
+        return index
+    with _index_lock:
+        if _index is None or _index_version != version:
+            _index = LevelSlugIndex.build()
+            _index_version = version
+        return _index
+
+
+def invalidate_level_slug_index():
+    """Drop this worker's index; other workers notice the catalog version bump."""
+    global _index
+    _index = None
 
 
 def suggest_similar_level_slugs(
@@ -16,28 +131,15 @@ def suggest_similar_level_slugs(
     Return a small list of similar ProgramLevel slugs to help fix typos.
     Filters candidates by program_slug (if provided) or category (if provided)
     for more relevant hints.
-    """
-    qs = ProgramLevel.objects.select_related("program")
 
-    if program_slug:
-        qs = qs.filter(program__slug=program_slug)
-    elif category:
-        qs = qs.filter(program__category=category)
+    Ranked by trigram Jaccard similarity against both slug and title, using
+    the worker-cached LevelSlugIndex (no queries on a warm index).
+    """
+    index = get_level_slug_index()
 
-    # Build a pool of 'search keys' that users might type
-    # (slug is primary; title is a secondary signal)
-    all_candidates = list(qs.values_list("slug", flat=True))
+    all_candidates = index.candidates(program_slug, category)
     if len(all_candidates) < limit:
         # If list is tiny, just return it as-is (no fuzzy matching needed)
         return all_candidates[:limit]
 
-    # Fuzzy match on slug; if that yields nothing, fall back to titles→slugs
-    matches = get_close_matches(input_slug, all_candidates, n=limit, cutoff=0.55)
-    if matches:
-        return matches
-
-    # Second pass: fuzzy match on titles and then map back to slugs
-    title_map = dict(qs.values_list("title", "slug"))
-    title_candidates = list(title_map.keys())
-    title_hits = get_close_matches(input_slug, title_candidates, n=limit, cutoff=0.55)
-    return [title_map[t] for t in title_hits]
+    return index.search(input_slug, program_slug=program_slug, category=category, limit=limit)
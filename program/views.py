@@ -8,6 +8,9 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.exceptions import NotFound
 from .utils import suggest_similar_level_slugs
+from .tree import build_program_tree
+from common.catalog import CatalogCacheMixin, audience_bucket, get_or_compute
+from common.mixins import ConditionalGetMixin
 
 from .models import Program, ProgramLevel, Session, ProgramCategory
 from .serializers import (
@@ -28,7 +31,7 @@ class IsAdminOrReadOnly(permissions.BasePermission):
 
 
 # --- Program ViewSet ---
-class ProgramViewSet(viewsets.ModelViewSet):
+class ProgramViewSet(ConditionalGetMixin, CatalogCacheMixin, viewsets.ModelViewSet):
     queryset = Program.objects.select_related('director').prefetch_related('levels')
     serializer_class = ProgramSerializer
     permission_classes = [IsAdminOrReadOnly]
@@ -36,6 +39,7 @@ class ProgramViewSet(viewsets.ModelViewSet):
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'description']
     ordering_fields = ['created_at', 'name']
+    etag_uses_catalog_version = True
 
     @extend_schema(
         summary="List levels for this program",
@@ -71,6 +75,24 @@ class ProgramViewSet(viewsets.ModelViewSet):
         ser = SessionSerializer(page or qs, many=True, context={'request': request})
         return self.get_paginated_response(ser.data) if page is not None else Response(ser.data)
 
+    @extend_schema(
+        summary="Full program tree",
+        description=(
+            "Program -> levels -> sessions / modules (by link order) -> lessons, "
+            "filtered by the caller's lesson audience. Cached under the catalog version."
+        ),
+    )
+    @action(detail=True, methods=['get'])
+    def tree(self, request, slug=None):
+        try:
+            data = get_or_compute(
+                'program.tree', (slug, audience_bucket(request.user)),
+                lambda: build_program_tree(slug, request.user),
+            )
+        except Program.DoesNotExist:
+            raise NotFound("Program not found.")
+        return Response(data)
+
 
 # --- ProgramLevel ViewSet ---
 class ProgramLevelViewSet(viewsets.ModelViewSet):
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from search.models import SearchDocument
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    list_display = ('title', 'kind', 'audience', 'is_published', 'visible_from', 'updated_at')
+    list_filter = ('kind', 'audience', 'is_published')
+    search_fields = ('title',)
+    readonly_fields = [field.name for field in SearchDocument._meta.fields]
@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+
+    def ready(self):
+        # Save / delete hooks that keep SearchDocument in step with the content
+        import search.signals
+
+        # Re-create SQLite full-text triggers dropped by table rebuilds
+        from common.search_index import ensure_search_indexes
+        post_migrate.connect(ensure_search_indexes, sender=self)
@@ -0,0 +1,203 @@
+# search/documents.py
+"""
+What goes into SearchDocument for each indexed model, and how it is written.
+
+Each Source maps one model to a document (or None when the object must not
+be searchable at all, e.g. soft-deleted). search.signals re-indexes an object
+on save / delete; `manage.py reindex_search` rebuilds whole models in chunks
+through the same `index_queryset`. Writes are upserts on
+(content_type, object_id), one query per batch.
+
+Audiences: lessons, events and support topics keep their own audience
+choices, folded into DocumentAudience; `visible_to(user)` is the matching
+per-role filter.
+"""
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.utils import timezone
+
+from search.models import DocumentAudience, DocumentKind, SearchDocument
+
+SUMMARY_CHARS = 300
+
+DOCUMENT_FIELDS = ['kind', 'title', 'slug', 'summary', 'body', 'tags', 'audience', 'is_published', 'visible_from']
+
+
+def _tags(value):
+    if not value:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ' '.join(str(tag) for tag in value if tag)
+    return str(value)
+
+
+def _lesson(lesson):
+    if not lesson.is_active:
+        return None
+    audience = {
+        'FREE': DocumentAudience.PUBLIC,
+        'BOTH': DocumentAudience.PUBLIC,
+        'ENROLLED': DocumentAudience.ENROLLED,
+    }.get(lesson.audience, DocumentAudience.STAFF)
+    return dict(title=lesson.title, body=lesson.description, audience=audience, is_published=lesson.is_published)
+
+
+def _module(module):
+    if not module.is_active:
+        return None
+    body = '\n\n'.join(part for part in (module.description, module.prerequisites) if part)
+    return dict(title=module.title, body=body, tags=_tags(module.tools_software))
+
+
+def _news(post):
+    from news.models.base import Status
+
+    return dict(
+        title=post.title, summary=post.summary, body=post.content, tags=_tags(post.tags),
+        is_published=post.status == Status.PUBLISHED and post.published_on is not None,
+        visible_from=post.published_on,
+    )
+
+
+def _event(event):
+    audience = {
+        'FREE': DocumentAudience.FREE,
+        'ENROLLED': DocumentAudience.ENROLLED,
+    }.get(event.target_group, DocumentAudience.PUBLIC)
+    return dict(
+        title=event.title, summary=event.audience_description, body=event.description,
+        tags=' '.join(filter(None, [_tags(event.tags), event.venue])),
+        audience=audience, is_published=event.is_published, visible_from=event.published_on,
+    )
+
+
+def _support_topic(topic):
+    if not topic.is_active:
+        return None
+    audience = DocumentAudience.ENROLLED if topic.audience == 'ENROLLED' else DocumentAudience.PUBLIC
+    return dict(
+        title=topic.title, body=topic.content, tags=topic.category.name,
+        audience=audience, is_published=topic.category.is_active,
+    )
+
+
+class Source:
+    """
+    `fields`: model fields the document reads; saves limited (update_fields)
+    to other fields skip re-indexing. `select_related` feeds `build`.
+    """
+
+    def __init__(self, kind, model, build, fields, select_related=()):
+        self.kind = kind
+        self.model_label = model
+        self.build = build
+        self.fields = frozenset(fields)
+        self.select_related = select_related
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def document(self, obj):
+        data = self.build(obj)
+        if data is None:
+            return None
+        data['title'] = (data.get('title') or '')[:255]
+        data['summary'] = (data.get('summary') or '')[:SUMMARY_CHARS]
+        return SearchDocument(
+            content_type=ContentType.objects.get_for_model(self.model),
+            object_id=obj.pk, kind=self.kind, slug=getattr(obj, 'slug', '') or '', **data,
+        )
+
+
+SOURCES = [
+    Source(DocumentKind.LESSON, 'classes.Lesson', _lesson,
+           ['title', 'description', 'audience', 'is_published', 'is_active', 'slug']),
+    Source(DocumentKind.MODULE, 'module.Module', _module,
+           ['title', 'description', 'prerequisites', 'tools_software', 'is_active', 'slug']),
+    Source(DocumentKind.NEWS, 'news.NewsPost', _news,
+           ['title', 'summary', 'content', 'tags', 'status', 'published_on', 'slug']),
+    Source(DocumentKind.EVENT, 'event.Event', _event,
+           ['title', 'audience_description', 'description', 'tags', 'venue', 'target_group',
+            'is_published', 'published_on', 'slug']),
+    Source(DocumentKind.SUPPORT, 'support.SupportTopic', _support_topic,
+           ['title', 'content', 'category', 'audience', 'is_active', 'slug'], select_related=('category',)),
+]
+
+
+def source_for(model):
+    label = model._meta.label
+    return next((source for source in SOURCES if source.model_label == label), None)
+
+
+def write_documents(source, objects):
+    """Upsert the documents for `objects`, delete those that are no longer searchable."""
+    documents, dropped = [], []
+    for obj in objects:
+        document = source.document(obj)
+        if document is None:
+            dropped.append(obj.pk)
+        else:
+            documents.append(document)
+    if documents:
+        SearchDocument.objects.bulk_create(
+            documents, update_conflicts=True,
+            unique_fields=['content_type', 'object_id'], update_fields=[*DOCUMENT_FIELDS, 'updated_at'],
+        )
+    if dropped:
+        remove_documents(source.model, dropped)
+    return len(documents)
+
+
+def remove_documents(model, pks):
+    content_type = ContentType.objects.get_for_model(model)
+    SearchDocument.objects.filter(content_type=content_type, object_id__in=pks).delete()
+
+
+def index_instance(instance, update_fields=None):
+    source = source_for(type(instance))
+    if source is None:
+        return
+    if update_fields is not None and source.fields.isdisjoint(update_fields):
+        return
+    write_documents(source, [instance])
+
+
+def index_queryset(source, queryset, chunk_size=500):
+    """Index `queryset` in pk-ordered chunks; returns the number of documents written."""
+    queryset = queryset.select_related(*source.select_related).order_by('pk')
+    written, last_pk = 0, None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk[:chunk_size])
+        if not chunk:
+            return written
+        written += write_documents(source, chunk)
+        last_pk = chunk[-1].pk
+
+
+def audiences_for(user):
+    """
+    Audiences a user may search, or None for everything (staff).
+    Enrolled students, lecturers and volunteers see enrolled content;
+    other signed-in users see free content as well as public.
+    """
+    if user is None or not user.is_authenticated:
+        return [DocumentAudience.PUBLIC]
+    if user.is_staff:
+        return None
+    if getattr(user, 'is_enrolled', False) or user.role in ('ENROLLED', 'LECTURER', 'VOLUNTEER'):
+        return [DocumentAudience.PUBLIC, DocumentAudience.ENROLLED]
+    return [DocumentAudience.PUBLIC, DocumentAudience.FREE]
+
+
+def visible_to(user):
+    """Q limiting SearchDocument to what `user` may see (staff also see drafts)."""
+    audiences = audiences_for(user)
+    if audiences is None:
+        return Q()
+    return (
+        Q(audience__in=audiences, is_published=True)
+        & (Q(visible_from__isnull=True) | Q(visible_from__lte=timezone.now()))
+    )
@@ -0,0 +1,41 @@
+# search/management/commands/reindex_search.py
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+
+from search import documents
+from search.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild SearchDocument rows from lessons, modules, news posts, events and support topics, "
+        "in pk-ordered chunks, and drop documents whose source object is gone."
+    )
+
+    def add_arguments(self, parser):
+        kinds = [source.kind.lower() for source in documents.SOURCES]
+        parser.add_argument('kinds', nargs='*', metavar='kind', help=f"Only these kinds ({', '.join(kinds)}).")
+        parser.add_argument('--chunk-size', type=int, default=500, help='Objects loaded and upserted per query.')
+
+    def handle(self, *args, **opts):
+        wanted = {kind.upper() for kind in opts['kinds']}
+        unknown = wanted - {source.kind for source in documents.SOURCES}
+        if unknown:
+            raise CommandError(f"Unknown kind(s): {', '.join(sorted(unknown)).lower()}")
+
+        for source in documents.SOURCES:
+            if wanted and source.kind not in wanted:
+                continue
+            started = time.perf_counter()
+            model = source.model
+            written = documents.index_queryset(source, model._default_manager.all(), max(1, opts['chunk_size']))
+            stale, _ = SearchDocument.objects.filter(
+                content_type=ContentType.objects.get_for_model(model),
+            ).exclude(object_id__in=model._default_manager.values('pk')).delete()
+            self.stdout.write(
+                f"{source.kind.lower()}: {written} indexed, {stale} stale removed "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
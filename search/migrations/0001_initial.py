@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from common.search_index import CreateSearchIndex
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('kind', models.CharField(choices=[('LESSON', 'Lesson'), ('MODULE', 'Module'), ('NEWS', 'News Post'), ('EVENT', 'Event'), ('SUPPORT', 'Support Topic')], max_length=10)),
+                ('title', models.CharField(max_length=255)),
+                ('slug', models.SlugField(blank=True, max_length=200)),
+                ('summary', models.TextField(blank=True)),
+                ('body', models.TextField(blank=True)),
+                ('tags', models.TextField(blank=True, help_text='Space-separated keywords')),
+                ('audience', models.CharField(choices=[('PUBLIC', 'Everyone'), ('FREE', 'Free Users'), ('ENROLLED', 'Enrolled Students'), ('STAFF', 'Academy Staff Only')], default='PUBLIC', max_length=10)),
+                ('is_published', models.BooleanField(default=True)),
+                ('visible_from', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['is_published', 'audience'], name='search_doc_visibility_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id'), name='unique_search_document')],
+            },
+        ),
+        CreateSearchIndex(
+            model_name='searchdocument',
+            fields=[('title', 'A'), ('summary', 'B'), ('body', 'C'), ('tags', 'D')],
+        ),
+    ]
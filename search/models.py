@@ -0,0 +1,55 @@
+# search/models.py
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+
+class DocumentKind(models.TextChoices):
+    LESSON = 'LESSON', 'Lesson'
+    MODULE = 'MODULE', 'Module'
+    NEWS = 'NEWS', 'News Post'
+    EVENT = 'EVENT', 'Event'
+    SUPPORT = 'SUPPORT', 'Support Topic'
+
+
+class DocumentAudience(models.TextChoices):
+    PUBLIC = 'PUBLIC', 'Everyone'
+    FREE = 'FREE', 'Free Users'
+    ENROLLED = 'ENROLLED', 'Enrolled Students'
+    STAFF = 'STAFF', 'Academy Staff Only'
+
+
+class SearchDocument(models.Model):
+    """
+    One searchable row per lesson, module, news post, event and support topic,
+    kept current by search.signals (see search.documents). The audience and
+    visibility columns let /api/search/ filter per role in SQL.
+    """
+    # Weighted full-text document (common.search_index; built by migration 0001)
+    search_vector_fields = (('title', 'A'), ('summary', 'B'), ('body', 'C'), ('tags', 'D'))
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, related_name='+')
+    object_id = models.PositiveBigIntegerField()
+    kind = models.CharField(max_length=10, choices=DocumentKind.choices)
+
+    title = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=200, blank=True)
+    summary = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    tags = models.TextField(blank=True, help_text='Space-separated keywords')
+
+    audience = models.CharField(max_length=10, choices=DocumentAudience.choices, default=DocumentAudience.PUBLIC)
+    is_published = models.BooleanField(default=True)
+    visible_from = models.DateTimeField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id'], name='unique_search_document'),
+        ]
+        indexes = [
+            models.Index(fields=['is_published', 'audience'], name='search_doc_visibility_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.get_kind_display()}: {self.title}'
@@ -0,0 +1,14 @@
+# search/serializers.py
+from rest_framework import serializers
+
+from common.search import SearchHitFieldsMixin
+from search.models import SearchDocument
+
+
+class SearchDocumentSerializer(SearchHitFieldsMixin, serializers.ModelSerializer):
+    kind_display = serializers.CharField(source='get_kind_display', read_only=True)
+
+    class Meta:
+        model = SearchDocument
+        fields = ['kind', 'kind_display', 'object_id', 'slug', 'title', 'summary', 'visible_from']
+        read_only_fields = fields
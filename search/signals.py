@@ -0,0 +1,27 @@
+# search/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from search import documents
+
+
+def reindex_on_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    if not raw:  # fixtures load before their related rows exist
+        documents.index_instance(instance, update_fields)
+
+
+def remove_on_delete(sender, instance, **kwargs):
+    documents.remove_documents(sender, [instance.pk])
+
+
+for _source in documents.SOURCES:
+    post_save.connect(reindex_on_save, sender=_source.model_label, dispatch_uid=f'search-index-{_source.kind}')
+    post_delete.connect(remove_on_delete, sender=_source.model_label, dispatch_uid=f'search-remove-{_source.kind}')
+
+
+# Topic documents carry their category's name and visibility
+@receiver(post_save, sender='support.SupportCategory', dispatch_uid='search-index-support-category')
+def reindex_category_topics(sender, instance, raw=False, **kwargs):
+    if not raw:
+        source = documents.source_for(instance.topics.model)
+        documents.index_queryset(source, instance.topics.all())
@@ -0,0 +1,129 @@
+# search/tests/test_search_endpoint.py
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from classes.models import Lesson
+from core.models import User
+from event.models import Event
+from module.models import Module
+from news.models import NewsPost
+from news.models.base import Status
+from program.models import ProgramLevel
+from search.models import SearchDocument
+from support.models import SupportCategory, SupportTopic
+
+SEARCH = "/api/search/"
+
+
+@pytest.fixture
+def content():
+    now = timezone.now()
+    return {
+        "lesson": baker.make(Lesson, title="Robotics basics", description="Motors and sensors",
+                             audience="BOTH", is_published=True),
+        "enrolled_lesson": baker.make(Lesson, title="Robotics lab", description="Build a rover",
+                                      audience="ENROLLED", is_published=True),
+        "draft_lesson": baker.make(Lesson, title="Robotics draft", description="", is_published=False),
+        "module": baker.make(Module, title="Electronics", description="Intro to robotics kits",
+                             tools_software=["Arduino"]),
+        "post": baker.make(NewsPost, title="Club news", summary="", content="Our robotics team won",
+                           tags=["competition"], status=Status.PUBLISHED, published_on=now),
+        "event": baker.make(Event, title="Open day", description="Meet the robotics club",
+                            audience_description="", venue="Hall", tags=[], target_group="ALL",
+                            is_published=True, published_on=now),
+        "topic": baker.make(SupportTopic, title="Robotics kit returns", content="How to send it back",
+                            audience="ENROLLED", category=baker.make(SupportCategory, name="Kits")),
+    }
+
+
+def _kinds(response):
+    assert response.status_code == 200
+    return [(row["kind"], row["object_id"]) for row in response.json()["results"]]
+
+
+def _client(user=None):
+    client = APIClient()
+    if user is not None:
+        client.force_authenticate(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_mixed_results_ranked_in_one_query(content):
+    _client().get(SEARCH, {"q": "warm-up"})  # index lookup is cached per process
+    with CaptureQueriesContext(connection) as ctx:
+        response = _client().get(SEARCH, {"q": "robotics"})
+
+    results = _kinds(response)
+    # title matches first; only public, published content for anonymous users
+    assert results[0] == ("LESSON", content["lesson"].pk)
+    assert set(results) == {
+        ("LESSON", content["lesson"].pk), ("MODULE", content["module"].pk),
+        ("NEWS", content["post"].pk), ("EVENT", content["event"].pk),
+    }
+    assert "<mark>" in response.json()["results"][1]["search_snippet"]
+    assert len(ctx.captured_queries) == 2  # count + page
+
+    assert set(_kinds(_client().get(SEARCH, {"q": "robotics", "type": "news,event"}))) == {
+        ("NEWS", content["post"].pk), ("EVENT", content["event"].pk),
+    }
+    assert _kinds(_client().get(SEARCH)) == []
+
+
+@pytest.mark.django_db
+def test_results_follow_the_callers_role(content):
+    enrolled = baker.make(User, role=User.Roles.ENROLLED, program_level=baker.make(ProgramLevel), is_active=True)
+    staff = baker.make(User, role=User.Roles.ADMIN, is_staff=True, is_active=True)
+
+    enrolled_results = set(_kinds(_client(enrolled).get(SEARCH, {"q": "robotics"})))
+    assert ("LESSON", content["enrolled_lesson"].pk) in enrolled_results
+    assert ("SUPPORT", content["topic"].pk) in enrolled_results
+    assert ("LESSON", content["draft_lesson"].pk) not in enrolled_results
+
+    staff_results = set(_kinds(_client(staff).get(SEARCH, {"q": "robotics"})))
+    assert ("LESSON", content["draft_lesson"].pk) in staff_results
+    assert len(staff_results) == 7
+
+
+@pytest.mark.django_db
+def test_save_hooks_follow_edits_and_deletes(content):
+    lesson, post = content["lesson"], content["post"]
+
+    lesson.title = "Gardening"
+    lesson.save()
+    assert ("LESSON", lesson.pk) not in _kinds(_client().get(SEARCH, {"q": "robotics"}))
+
+    post.view_count = 5
+    post.save(update_fields=["view_count"])  # not an indexed field: no write
+    post.status = Status.DRAFT
+    post.save()
+    lesson.delete()  # soft delete
+    content["module"].delete()
+
+    assert _kinds(_client().get(SEARCH, {"q": "robotics"})) == [("EVENT", content["event"].pk)]
+    assert not SearchDocument.objects.filter(kind="LESSON", object_id=lesson.pk).exists()
+    assert not SearchDocument.objects.filter(kind="MODULE").exists()
+
+
+@pytest.mark.django_db
+def test_reindex_command_rebuilds_in_chunks(content, capsys):
+    SearchDocument.objects.all().delete()
+    ghost = SearchDocument.objects.create(
+        content_type=ContentType.objects.get_for_model(NewsPost), object_id=10 ** 9, kind="NEWS", title="Robotics",
+    )
+
+    call_command("reindex_search", chunk_size=2)
+
+    out = capsys.readouterr().out
+    assert "lesson: 3 indexed" in out
+    assert SearchDocument.objects.count() == 7
+    assert len(_kinds(_client().get(SEARCH, {"q": "robotics"}))) == 4
+
+    assert not SearchDocument.objects.filter(pk=ghost.pk).exists()
+    assert "news: 1 indexed, 1 stale removed" in out
@@ -0,0 +1,37 @@
+# search/views.py
+from rest_framework import generics, permissions
+
+from common.mixins import ValuesListMixin
+from common.search import FullTextSearchFilter, SearchRankOrderingFilter
+from search.documents import visible_to
+from search.models import DocumentKind, SearchDocument
+from search.serializers import SearchDocumentSerializer
+
+
+class DocumentSearchFilter(FullTextSearchFilter):
+    search_param = 'q'
+
+
+class SearchView(ValuesListMixin, generics.ListAPIView):
+    """
+    GET /api/search/?q=robots[&type=lesson,news]
+
+    Lessons, modules, news, events and support topics in one ranked list,
+    limited in SQL to what the caller's role may see. Without `q` the
+    result is empty.
+    """
+    serializer_class = SearchDocumentSerializer
+    permission_classes = [permissions.AllowAny]
+    filter_backends = [DocumentSearchFilter, SearchRankOrderingFilter]
+    ordering_fields = ['visible_from', 'updated_at']
+    ordering = ['-visible_from', '-pk']
+
+    def get_queryset(self):
+        if not DocumentSearchFilter().get_search_terms(self.request):
+            return SearchDocument.objects.none()
+        qs = SearchDocument.objects.filter(visible_to(self.request.user))
+        kinds = self.request.query_params.get('type')
+        if kinds:
+            wanted = {kind.strip().upper() for kind in kinds.split(',')}
+            qs = qs.filter(kind__in=wanted & set(DocumentKind.values))
+        return qs
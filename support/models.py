@@ -2,7 +2,7 @@
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 
 
 class SupportAudience(models.TextChoices):
@@ -1,5 +1,4 @@
 # uploadmedia/diag.py
-import requests
 from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -9,6 +8,8 @@ class CloudflareDiag(APIView):
     permission_classes = []
 
     def get(self, request):
+        import requests  # diagnostics only; keep it off the startup path
+
         token = settings.CF_STREAM_TOKEN
         acct  = settings.CF_ACCOUNT_ID
         ok_token = bool(token and len(token) > 20)
@@ -2,13 +2,14 @@
 import os, re, tempfile
 from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
-import requests
 
 CF_UPLOAD_HOST = "upload.cloudflarestream.com"
 CF_UPLOAD_RE = re.compile(rf"^https://{CF_UPLOAD_HOST}/[A-Za-z0-9]+$")
 
 @csrf_exempt
 def proxy_direct_upload(request):
+    import requests  # only this view needs it; keep it off the startup path
+
     if request.method != "POST":
         return JsonResponse({"detail": "Method not allowed"}, status=405)
 
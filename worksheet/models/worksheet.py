@@ -1,7 +1,7 @@
 # worksheet/models/worksheet.py
 from django.db import models
 from django.conf import settings
-from common.mixins import SlugModelMixin
+from common.models import SlugModelMixin
 from .base import WorksheetAudience, WorksheetFormat
 from .upload_paths import worksheet_file_upload_path
 
@@ -54,7 +54,9 @@ class Worksheet(SlugModelMixin, models.Model):
 
     @property
     def total_submissions(self):
-        return self.submissions.count()
+        # WorksheetViewSet annotates `submission_count`; COUNT per row otherwise.
+        count = getattr(self, 'submission_count', None)
+        return self.submissions.count() if count is None else count
 
     def __str__(self):
         return f"{self.title} ({self.lesson.title})"
@@ -3,12 +3,12 @@
 from rest_framework import serializers
 from worksheet.models import WorksheetSubmission
 from worksheet.models.base import SubmissionStatus
-from worksheet.serializers.base import TimestampedSerializerMixin, ChoiceDisplayField
+from worksheet.serializers.base import ChoiceDisplayField, ChoiceDisplaySerializerMixin
 from core.serializers import UserSerializer
 from worksheet.serializers.worksheet import WorksheetSerializer, WorksheetStaffSerializer
 
 
-class WorksheetSubmissionSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
+class WorksheetSubmissionSerializer(ChoiceDisplaySerializerMixin, serializers.ModelSerializer):
     """
     Public-facing read-only serializer for student submissions.
     """
@@ -29,7 +29,6 @@ class WorksheetSubmissionSerializer(TimestampedSerializerMixin, serializers.Mode
             'submitted_at', 'submitted_since', 'is_late',
             'status', 'status_display',
             'score', 'feedback', 'reviewed_by', 'reviewed_at',
-            'created_at'
         ]
         read_only_fields = fields
 
@@ -39,7 +38,7 @@ class WorksheetSubmissionSerializer(TimestampedSerializerMixin, serializers.Mode
 
 
 
-class WorksheetSubmissionStaffSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
+class WorksheetSubmissionStaffSerializer(ChoiceDisplaySerializerMixin, serializers.ModelSerializer):
     """
     Serializer for internal staff views — includes worksheet and review details.
     """
@@ -55,7 +54,7 @@ class WorksheetSubmissionStaffSerializer(TimestampedSerializerMixin, serializers
         fields = [
             'id', 'worksheet', 'user', 'submitted_file', 'written_response',
             'submitted_at', 'status', 'status_display', 'is_late',
-            'score', 'feedback', 'reviewed_by', 'reviewed_at', 'created_at'
+            'score', 'feedback', 'reviewed_by', 'reviewed_at',
         ]
 
 
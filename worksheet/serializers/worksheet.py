@@ -2,7 +2,7 @@
 
 from rest_framework import serializers
 from worksheet.models import Worksheet
-from worksheet.serializers.base import TimestampedSerializerMixin, ChoiceDisplayField
+from worksheet.serializers.base import TimestampedSerializerMixin, ChoiceDisplayField, ChoiceDisplaySerializerMixin
 from worksheet.models.base import WorksheetAudience, WorksheetFormat
 from core.serializers import UserSerializer
 from classes.serializers.lesson import LessonSerializer, LessonSummarySerializer
@@ -10,7 +10,7 @@ from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
-class WorksheetSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
+class WorksheetSerializer(TimestampedSerializerMixin, ChoiceDisplaySerializerMixin, serializers.ModelSerializer):
     """
     Lightweight read serializer for students or public views.
     Shows summary lesson info and uploader name.
@@ -34,7 +34,7 @@ class WorksheetSerializer(TimestampedSerializerMixin, serializers.ModelSerialize
         ]
         read_only_fields = ['slug', 'created_at', 'total_submissions']
 
-class WorksheetStaffSerializer(TimestampedSerializerMixin, serializers.ModelSerializer):
+class WorksheetStaffSerializer(TimestampedSerializerMixin, ChoiceDisplaySerializerMixin, serializers.ModelSerializer):
     """
     Full read serializer for internal use: includes lesson & uploader details.
     """
@@ -0,0 +1,47 @@
+# worksheet/tests/test_submission_list.py
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from worksheet.models.base import SubmissionStatus
+
+
+def _submissions(worksheet):
+    return f"/api/worksheet/worksheets/{worksheet.slug}/submissions/"
+
+
+def _list(user, worksheet):
+    client = APIClient()
+    client.force_authenticate(user)
+    response = client.get(_submissions(worksheet))
+    assert response.status_code == 200
+    return response.json()["results"]
+
+
+@pytest.mark.django_db
+def test_staff_list_renders_the_staff_submission_serializer():
+    lecturer = baker.make("core.User", role="LECTURER")
+    worksheet = baker.make("worksheet.Worksheet", uploaded_by=lecturer, is_active=True)
+    baker.make("worksheet.WorksheetSubmission", worksheet=worksheet, _quantity=2, status=SubmissionStatus.REVIEWED)
+
+    results = _list(lecturer, worksheet)
+
+    assert len(results) == 2
+    assert {r["status_display"] for r in results} == {SubmissionStatus.REVIEWED.label}
+    assert results[0]["worksheet"]["lesson"]["id"] == worksheet.lesson_id
+    assert results[0]["worksheet"]["total_submissions"] == 2
+    assert "audience_display" in results[0]["worksheet"]
+
+
+@pytest.mark.django_db
+def test_students_list_only_their_own_submissions():
+    worksheet = baker.make("worksheet.Worksheet", is_active=True)
+    student = baker.make("core.User", role="PARTNER")
+    own = baker.make("worksheet.WorksheetSubmission", worksheet=worksheet, user=student)
+    baker.make("worksheet.WorksheetSubmission", worksheet=worksheet)
+
+    results = _list(student, worksheet)
+
+    assert [r["id"] for r in results] == [own.pk]
+    assert results[0]["title"] == worksheet.title
+    assert results[0]["worksheet"]["total_submissions"] == 2
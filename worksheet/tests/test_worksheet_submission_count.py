@@ -0,0 +1,32 @@
+# worksheet/tests/test_worksheet_submission_count.py
+import pytest
+from model_bakery import baker
+
+from worksheet.views.worksheet import WorksheetViewSet
+
+
+def _submit(worksheet, times):
+    for _ in range(times):
+        student = baker.make("core.User", role="LECTURER")
+        baker.make("worksheet.WorksheetSubmission", worksheet=worksheet, user=student)
+
+
+@pytest.mark.django_db
+def test_total_submissions_comes_from_the_viewset_annotation(django_assert_num_queries):
+    lecturer = baker.make("core.User", role="LECTURER")
+    worksheets = baker.make("worksheet.Worksheet", uploaded_by=lecturer, is_active=True, _quantity=3)
+    for worksheet, times in zip(worksheets, (0, 1, 3)):
+        _submit(worksheet, times)
+
+    with django_assert_num_queries(1):
+        counts = {w.pk: w.total_submissions for w in WorksheetViewSet.queryset.all()}
+
+    assert counts == {worksheets[0].pk: 0, worksheets[1].pk: 1, worksheets[2].pk: 3}
+
+
+@pytest.mark.django_db
+def test_total_submissions_falls_back_to_count_without_annotation():
+    worksheet = baker.make("worksheet.Worksheet", uploaded_by=baker.make("core.User", role="LECTURER"))
+    _submit(worksheet, 2)
+
+    assert worksheet.total_submissions == 2
@@ -1,6 +1,7 @@
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from django.db.models import Count, Prefetch
 from django.shortcuts import get_object_or_404
 
 from worksheet.models import WorksheetSubmission, Worksheet
@@ -9,8 +10,9 @@ from worksheet.serializers import (
     WorksheetSubmissionCreateSerializer,
     WorksheetSubmissionReviewSerializer,
 )
-from worksheet.serializers.worksheet import WorksheetStaffSerializer
+from worksheet.serializers.submission import WorksheetSubmissionStaffSerializer
 from common.permissions import IsLecturerOrVolunteer
+from common.pagination import SubmittedAtCursorPagination
 
 
 class WorksheetSubmissionViewSet(viewsets.ModelViewSet):
@@ -20,12 +22,18 @@ class WorksheetSubmissionViewSet(viewsets.ModelViewSet):
     - Students can create/view their own submissions
     - Lecturers/Volunteers can view and review all
     """
-    queryset = WorksheetSubmission.objects.select_related('worksheet', 'user', 'reviewed_by')
+    # The nested worksheet serializers read the lesson, the uploader and Worksheet.total_submissions
+    queryset = WorksheetSubmission.objects.select_related('user', 'reviewed_by').prefetch_related(
+        Prefetch('worksheet', queryset=Worksheet.objects.select_related(
+            'lesson__program_level', 'lesson__module', 'lesson__session', 'uploaded_by',
+        ).annotate(submission_count=Count('submissions'))),
+    )
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [filters.OrderingFilter, filters.SearchFilter]
     ordering_fields = ['submitted_at', 'score']
     search_fields = ['worksheet__title', 'user__email']
     ordering = ['-submitted_at']
+    pagination_class = SubmittedAtCursorPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -47,7 +55,7 @@ class WorksheetSubmissionViewSet(viewsets.ModelViewSet):
         elif self.action in ['review', 'partial_update', 'update']:
             return WorksheetSubmissionReviewSerializer
         elif self.request.user.is_staff or self.request.user.role in ['LECTURER', 'VOLUNTEER', 'GUEST']:
-            return WorksheetStaffSerializer
+            return WorksheetSubmissionStaffSerializer
         return WorksheetSubmissionSerializer
 
     def perform_create(self, serializer):
@@ -1,5 +1,6 @@
 # worksheet/views/worksheet.py
 
+from django.db.models import Count
 from rest_framework import viewsets, filters
 from worksheet.models import Worksheet
 from worksheet.serializers import (
@@ -17,7 +18,11 @@ class WorksheetViewSet(viewsets.ModelViewSet):
     - Filters based on user role & audience
     - Staff and uploader can write
     """
-    queryset = Worksheet.objects.filter(is_active=True).select_related('lesson', 'uploaded_by')
+    queryset = (
+        Worksheet.objects.filter(is_active=True)
+        .select_related('lesson', 'uploaded_by')
+        .annotate(submission_count=Count('submissions'))
+    )
     permission_classes = [IsLecturerOrVolunteerOrReadOnly]
     lookup_field = 'slug'
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]